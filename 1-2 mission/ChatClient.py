@@ -1,6 +1,8 @@
 import socket
 import threading
 
+from chat_protocol import FrameBuffer, FrameError, encode_frame
+
 
 class ChatClient:
     def __init__(self, host='127.0.0.1', port=5000):
@@ -52,18 +54,21 @@ class ChatClient:
         서버로부터 메시지를 지속적으로 수신하는 메서드
         - 별도 쓰레드에서 실행되어 사용자 입력과 동시에 처리됨
         - 다른 사용자의 메시지, 입장/퇴장 알림, 귓속말 등을 실시간으로 받음
+        - 길이 헤더로 메시지 경계를 구분하므로 메시지가 나뉘거나 합쳐져 도착해도 안전함
         """
+        buffer = FrameBuffer()  # 재사용하는 수신 버퍼
         while self.connected:
             try:
-                data = self.sock.recv(1024)  # 서버로부터 데이터 수신
+                received = self.sock.recv_into(buffer.writable())  # 버퍼에 바로 수신
                 
-                if not data:  # 서버 연결이 끊어진 경우
+                if not received:  # 서버 연결이 끊어진 경우
                     break
                     
-                message = data.decode('utf-8')  # 바이트를 문자열로 변환
-                print(message, end='')  # 받은 메시지 화면에 출력
+                buffer.commit(received)
+                for message in buffer.frames():  # 완성된 메시지만 꺼냄
+                    print(message)  # 받은 메시지 화면에 출력
                 
-            except:
+            except (OSError, FrameError):
                 break  # 네트워크 오류시 루프 종료
                 
         self.connected = False
@@ -72,11 +77,11 @@ class ChatClient:
         """
         서버에 메시지 전송
         - 사용자가 입력한 텍스트를 서버로 보냄
-        - 일반 채팅, 귓속말(/귓), 종료(/종료) 모두 이 메서드 사용
+        - 일반 채팅, 귓속말(/귓), 방 이동(/방), 종료(/종료) 모두 이 메서드 사용
         """
         try:
-            self.sock.sendall((message + '\n').encode('utf-8'))
-        except:
+            self.sock.sendall(encode_frame(message))
+        except (OSError, FrameError):
             self.connected = False  # 전송 실패시 연결 상태 업데이트
 
     def disconnect(self):
@@ -0,0 +1,264 @@
+"""
+채팅 서버 부하 생성기 / 지연 시간 벤치마크
+
+socket-server.py를 실행한 뒤 asyncio로 가상 클라이언트 수천 개를 접속시키고,
+일부 클라이언트가 일정한 속도로 메시지를 보내는 동안 다음을 측정합니다.
+
+- 방송 지연 시간: 보낸 시각 -> 다른 클라이언트가 받은 시각 (p50 / p99 / 최대)
+- 처리량: 초당 보낸 메시지 수, 초당 전달된 메시지 수
+- 서버 메모리: 접속 전후 RSS 차이를 접속 수로 나눈 접속당 메모리 (Linux /proc)
+
+클라이언트는 ChatClient와 같은 chat_protocol 프레임과 FrameBuffer를 사용합니다.
+결과는 JSON으로 출력하거나 --output 파일에 저장하여 성능 회귀를 비교할 수 있습니다.
+
+실행 방법: python bench_chat.py [--clients 1000] [--senders 10] [--rate 10] [--duration 10] [--workers 1]
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from array import array
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from chat_protocol import FrameBuffer, encode_frame
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# 지연 시간 측정용 메시지 표시 (뒤에 보낸 시각(ns)을 붙임)
+MARKER = ' LT:'
+
+
+def percentile(values, ratio):
+    """정렬된 리스트에서 백분위 값을 구합니다."""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(len(values) * ratio))
+    return values[index]
+
+
+class LoadClient(asyncio.BufferedProtocol):
+    """
+    가상 채팅 클라이언트 하나
+
+    BufferedProtocol을 사용하여 FrameBuffer에 바로 수신하고,
+    받은 메시지 중 측정용 메시지의 지연 시간을 기록합니다.
+    """
+
+    def __init__(self, stats):
+        self.stats = stats
+        self.buffer = FrameBuffer(4096)
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def get_buffer(self, sizehint):
+        return self.buffer.writable()
+
+    def buffer_updated(self, nbytes):
+        self.buffer.commit(nbytes)
+        now = time.perf_counter_ns()
+        for message in self.buffer.frames():
+            index = message.find(MARKER)
+            if index >= 0:
+                self.stats.latencies.append((now - int(message[index + len(MARKER):])) / 1e6)
+
+    def send(self, text):
+        self.transport.write(encode_frame(text))
+
+    def close(self):
+        if self.transport is not None:
+            self.transport.close()
+
+
+class Stats:
+    """전체 클라이언트가 함께 쓰는 측정 값"""
+
+    def __init__(self):
+        # 받은 측정용 메시지의 지연 시간(ms)
+        self.latencies = array('d')
+        self.sent = 0
+
+
+async def connect_clients(host, port, count, stats, concurrency=200):
+    """클라이언트 count개를 접속시키고 이름을 보냅니다."""
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(concurrency)
+    clients = []
+
+    async def connect(index):
+        async with limit:
+            _, client = await loop.create_connection(lambda: LoadClient(stats), host, port)
+            client.send(f'bench{index}')
+            clients.append(client)
+
+    await asyncio.gather(*(connect(index) for index in range(count)))
+    return clients
+
+
+async def send_loop(client, rate, deadline, stats):
+    """초당 rate개의 측정용 메시지를 deadline까지 보냅니다."""
+    interval = 1.0 / rate
+    next_send = time.perf_counter()
+    while True:
+        now = time.perf_counter()
+        if now >= deadline:
+            break
+        if now < next_send:
+            await asyncio.sleep(next_send - now)
+        client.send(f'load{MARKER}{time.perf_counter_ns()}')
+        stats.sent += 1
+        next_send += interval
+
+
+async def run_load(host, port, clients_count, senders, rate, duration, server_pid=None):
+    stats = Stats()
+    rss_before = process_tree_rss(server_pid)
+
+    started = time.perf_counter()
+    clients = await connect_clients(host, port, clients_count, stats)
+    connect_seconds = time.perf_counter() - started
+    # 입장 알림이 모두 전달될 때까지 잠시 대기
+    await asyncio.sleep(1.0)
+    rss_after = process_tree_rss(server_pid)
+
+    stats.latencies = array('d')
+    deadline = time.perf_counter() + duration
+    started = time.perf_counter()
+    await asyncio.gather(*(send_loop(client, rate, deadline, stats) for client in clients[:senders]))
+    # 보낸 메시지가 모두 도착할 때까지 기다림
+    expected = stats.sent * clients_count
+    drain_deadline = time.perf_counter() + 10
+    while len(stats.latencies) < expected and time.perf_counter() < drain_deadline:
+        await asyncio.sleep(0.05)
+    elapsed = time.perf_counter() - started
+
+    for client in clients:
+        client.close()
+
+    latencies = sorted(stats.latencies)
+    memory_per_connection = None
+    if rss_before is not None and rss_after is not None:
+        memory_per_connection = (rss_after - rss_before) / clients_count
+    return {
+        'connections': clients_count,
+        'connect_seconds': round(connect_seconds, 3),
+        'senders': senders,
+        'sent': stats.sent,
+        'delivered': len(latencies),
+        'expected': expected,
+        'sent_per_sec': round(stats.sent / duration, 1),
+        'delivered_per_sec': round(len(latencies) / elapsed, 1),
+        'latency_ms': {
+            'p50': round(percentile(latencies, 0.50), 3),
+            'p99': round(percentile(latencies, 0.99), 3),
+            'max': round(latencies[-1], 3) if latencies else 0.0,
+        },
+        'server_rss_before': rss_before,
+        'server_rss_after': rss_after,
+        'server_bytes_per_connection': round(memory_per_connection) if memory_per_connection is not None else None,
+    }
+
+
+def process_tree_rss(pid):
+    """프로세스와 자식 프로세스(워커)의 RSS 합계(바이트). /proc이 없으면 None"""
+    if pid is None or not os.path.exists(f'/proc/{pid}'):
+        return None
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f'/proc/{current}/status') as status:
+                for line in status:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1]) * 1024
+                        break
+            with open(f'/proc/{current}/task/{current}/children') as children:
+                pending.extend(int(child) for child in children.read().split())
+        except OSError:
+            continue
+    return total
+
+
+def wait_for_port(port, timeout=10.0):
+    """서버가 포트를 열 때까지 기다립니다."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.2):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f'서버가 포트 {port}에서 시작되지 않았습니다.')
+
+
+def raise_open_file_limit():
+    """가상 클라이언트 수천 개를 열 수 있도록 파일 수 제한을 최대로 올립니다."""
+    if resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='채팅 서버 부하 생성기')
+    parser.add_argument('--clients', type=int, default=1000, help='동시 접속 클라이언트 수')
+    parser.add_argument('--senders', type=int, default=10, help='메시지를 보내는 클라이언트 수')
+    parser.add_argument('--rate', type=float, default=10, help='보내는 클라이언트 하나의 초당 메시지 수')
+    parser.add_argument('--duration', type=float, default=10.0, help='측정 시간(초)')
+    parser.add_argument('--workers', type=int, default=1, help='서버 워커 프로세스 수')
+    parser.add_argument('--port', type=int, default=15500)
+    parser.add_argument('--host', help='이미 실행 중인 서버 주소 (지정하면 서버를 띄우지 않음)')
+    parser.add_argument('--output', help='결과 JSON을 저장할 파일 (없으면 표준 출력)')
+    args = parser.parse_args()
+
+    raise_open_file_limit()
+    server = None
+    host = args.host or '127.0.0.1'
+    if args.host is None:
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(HERE, 'socket-server.py'),
+             '--port', str(args.port), '--workers', str(args.workers), '--host', '127.0.0.1'],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+    try:
+        wait_for_port(args.port)
+        result = asyncio.run(run_load(
+            host, args.port, args.clients, min(args.senders, args.clients), args.rate, args.duration,
+            server.pid if server is not None else None
+        ))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    result = {
+        'config': {
+            'clients': args.clients,
+            'senders': args.senders,
+            'rate': args.rate,
+            'duration': args.duration,
+            'workers': args.workers,
+        },
+        **result,
+    }
+    report = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(report + '\n')
+    print(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,303 @@
+"""
+채팅 서버 워커 프로세스 사이의 로컬 pub/sub 버스
+
+여러 워커 프로세스가 각자 클라이언트를 받고, 방(room) 메시지는 이 버스를 거쳐
+같은 방에 참여자가 있는 다른 워커에게만 전달됩니다.
+워커는 자기 프로세스에 연결된 참여자에게만 방송하므로 방송 비용이 워커 수만큼 나뉩니다.
+
+버스는 Unix 소켓 위에서 chat_protocol의 프레임을 그대로 사용하며,
+본문은 탭으로 구분한 명령입니다.
+
+    S<TAB>방                                방 구독 (워커에 이 방 참여자가 생김)
+    U<TAB>방                                방 구독 해제 (워커에 이 방 참여자가 없어짐)
+    P<TAB>방<TAB>내용                        방 메시지 발행
+    J<TAB>이름                              사용자 이름 예약 요청 (사용자 접속)
+    A<TAB>이름                              예약된 이름 (중계기 -> 요청한 워커, J를 보낸 순서대로 응답)
+    L<TAB>이름                              이름 반납 (사용자 접속 종료)
+    W<TAB>보낸사람<TAB>받는사람<TAB>내용      귓속말 (받는 사람 이름을 예약한 워커 하나에만 전달)
+    R<TAB>보낸사람<TAB>1|0<TAB>받는사람<TAB>내용  귓속말 결과 (중계기 -> 보낸 워커, 1: 전달함, 0: 받는 사람 없음)
+    h<TAB>방<TAB>내용                        방의 최근 메시지 하나 (중계기 -> 구독한 워커, S에 대한 응답)
+    H<TAB>방                                최근 메시지 전송 끝
+
+중계기는 방마다 최근 메시지를 원형 버퍼에 보관하고(오래 쓰지 않은 방부터 max_history_rooms개까지),
+워커가 방을 구독하면 h/H로 보내 줍니다. 그래서 그 방에 참여자가 없던 워커도
+새로 들어온 사용자에게 다른 워커에서 오간 대화를 보여줄 수 있고,
+워커는 참여자가 모두 나간 방의 구독을 해제해도 됩니다.
+
+사용자 이름은 중계기가 클러스터 전체에서 하나만 있도록 정합니다. 이미 다른 워커(또는 같은 워커)에서
+사용 중인 이름이면 뒤에 번호를 붙인 이름(kim(2))을 A로 돌려주므로, 귓속말은 항상 한 사람에게만 갑니다.
+
+중계기는 워커에 쓴 데이터가 쌓이면 drain()으로 기다리고,
+BUS_DRAIN_TIMEOUT초 안에 비워지지 않는 워커는 연결을 끊습니다 (한 워커가 버스 전체를 막지 않도록).
+"""
+import asyncio
+from collections import OrderedDict, deque
+
+from chat_history import RingBuffer
+from chat_protocol import FrameError, encode_frame, read_frame
+
+# 워커 연결의 송신 버퍼가 비워지기를 기다리는 최대 시간(초)
+BUS_DRAIN_TIMEOUT = 5.0
+
+
+class BusBroker:
+    """워커들의 구독 정보를 보관하고 메시지를 필요한 워커에게만 전달하는 중계기"""
+
+    def __init__(self, drain_timeout=BUS_DRAIN_TIMEOUT, history_size=50, max_history_rooms=1000):
+        # 방 이름 -> 구독 중인 워커 연결(StreamWriter) 집합
+        self.subscriptions = {}
+        # 사용자 이름 -> 그 이름을 예약한 워커 연결 (이름은 클러스터 전체에서 하나)
+        self.users = {}
+        self.workers = set()
+        self.drain_timeout = drain_timeout
+        self.history_size = history_size
+        self.max_history_rooms = max_history_rooms
+        # 방 이름 -> 최근 메시지 RingBuffer (최근에 사용한 방이 뒤쪽)
+        self.histories = OrderedDict()
+
+    async def handle_worker(self, reader, writer):
+        """워커 하나의 연결 처리"""
+        self.workers.add(writer)
+        try:
+            while True:
+                try:
+                    command = await read_frame(reader)
+                except (ConnectionError, FrameError, asyncio.CancelledError):
+                    # 연결 오류 또는 종료 시 취소
+                    break
+                if command is None:
+                    break
+                await self.dispatch(writer, command)
+        finally:
+            self.workers.discard(writer)
+            for room in [room for room, writers in self.subscriptions.items() if writer in writers]:
+                self._remove(self.subscriptions, room, writer)
+            for name in [name for name, owner in self.users.items() if owner is writer]:
+                del self.users[name]
+            writer.close()
+
+    async def dispatch(self, source, command):
+        kind, _, rest = command.partition('\t')
+        if kind == 'S':
+            self.subscriptions.setdefault(rest, set()).add(source)
+            await self.send_history(source, rest)
+        elif kind == 'U':
+            self._remove(self.subscriptions, rest, source)
+        elif kind == 'J':
+            name = self.unique_name(rest)
+            self.users[name] = source
+            await self.forward((source,), None, f'A\t{name}')
+        elif kind == 'L':
+            if self.users.get(rest) is source:
+                del self.users[rest]
+        elif kind == 'P':
+            room, _, text = rest.partition('\t')
+            self.remember(room, text)
+            await self.forward(self.subscriptions.get(room, ()), source, command)
+        elif kind == 'W':
+            sender, _, rest = rest.partition('\t')
+            name, _, text = rest.partition('\t')
+            # 이름마다 워커가 하나뿐이므로 받는 사람 한 명에게만 전달
+            # (보낸 워커 자신이면 그 워커에서 이미 찾지 못한 사람이므로 방금 나간 사용자)
+            target = self.users.get(name)
+            found = target is not None and target is not source
+            if found:
+                await self.forward((target,), source, command)
+            # 받는 사람을 찾았는지 보낸 워커에 알려줌
+            await self.forward((source,), None, f'R\t{sender}\t{"1" if found else "0"}\t{name}\t{text}')
+
+    def unique_name(self, name):
+        """클러스터 전체에서 사용 중인 이름이면 뒤에 번호를 붙입니다."""
+        if name not in self.users:
+            return name
+        number = 2
+        while f'{name}({number})' in self.users:
+            number += 1
+        return f'{name}({number})'
+
+    def remember(self, room, text):
+        """방의 최근 메시지로 보관합니다."""
+        if not self.history_size:
+            return
+        history = self.histories.get(room)
+        if history is None:
+            history = self.histories[room] = RingBuffer(self.history_size)
+            if len(self.histories) > self.max_history_rooms:
+                # 오래 사용하지 않은 방부터 기록을 버림 (구독 중인 방은 유지)
+                for old_room in self.histories:
+                    if old_room not in self.subscriptions:
+                        del self.histories[old_room]
+                        break
+        else:
+            self.histories.move_to_end(room)
+        history.append(text)
+
+    async def send_history(self, writer, room):
+        """방의 최근 메시지를 h 명령으로 보내고 H로 끝을 알립니다."""
+        history = self.histories.get(room)
+        texts = history.last(len(history)) if history is not None else []
+        data = b''.join(encode_frame(f'h\t{room}\t{text}') for text in texts)
+        writer.write(data + encode_frame(f'H\t{room}'))
+        await self._drain((writer,))
+
+    @staticmethod
+    def _remove(table, key, writer):
+        writers = table.get(key)
+        if writers is not None:
+            writers.discard(writer)
+            if not writers:
+                del table[key]
+
+    async def forward(self, targets, source, command):
+        """
+        보낸 워커를 제외한 대상 워커들에게 전달 (인코딩은 한 번만 수행)
+
+        송신 버퍼가 쌓인 워커는 drain_timeout초까지 기다리고, 그래도 비워지지 않으면 연결을 끊습니다.
+        """
+        data = None
+        written = []
+        for writer in targets:
+            if writer is source or writer.is_closing():
+                continue
+            if data is None:
+                data = encode_frame(command)
+            writer.write(data)
+            written.append(writer)
+        if written:
+            await self._drain(written)
+
+    async def _drain(self, writers):
+        results = await asyncio.gather(
+            *(asyncio.wait_for(writer.drain(), self.drain_timeout) for writer in writers),
+            return_exceptions=True
+        )
+        for writer, result in zip(writers, results):
+            if isinstance(result, (asyncio.TimeoutError, ConnectionError)):
+                # 메시지를 받아 가지 못하는 워커: 연결을 끊으면 handle_worker가 구독 정보를 정리
+                writer.transport.abort()
+
+
+class BusClient:
+    """
+    워커 프로세스에서 버스에 연결하는 클라이언트
+
+    다른 워커에서 온 메시지는 on_room_message(방, 내용), on_whisper(보낸사람, 받는사람, 내용) 콜백으로,
+    이 워커에서 보낸 귓속말의 결과는 on_whisper_result(보낸사람, 전달 여부, 받는사람, 내용) 콜백으로 전달됩니다.
+    구독 응답(h/H)으로 받은 방의 최근 메시지는 H를 받는 즉시 on_history(방, 내용 목록)로 전달되므로
+    그 방의 P 메시지와 받은 순서가 바뀌지 않습니다 (on_history 다음에 그 뒤의 on_room_message가 호출됨).
+    사용자 이름은 join()으로 중계기에 예약합니다.
+    """
+
+    def __init__(self, path, on_room_message, on_whisper, on_whisper_result, on_history=None):
+        self.path = path
+        self.on_room_message = on_room_message
+        self.on_whisper = on_whisper
+        self.on_whisper_result = on_whisper_result
+        self.on_history = on_history
+        self.writer = None
+        self._reader_task = None
+        # 구독 응답(h/H)을 기다리는 방 -> (받은 메시지 목록, Future)
+        self._history_requests = {}
+        # 이름 예약 응답(A)을 기다리는 Future (중계기는 J를 받은 순서대로 응답)
+        self._join_requests = deque()
+
+    async def connect(self):
+        reader, self.writer = await asyncio.open_unix_connection(self.path)
+        self._reader_task = asyncio.create_task(self._read_loop(reader))
+
+    async def _read_loop(self, reader):
+        while True:
+            try:
+                command = await read_frame(reader)
+            except (ConnectionError, FrameError):
+                break
+            if command is None:
+                break
+            kind, _, rest = command.partition('\t')
+            if kind == 'P':
+                room, _, text = rest.partition('\t')
+                self.on_room_message(room, text)
+            elif kind == 'W':
+                sender, name, text = rest.split('\t', 2)
+                self.on_whisper(sender, name, text)
+            elif kind == 'A':
+                if self._join_requests:
+                    future = self._join_requests.popleft()
+                    if not future.done():
+                        future.set_result(rest)
+            elif kind == 'R':
+                sender, found, name, text = rest.split('\t', 3)
+                self.on_whisper_result(sender, found == '1', name, text)
+            elif kind == 'h':
+                room, _, text = rest.partition('\t')
+                request = self._history_requests.get(room)
+                if request is not None:
+                    request[0].append(text)
+            elif kind == 'H':
+                request = self._history_requests.pop(rest, None)
+                if request is not None:
+                    # 다음 프레임을 처리하기 전에 기록을 반영 (구독한 태스크가 깨어나는 것을 기다리지 않음)
+                    if self.on_history is not None:
+                        self.on_history(rest, request[0])
+                    if not request[1].done():
+                        request[1].set_result(request[0])
+        # 버스 연결이 끊기면 기다리던 구독 응답은 빈 기록으로, 이름 예약은 None으로 끝냄
+        for texts, future in self._history_requests.values():
+            if not future.done():
+                future.set_result([])
+        self._history_requests.clear()
+        for future in self._join_requests:
+            if not future.done():
+                future.set_result(None)
+        self._join_requests.clear()
+
+    async def subscribe(self, room):
+        """
+        방을 구독하고 중계기가 보관 중인 최근 메시지 목록을 반환합니다.
+        (응답을 기다리는 동안 같은 방의 메시지는 응답 뒤에 도착함,
+        on_history가 있으면 반환되기 전에 이미 받은 순서대로 전달되어 있음)
+        """
+        request = self._history_requests.get(room)
+        if request is None:
+            request = self._history_requests[room] = ([], asyncio.get_running_loop().create_future())
+            self._send(f'S\t{room}')
+        if self.writer is None or self.writer.is_closing():
+            self._history_requests.pop(room, None)
+            return []
+        return await asyncio.shield(request[1])
+
+    def unsubscribe(self, room):
+        self._send(f'U\t{room}')
+
+    def publish(self, room, text):
+        self._send(f'P\t{room}\t{text}')
+
+    async def join(self, name):
+        """
+        사용자 이름을 예약하고 중계기가 정한 이름을 반환합니다 (사용 중이면 번호가 붙은 이름).
+        버스 연결이 끊겨 있으면 None을 반환합니다.
+        """
+        if self.writer is None or self.writer.is_closing():
+            return None
+        future = asyncio.get_running_loop().create_future()
+        self._join_requests.append(future)
+        self._send(f'J\t{name}')
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # 기다리다 취소되어도 응답 순서는 유지해야 하므로 Future는 남겨 두고, 예약된 이름은 반납
+            def release(done):
+                if done.result() is not None:
+                    self.leave(done.result())
+            future.add_done_callback(release)
+            raise
+
+    def leave(self, name):
+        self._send(f'L\t{name}')
+
+    def whisper(self, sender, name, text):
+        self._send(f'W\t{sender}\t{name}\t{text}')
+
+    def _send(self, command):
+        if self.writer is not None and not self.writer.is_closing():
+            self.writer.write(encode_frame(command))
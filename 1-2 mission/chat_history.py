@@ -0,0 +1,155 @@
+"""
+방별 최근 대화 기록
+
+- RingBuffer: 미리 크기를 잡아 둔 고정 길이 버퍼에 최근 메시지를 보관
+  (가장 오래된 메시지를 덮어쓰므로 메모리가 늘어나지 않음)
+- AppendOnlyLog: 디스크에 메시지를 이어 붙이기만 하는 로그 파일
+  메시지 시작 위치를 배열로 보관하고 mmap으로 읽어 마지막 k개를 O(k)로 가져옴
+
+메시지는 chat_protocol로 인코딩된 프레임(bytes) 그대로 저장하므로
+새로 들어온 사용자에게 다시 인코딩하지 않고 바로 보낼 수 있습니다.
+"""
+import hashlib
+import mmap
+import os
+from array import array
+
+from chat_protocol import HEADER
+
+
+class RingBuffer:
+    """최근 capacity개 항목만 보관하는 원형 버퍼"""
+
+    __slots__ = ('_items', '_next', '_count')
+
+    def __init__(self, capacity):
+        self._items = [None] * capacity
+        self._next = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, item):
+        items = self._items
+        if not items:
+            return
+        items[self._next] = item
+        self._next = (self._next + 1) % len(items)
+        if self._count < len(items):
+            self._count += 1
+
+    def last(self, k):
+        """최근 k개를 오래된 순서로 반환합니다."""
+        k = min(k, self._count)
+        if k <= 0:
+            return []
+        start = (self._next - k) % len(self._items)
+        if start + k <= len(self._items):
+            return self._items[start:start + k]
+        return self._items[start:] + self._items[:self._next]
+
+
+class AppendOnlyLog:
+    """
+    프레임을 이어 붙이기만 하는 로그 파일
+
+    파일 형식은 chat_protocol 프레임을 연속으로 기록한 것과 같습니다.
+    메시지마다 시작 위치(8바이트)만 메모리에 보관합니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._offsets = array('Q')
+        self._size = self._scan()
+        # 파일은 쓰거나 읽을 때 열고, close() 후에도 다시 사용하면 다시 엶
+        self._file = None
+
+    def _open(self):
+        if self._file is None:
+            # mmap으로 읽을 수 있도록 읽기+추가 모드로 엶
+            self._file = open(self.path, 'a+b')
+        return self._file
+
+    def _scan(self):
+        """기존 로그를 읽어 메시지 시작 위치를 복원합니다. 마지막의 잘린 기록은 잘라냅니다."""
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return 0
+        with open(self.path, 'r+b') as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                end = len(view)
+                position = 0
+                while position + HEADER.size <= end:
+                    (length,) = HEADER.unpack_from(view, position)
+                    if position + HEADER.size + length > end:
+                        break
+                    self._offsets.append(position)
+                    position += HEADER.size + length
+            if position != end:
+                file.truncate(position)
+        return position
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def append(self, frame):
+        self._offsets.append(self._size)
+        self._open().write(frame)
+        self._size += len(frame)
+
+    def read_last(self, k):
+        """마지막 k개 메시지를 프레임이 이어진 bytes 하나로 반환합니다."""
+        k = min(k, len(self._offsets))
+        if k <= 0:
+            return b''
+        file = self._open()
+        file.flush()
+        start = self._offsets[-k]
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            return view[start:self._size]
+
+    def close(self):
+        """버퍼를 기록하고 파일을 닫습니다 (메시지 위치는 유지하므로 다시 사용할 수 있음)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class RoomHistory:
+    """방 하나의 대화 기록 (메모리 원형 버퍼 + 선택적인 디스크 로그)"""
+
+    def __init__(self, capacity, log_path=None):
+        self.capacity = capacity
+        self.recent = RingBuffer(capacity)
+        self.log = AppendOnlyLog(log_path) if log_path else None
+
+    def append(self, frame):
+        self.recent.append(frame)
+        if self.log is not None:
+            self.log.append(frame)
+
+    def replay(self, k, use_log=True):
+        """
+        마지막 k개 메시지를 보낼 수 있는 bytes로 반환합니다.
+        원형 버퍼에 있으면 메모리에서, 더 필요하면(use_log가 True일 때) 디스크 로그에서 읽습니다.
+        """
+        if k <= len(self.recent) or self.log is None or not use_log:
+            return b''.join(self.recent.last(k))
+        return self.log.read_last(k)
+
+    def reset_recent(self, frames):
+        """원형 버퍼를 주어진 최근 메시지로 교체합니다 (디스크 로그는 그대로)."""
+        self.recent = RingBuffer(self.capacity)
+        for frame in frames:
+            self.recent.append(frame)
+
+    def close(self):
+        """디스크 로그를 닫습니다. 이후 다시 기록하거나 읽으면 로그 파일을 다시 엽니다."""
+        if self.log is not None:
+            self.log.close()
+
+
+def room_log_path(directory, room):
+    """방 이름을 파일 이름으로 쓸 수 있도록 해시로 바꿉니다."""
+    digest = hashlib.sha1(room.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(directory, f'room-{digest}.log')
@@ -0,0 +1,118 @@
+"""
+채팅 클라이언트/서버 공용 메시지 프레이밍
+
+메시지 하나 = [4바이트 길이(빅엔디언)] + [UTF-8 본문]
+
+TCP는 경계가 없는 바이트 흐름이라 recv 한 번에 메시지가 나뉘거나 합쳐져 도착합니다.
+길이를 먼저 보내면 받는 쪽이 메시지 경계를 정확히 알 수 있고,
+본문을 다 받은 뒤 한 번에 디코딩하므로 한글(멀티바이트)이 중간에서 잘리지 않습니다.
+"""
+import asyncio
+import struct
+
+HEADER = struct.Struct('!I')
+
+# 메시지 하나의 최대 크기 (잘못된 길이로 메모리를 과하게 잡지 않도록 제한)
+MAX_FRAME_SIZE = 1024 * 1024
+
+
+class FrameError(ValueError):
+    """프레임 길이가 허용 범위를 벗어난 경우"""
+
+
+def encode_frame(text):
+    """문자열을 길이 헤더가 붙은 바이트로 변환합니다."""
+    payload = text.encode('utf-8')
+    if len(payload) > MAX_FRAME_SIZE:
+        raise FrameError(f'메시지가 너무 깁니다: {len(payload)}바이트')
+    return HEADER.pack(len(payload)) + payload
+
+
+async def read_frame(reader):
+    """
+    asyncio StreamReader에서 메시지 하나를 읽습니다.
+
+    Returns:
+        메시지 문자열, 연결이 끊기면 None
+    """
+    try:
+        header = await reader.readexactly(HEADER.size)
+        (length,) = HEADER.unpack(header)
+        if length > MAX_FRAME_SIZE:
+            raise FrameError(f'메시지가 너무 깁니다: {length}바이트')
+        payload = await reader.readexactly(length)
+    except asyncio.IncompleteReadError:
+        return None
+    return payload.decode('utf-8', errors='replace')
+
+
+class FrameBuffer:
+    """
+    재사용하는 수신 버퍼에서 프레임을 잘라내는 디코더
+
+    recv(1024)처럼 매번 새 bytes를 만들지 않고,
+    미리 잡아 둔 bytearray에 recv_into로 바로 받아 메시지 단위로 잘라냅니다.
+
+    사용법:
+        buffer = FrameBuffer()
+        n = sock.recv_into(buffer.writable())
+        buffer.commit(n)
+        for message in buffer.frames():
+            ...
+    """
+
+    def __init__(self, size=64 * 1024):
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+        # 아직 처리하지 않은 데이터 범위 [_start, _end)
+        self._start = 0
+        self._end = 0
+
+    def writable(self):
+        """다음 수신 데이터를 받을 빈 공간 (memoryview)"""
+        if self._end == len(self._buffer):
+            self._make_room()
+        return self._view[self._end:]
+
+    def commit(self, nbytes):
+        """writable()에 nbytes만큼 받았음을 기록합니다."""
+        self._end += nbytes
+
+    def frames(self):
+        """버퍼에 완성된 메시지를 차례로 꺼냅니다 (불완전한 메시지는 남겨 둠)."""
+        buffer = self._buffer
+        while self._end - self._start >= HEADER.size:
+            (length,) = HEADER.unpack_from(buffer, self._start)
+            if length > MAX_FRAME_SIZE:
+                raise FrameError(f'메시지가 너무 깁니다: {length}바이트')
+            begin = self._start + HEADER.size
+            if self._end - begin < length:
+                # 본문이 버퍼보다 크면 미리 늘려 둠
+                if HEADER.size + length > len(buffer):
+                    self._grow(HEADER.size + length)
+                    buffer = self._buffer
+                break
+            self._start = begin + length
+            yield str(self._view[begin:self._start], 'utf-8', 'replace')
+
+        if self._start == self._end:
+            # 모두 처리했으면 처음부터 다시 사용
+            self._start = self._end = 0
+
+    def _make_room(self):
+        """처리한 앞부분을 버리고 남은 데이터를 버퍼 앞으로 옮깁니다."""
+        remaining = self._end - self._start
+        if self._start == 0:
+            self._grow(len(self._buffer) * 2)
+            return
+        self._buffer[:remaining] = self._buffer[self._start:self._end]
+        self._start, self._end = 0, remaining
+
+    def _grow(self, size):
+        """버퍼 크기를 size 이상으로 늘립니다 (메시지가 버퍼보다 큰 경우)."""
+        remaining = self._end - self._start
+        new_buffer = bytearray(max(size, len(self._buffer)))
+        new_buffer[:remaining] = self._buffer[self._start:self._end]
+        self._buffer = new_buffer
+        self._view = memoryview(new_buffer)
+        self._start, self._end = 0, remaining
@@ -0,0 +1,209 @@
+"""여러 워커(ChatServer + chat_bus)로 동작할 때의 동작 확인 스크립트.
+
+한 프로세스 안에서 버스 중계기(BusBroker)와 워커 두 개(서로 다른 포트)를 띄우고
+실제 TCP 클라이언트로 다음을 확인합니다.
+- 이름: 다른 워커에 같은 이름으로 접속하면 번호가 붙은 이름을 받음, 나간 뒤에는 다시 사용 가능
+- 귓속말: 받는 사람 한 명에게만 전달되고, 없는 사람이면 안내를 받음
+- 기록 동기화: 중계기가 구독 응답(h/H) 바로 뒤에 같은 방의 메시지(P)를 한 번에 보내도
+  입장한 사용자는 이전 대화 → 새 메시지 순서로 받고, 새 메시지가 방 기록에서 빠지지 않음
+  (순서를 고정하려고 정해진 프레임을 보내는 가짜 중계기를 사용)
+
+실행 방법: python check_chat_cluster.py
+"""
+
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+
+from chat_bus import BusBroker
+from chat_protocol import encode_frame, read_frame
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# socket-server.py는 이름에 '-'가 있어 import 문으로 가져올 수 없음
+_spec = importlib.util.spec_from_file_location('socket_server', os.path.join(HERE, 'socket-server.py'))
+socket_server = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(socket_server)
+
+failures = []
+
+
+def check(name, condition, detail=''):
+    print(f'{"OK  " if condition else "FAIL"} {name}' + (f' ({detail})' if detail else ''))
+    if not condition:
+        failures.append(name)
+
+
+class TestClient:
+    """받은 메시지를 모아 두는 채팅 클라이언트"""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.received = []
+
+    @classmethod
+    async def connect(cls, port, name):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        client = cls(reader, writer)
+        client.send(name)
+        return client
+
+    def send(self, text):
+        self.writer.write(encode_frame(text))
+
+    async def collect(self, wait=0.2):
+        """wait초 동안 더 오는 메시지가 없을 때까지 받고, 이번에 받은 메시지 목록을 반환합니다."""
+        messages = []
+        while True:
+            try:
+                message = await asyncio.wait_for(read_frame(self.reader), wait)
+            except asyncio.TimeoutError:
+                break
+            if message is None:
+                break
+            messages.append(message)
+        self.received.extend(messages)
+        return messages
+
+    async def close(self):
+        self.send('/종료')
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def start_cluster(bus_path):
+    broker = BusBroker()
+    bus_server = await asyncio.start_unix_server(broker.handle_worker, bus_path)
+    workers = []
+    tasks = []
+    for _ in range(2):
+        worker = socket_server.ChatServer('127.0.0.1', 0, bus_path=bus_path)
+        workers.append(worker)
+        tasks.append(asyncio.create_task(worker.serve_forever()))
+    # 포트 0으로 띄웠으므로 실제 포트는 서버가 시작된 뒤에 알 수 있음
+    ports = []
+    for worker in workers:
+        while worker.port == 0:
+            await asyncio.sleep(0.01)
+        ports.append(worker.port)
+    return broker, bus_server, tasks, ports
+
+
+async def check_names_and_whispers(ports):
+    kim_a = await TestClient.connect(ports[0], 'kim')
+    await kim_a.collect()
+    kim_b = await TestClient.connect(ports[1], 'kim')
+    joined = await kim_b.collect()
+    check('이름: 다른 워커의 같은 이름은 번호가 붙음', 'kim(2)님이 입장하셨습니다.' in joined, repr(joined))
+
+    lee = await TestClient.connect(ports[1], 'lee')
+    await lee.collect()
+    await kim_a.collect()
+    await kim_b.collect()
+
+    lee.send('/귓 kim 안녕')
+    lee_got = await lee.collect()
+    kim_a_got = await kim_a.collect()
+    kim_b_got = await kim_b.collect()
+    check('귓속말: 다른 워커의 받는 사람에게 전달', '(귓속말) lee: 안녕' in kim_a_got, repr(kim_a_got))
+    check('귓속말: 같은 이름을 요청한 다른 사용자는 받지 않음',
+          not any('귓속말' in message for message in kim_b_got), repr(kim_b_got))
+    check('귓속말: 보낸 사람은 전달 확인을 받음', '(귓속말 → kim) 안녕' in lee_got, repr(lee_got))
+
+    kim_a.send('/귓 kim(2) 반가워')
+    await kim_a.collect()
+    kim_b_got = await kim_b.collect()
+    check('귓속말: 번호가 붙은 이름으로도 전달', '(귓속말) kim: 반가워' in kim_b_got, repr(kim_b_got))
+
+    await kim_a.close()
+    await lee.collect()
+    lee.send('/귓 kim 어디 갔어요')
+    lee_got = await lee.collect()
+    check('귓속말: 나간 사용자는 찾을 수 없음', 'kim님을 찾을 수 없습니다.' in lee_got, repr(lee_got))
+
+    kim_c = await TestClient.connect(ports[1], 'kim')
+    joined = await kim_c.collect()
+    check('이름: 나간 사용자의 이름은 다시 사용 가능', 'kim님이 입장하셨습니다.' in joined, repr(joined))
+
+    for client in (kim_b, lee, kim_c):
+        await client.close()
+
+
+async def scripted_broker(reader, writer):
+    """
+    이름 예약(J)은 그대로 허락하고, 구독(S)에는 이전 대화(h/H)와 새 메시지(P)를 한 번에 보내는 가짜 중계기
+    (워커의 수신 루프가 H 다음의 P를 처리한 뒤에야 입장 처리가 이어지는 상황을 만듦)
+    """
+    while True:
+        frame = await read_frame(reader)
+        if frame is None:
+            break
+        kind, _, rest = frame.partition('\t')
+        if kind == 'J':
+            writer.write(encode_frame(f'A\t{rest}'))
+        elif kind == 'S':
+            writer.write(b''.join([
+                encode_frame(f'h\t{rest}\t[old] 이전 대화 1'),
+                encode_frame(f'h\t{rest}\t[old] 이전 대화 2'),
+                encode_frame(f'H\t{rest}'),
+                encode_frame(f'P\t{rest}\t[new] 새 메시지'),
+            ]))
+    writer.close()
+
+
+async def check_history_sync(bus_path):
+    bus_server = await asyncio.start_unix_server(scripted_broker, bus_path)
+    worker = socket_server.ChatServer('127.0.0.1', 0, bus_path=bus_path)
+    task = asyncio.create_task(worker.serve_forever())
+    try:
+        while worker.port == 0:
+            await asyncio.sleep(0.01)
+        expected = ['[old] 이전 대화 1', '[old] 이전 대화 2', '[new] 새 메시지']
+
+        kim = await TestClient.connect(worker.port, 'kim')
+        joined = [message for message in await kim.collect() if message.startswith('[')]
+        check('기록 동기화: 이전 대화 다음에 새 메시지를 받음', joined == expected, repr(joined))
+
+        lee = await TestClient.connect(worker.port, 'lee')
+        joined = [message for message in await lee.collect() if message.startswith('[')]
+        check('기록 동기화: 새 메시지가 방 기록에 남음', joined == expected, repr(joined))
+
+        for client in (kim, lee):
+            await client.close()
+    finally:
+        # 버스 연결을 먼저 끊어 가짜 중계기의 연결 처리가 끝나게 함 (중계기가 닫으면 워커의 수신 루프도 끝남)
+        if worker.bus is not None and worker.bus.writer is not None:
+            worker.bus.writer.close()
+            await worker.bus._reader_task
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        bus_server.close()
+        await bus_server.wait_closed()
+
+
+async def run_checks():
+    with tempfile.TemporaryDirectory() as directory:
+        broker, bus_server, tasks, ports = await start_cluster(os.path.join(directory, 'bus.sock'))
+        try:
+            await check_names_and_whispers(ports)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            bus_server.close()
+            await bus_server.wait_closed()
+        await check_history_sync(os.path.join(directory, 'scripted.sock'))
+
+
+def main():
+    asyncio.run(run_checks())
+    print(json.dumps({'failed': failures}, ensure_ascii=False))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
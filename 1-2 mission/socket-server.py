@@ -1,83 +1,486 @@
-import socket
-import threading
+import argparse
+import asyncio
+from collections import OrderedDict
+import multiprocessing
+import os
+import signal
+import tempfile
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 
-class ChatClient:
-    def __init__(self, host='127.0.0.1', port=5000):
+from chat_bus import BusBroker, BusClient
+from chat_history import RoomHistory, room_log_path
+from chat_protocol import FrameError, encode_frame, read_frame
+
+# 접속하면 처음 들어가는 방
+DEFAULT_ROOM = '로비'
+
+# '/기록 N'으로 한 번에 요청할 수 있는 최대 메시지 수
+MAX_HISTORY_REQUEST = 1000
+
+# 방을 구독할 때 중계기의 최근 메시지를 기다리는 최대 시간(초), 넘으면 워커의 기록으로 입장
+HISTORY_SYNC_TIMEOUT = 5.0
+
+
+class ChatSession:
+    """
+    접속한 클라이언트 한 명의 상태
+    - 보낼 메시지는 크기가 제한된 큐(outbox)에 넣고, 전용 송신 태스크가 꺼내서 전송
+    - 느린 클라이언트는 자기 큐만 차고, 다른 사용자에게 보내는 방송은 막히지 않음
+    """
+
+    __slots__ = ('name', 'room', 'reader', 'writer', 'outbox', 'dropped', 'sender_task', 'closed')
+
+    def __init__(self, reader, writer, max_queue):
+        self.name = None
+        self.room = None
+        self.reader = reader
+        self.writer = writer
+        self.outbox = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self.sender_task = None
+        self.closed = False
+
+
+class ChatServer:
+    """
+    asyncio 기반 채팅 서버
+    - 스레드 없이 이벤트 루프 하나로 수천 명의 동시 접속을 처리
+    - 접속 후 첫 메시지는 사용자 이름, 이후 프레임(chat_protocol) 하나가 메시지 하나
+    - 일반 메시지는 같은 방에 방송, '/귓 이름 내용'은 귓속말, '/방 이름'은 방 이동, '/종료'는 접속 종료
+    - bus_path를 주면 여러 워커 프로세스 중 하나로 동작하며,
+      방 메시지를 버스(chat_bus)로 다른 워커와 주고받음
+    - 방마다 최근 메시지를 보관했다가 새로 들어온 사용자에게 보여줌,
+      '/기록 N'으로 더 이전 기록 요청 (history_dir을 주면 디스크 로그에서 읽음)
+    - 대화 기록은 최근에 사용한 max_history_rooms개 방까지만 메모리에 두고,
+      참여자가 모두 나간 방은 로그 파일을 닫고 버스 구독도 해제함
+    - 여러 워커로 동작할 때 입장 시 보여주는 최근 메시지는 버스 중계기가 보관한 기록으로 채움
+      (디스크 로그는 워커마다 따로 기록하므로, 그 워커에 참여자가 없던 동안의 메시지는
+      '/기록 N'으로 원형 버퍼보다 이전 기록을 요청할 때 빠져 있을 수 있음)
+    """
+
+    def __init__(self, host='0.0.0.0', port=5000, max_queue=256, max_dropped=1024, bus_path=None,
+                 history_size=50, history_dir=None, max_history_rooms=1000):
+        """
+        Args:
+            host: 바인딩할 주소
+            port: 포트 번호
+            max_queue: 클라이언트별 송신 큐 최대 길이
+            max_dropped: 큐가 가득 차 버린 메시지가 이 수를 넘으면 해당 클라이언트 연결 종료
+            bus_path: 워커 사이 pub/sub 버스의 Unix 소켓 경로 (None이면 단일 프로세스)
+            history_size: 방마다 메모리에 보관하고 입장 시 보여줄 최근 메시지 수
+            history_dir: 방별 대화 로그를 기록할 디렉토리 (None이면 메모리에만 보관)
+            max_history_rooms: 대화 기록을 메모리에 보관할 최대 방 수 (오래 사용하지 않은 방부터 제거)
+        """
         self.host = host
         self.port = port
-        self.sock = None
-        self.connected = False
+        self.max_queue = max_queue
+        self.max_dropped = max_dropped
+        self.bus_path = bus_path
+        self.bus = None
+        # 버스에서 메시지를 받고 있는 방
+        self.subscribed = set()
+        self.clients = {}
+        # 방 이름 -> 이 프로세스에 접속한 참여자 집합
+        self.rooms = {}
+        self.history_size = history_size
+        self.history_dir = history_dir
+        self.max_history_rooms = max_history_rooms
+        # 방 이름 -> RoomHistory (최근에 사용한 방이 뒤쪽, 참여자가 없는 방은 오래되면 제거)
+        self.histories = OrderedDict()
+        # 버스 구독 응답(다른 워커의 최근 대화)을 기다리는 방 -> Task
+        self.history_sync = {}
 
-    def start(self):
-        if not self.connect_to_server():
-            return
-            
-        name = input('사용자 이름을 입력하세요: ')
-        self.send_message(name)
-        
-        self.start_receiving_thread()
-        self.start_input_loop()
-
-    def connect_to_server(self):
+    async def serve_forever(self):
+        reuse_port = None
+        if self.bus_path is not None:
+            self.bus = BusClient(self.bus_path, self.on_bus_room_message, self.on_bus_whisper,
+                                 self.on_bus_whisper_result, self.on_bus_history)
+            await self.bus.connect()
+            # 여러 워커가 같은 포트에서 접속을 나눠 받음
+            reuse_port = True
+        server = await asyncio.start_server(self.handle_client, self.host, self.port,
+                                            backlog=4096, reuse_port=reuse_port)
+        # 포트 0으로 시작하면 운영체제가 정한 실제 포트로 바꿔 둠
+        self.port = server.sockets[0].getsockname()[1]
         try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.connect((self.host, self.port))
-            self.connected = True
-            return True
-        except:
-            print('서버에 연결할 수 없습니다.')
-            return False
-
-    def start_receiving_thread(self):
-        receive_thread = threading.Thread(target=self.receive_messages, daemon=True)
-        receive_thread.start()
-
-    def start_input_loop(self):
+            async with server:
+                await server.serve_forever()
+        finally:
+            for history in self.histories.values():
+                history.close()
+
+    async def handle_client(self, reader, writer):
+        """클라이언트 한 명의 수신 처리 (접속부터 종료까지)"""
+        session = ChatSession(reader, writer, self.max_queue)
+        session.sender_task = asyncio.create_task(self.send_loop(session))
         try:
-            while self.connected:
-                message = input()
-                self.send_message(message)
-                
-                if message == '/종료':
-                    self.connected = False
+            name = await self.read_message(session)
+            if not name:
+                return
+            # 탭은 버스 명령의 구분자이므로 사용하지 않음
+            session.name = await self.reserve_name(name.replace('\t', ' '))
+            self.clients[session.name] = session
+            await self.join_room(session, DEFAULT_ROOM)
+
+            while True:
+                message = await self.read_message(session)
+                if message is None or message.strip() == '/종료':
                     break
-        except KeyboardInterrupt:
-            self.send_message('/종료')
+                if not message:
+                    continue
+                if message.startswith('/귓 '):
+                    self.whisper(session, message)
+                elif message == '/방' or message.startswith('/방 '):
+                    await self.change_room(session, message[2:].strip())
+                elif message == '/기록' or message.startswith('/기록 '):
+                    self.send_history(session, message[3:].strip())
+                else:
+                    self.broadcast(session.room, f'[{session.name}] {message}')
         finally:
-            self.disconnect()
-
-    def receive_messages(self):
-        while self.connected:
-            try:
-                data = self.sock.recv(1024)
-                
-                if not data:
-                    break
-                    
-                message = data.decode('utf-8')
-                print(message, end='')
-                
-            except:
-                break
-                
-        self.connected = False
-
-    def send_message(self, message):
+            await self.remove_client(session)
+
+    async def read_message(self, session):
+        """메시지 하나를 읽어 문자열로 반환합니다. 연결이 끊기면 None"""
+        try:
+            return await read_frame(session.reader)
+        except (ConnectionError, FrameError, asyncio.CancelledError):
+            # 연결 오류, 너무 긴 메시지 또는 서버 종료
+            return None
+
+    async def reserve_name(self, name):
+        """
+        겹치지 않는 사용자 이름을 정합니다.
+        여러 워커로 동작할 때는 중계기가 클러스터 전체에서 이름을 정하므로
+        다른 워커의 사용자와도 이름이 겹치지 않습니다 (귓속말이 한 사람에게만 감).
+        """
+        if self.bus is not None:
+            reserved = await self.bus.join(name)
+            if reserved is not None and reserved not in self.clients:
+                return reserved
+        # 단일 프로세스이거나 버스 연결이 끊긴 경우: 이 워커 안에서만 겹치지 않게 함
+        return self.unique_name(name)
+
+    def unique_name(self, name):
+        """이 프로세스에서 이미 사용 중인 이름이면 뒤에 번호를 붙입니다."""
+        if name not in self.clients:
+            return name
+        number = 2
+        while f'{name}({number})' in self.clients:
+            number += 1
+        return f'{name}({number})'
+
+    async def join_room(self, session, room):
+        """방에 들어가고 방 참여자에게 입장 알림"""
+        session.room = room
+        if self.bus is not None and room not in self.subscribed:
+            # 이 워커에 참여자가 없던 방이면 구독하고, 그동안 다른 워커에서 오간 대화로 기록을 채움
+            self.subscribed.add(room)
+            self.history_sync[room] = asyncio.create_task(self.sync_history(room))
+        sync = self.history_sync.get(room)
+        if sync is not None:
+            # 기록이 채워질 때까지는 참여자로 추가하지 않음
+            # (그 사이에 온 메시지는 기록 뒤에 이어 붙고, 아래 replay로 순서대로 받음)
+            await asyncio.shield(sync)
+            if session.room != room:
+                # 기다리는 동안 나감
+                self.release_room(room)
+                return
+        # 이전 대화를 먼저 보여준 뒤 참여자로 추가하고 입장 알림
+        # (replay와 참여자 추가 사이에 await가 없으므로 메시지가 빠지거나 두 번 가지 않음)
+        # (여러 워커일 때는 중계기 기록으로 채운 원형 버퍼만 사용, 워커의 디스크 로그는 빠진 메시지가 있을 수 있음)
+        replay = self.history_for(room).replay(self.history_size, use_log=self.bus is None)
+        if replay:
+            self.deliver(session, replay)
+        self.rooms.setdefault(room, set()).add(session)
+        self.broadcast(room, f'{session.name}님이 입장하셨습니다.')
+
+    async def sync_history(self, room):
+        """
+        버스에서 방을 구독하고 중계기의 최근 메시지가 원형 버퍼에 반영될 때까지 기다립니다.
+        (반영은 버스 수신 루프가 H를 받는 즉시 on_bus_history로 함)
+        """
+        try:
+            await asyncio.wait_for(self.bus.subscribe(room), HISTORY_SYNC_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self.history_sync.pop(room, None)
+
+    def on_bus_history(self, room, texts):
+        """구독한 방의 중계기 기록으로 원형 버퍼를 교체합니다 (이후 도착하는 메시지는 그 뒤에 이어 붙음)."""
+        self.history_for(room).reset_recent([encode_frame(text) for text in texts])
+
+    def leave_room(self, session):
+        """방에서 나가고 남은 참여자에게 퇴장 알림"""
+        room = session.room
+        session.room = None
+        members = self.rooms.get(room)
+        if members is None or session not in members:
+            # 기록을 기다리며 아직 참여자로 추가되지 않은 상태 (join_room이 정리함)
+            return
+        members.discard(session)
+        self.broadcast(room, f'{session.name}님이 퇴장하셨습니다.')
+        if not members:
+            del self.rooms[room]
+            self.release_room(room)
+
+    def release_room(self, room):
+        """
+        참여자가 없는 방은 로그 파일을 닫고 (다시 사용하면 다시 엶) 구독을 해제합니다.
+        다시 구독할 때 중계기가 보관한 최근 메시지를 받으므로 기록이 끊기지 않습니다.
+        """
+        if room in self.rooms or room in self.history_sync:
+            return
+        history = self.histories.get(room)
+        if history is not None:
+            history.close()
+        if self.bus is not None and room in self.subscribed:
+            self.subscribed.discard(room)
+            self.bus.unsubscribe(room)
+
+    async def change_room(self, session, room):
+        """'/방 이름'으로 방 이동, '/방'만 입력하면 현재 방 안내"""
+        # 탭은 버스 명령의 구분자이므로 사용하지 않음
+        room = room.replace('\t', ' ')
+        if not room:
+            self.deliver(session, encode_frame(f'현재 방: {session.room}'))
+            return
+        if room == session.room:
+            return
+        self.leave_room(session)
+        await self.join_room(session, room)
+
+    def send_history(self, session, count):
+        """'/기록 N': 현재 방의 최근 N개 메시지를 다시 보냄"""
+        if not count.isdigit():
+            self.deliver(session, encode_frame('사용법: /기록 메시지수'))
+            return
+        replay = self.history_for(session.room).replay(min(int(count), MAX_HISTORY_REQUEST))
+        if replay:
+            self.deliver(session, replay)
+
+    def history_for(self, room):
+        """방의 대화 기록 (처음 메시지가 오면 생성, 디스크 로그가 있으면 이어서 사용)"""
+        history = self.histories.get(room)
+        if history is None:
+            log_path = room_log_path(self.history_dir, room) if self.history_dir else None
+            history = self.histories[room] = RoomHistory(self.history_size, log_path)
+            if len(self.histories) > self.max_history_rooms:
+                self.evict_history()
+        else:
+            self.histories.move_to_end(room)
+        return history
+
+    def evict_history(self):
+        """참여자가 없는 방 중 가장 오래 사용하지 않은 방의 기록을 메모리에서 제거합니다."""
+        for room, history in self.histories.items():
+            if room not in self.rooms and room not in self.history_sync:
+                del self.histories[room]
+                history.close()
+                return
+
+    def broadcast(self, room, text):
+        """방 참여자 모두에게 메시지 전송 (다른 워커의 참여자는 버스를 통해 전달)"""
+        self.deliver_room(room, text)
+        if self.bus is not None:
+            self.bus.publish(room, text)
+
+    def deliver_room(self, room, text):
+        """이 프로세스에 접속한 방 참여자에게만 전송 (인코딩은 한 번만 수행)"""
+        data = encode_frame(text)
+        self.history_for(room).append(data)
+        members = self.rooms.get(room)
+        if not members:
+            return
+        for session in list(members):
+            self.deliver(session, data)
+
+    def on_bus_room_message(self, room, text):
+        """다른 워커에서 발행한 방 메시지"""
+        self.deliver_room(room, text)
+
+    def on_bus_whisper(self, sender, name, text):
+        """다른 워커에서 보낸 귓속말 (받는 사람이 이 워커에 있을 때만 전달)"""
+        target = self.clients.get(name)
+        if target is not None:
+            self.deliver(target, encode_frame(f'(귓속말) {sender}: {text}'))
+
+    def on_bus_whisper_result(self, sender, found, name, text):
+        """버스로 보낸 귓속말의 결과를 보낸 사람에게 알림"""
+        session = self.clients.get(sender)
+        if session is not None:
+            self.whisper_result(session, found, name, text)
+
+    def whisper(self, sender, message):
+        """'/귓 이름 내용' 형식의 귓속말 처리"""
+        parts = message.split(' ', 2)
+        if len(parts) < 3 or not parts[2]:
+            self.deliver(sender, encode_frame('사용법: /귓 이름 메시지'))
+            return
+        name = parts[1]
+        target = self.clients.get(name)
+        if target is None and self.bus is not None:
+            # 다른 워커에 접속했을 수 있으므로 버스로 전달 (결과는 on_bus_whisper_result로 받음)
+            self.bus.whisper(sender.name, name, parts[2])
+            return
+        if target is not None:
+            self.deliver(target, encode_frame(f'(귓속말) {sender.name}: {parts[2]}'))
+        if target is not sender:
+            self.whisper_result(sender, target is not None, name, parts[2])
+
+    def whisper_result(self, sender, found, name, text):
+        """귓속말을 보낸 사람에게 전달 확인 또는 받는 사람이 없다는 안내"""
+        if found:
+            self.deliver(sender, encode_frame(f'(귓속말 → {name}) {text}'))
+        else:
+            self.deliver(sender, encode_frame(f'{name}님을 찾을 수 없습니다.'))
+
+    def deliver(self, session, data):
+        """
+        클라이언트의 송신 큐에 메시지를 넣습니다 (블로킹 없음).
+        큐가 가득 차면 메시지를 버리고, 너무 많이 버려지면 연결을 끊습니다.
+        """
+        if session.closed:
+            return
         try:
-            self.sock.sendall((message + '\n').encode('utf-8'))
-        except:
-            self.connected = False
+            session.outbox.put_nowait(data)
+        except asyncio.QueueFull:
+            session.dropped += 1
+            if session.dropped > self.max_dropped:
+                session.closed = True
+                session.writer.transport.abort()
+
+    async def send_loop(self, session):
+        """송신 큐에 쌓인 메시지를 모아서 한 번에 전송하는 태스크"""
+        outbox = session.outbox
+        writer = session.writer
+        try:
+            while True:
+                chunks = [await outbox.get()]
+                while not outbox.empty():
+                    chunks.append(outbox.get_nowait())
+                writer.writelines(chunks)
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+
+    async def remove_client(self, session):
+        """접속 종료 처리 및 퇴장 알림"""
+        if session.name is not None and self.clients.get(session.name) is session:
+            del self.clients[session.name]
+            if self.bus is not None:
+                self.bus.leave(session.name)
+            self.leave_room(session)
+        session.closed = True
+        session.sender_task.cancel()
+        try:
+            session.writer.close()
+            await session.writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+
+def raise_open_file_limit():
+    """동시 접속 수천 개를 받을 수 있도록 열 수 있는 파일 수 제한을 최대로 올립니다."""
+    if resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+        except (ValueError, OSError):
+            pass
+
+
+def run_worker(host, port, max_queue, bus_path, history_size, history_dir, max_history_rooms):
+    """워커 프로세스 진입점"""
+    # terminate()로 종료될 때도 Ctrl+C처럼 정리 후 종료 (대화 로그 flush)
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    raise_open_file_limit()
+    server = ChatServer(host, port, max_queue, bus_path=bus_path,
+                        history_size=history_size, history_dir=history_dir,
+                        max_history_rooms=max_history_rooms)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+async def run_cluster(host, port, max_queue, workers, history_size, history_dir, max_history_rooms):
+    """
+    버스 중계기를 띄운 뒤 워커 프로세스 여러 개를 시작합니다.
+    각 워커는 같은 포트(SO_REUSEPORT)로 접속을 나눠 받습니다.
+    입장 시 보여줄 최근 메시지는 중계기가 방마다 보관하고,
+    대화 로그는 워커마다 history_dir/worker-N 아래에 따로 기록합니다.
+    """
+    bus_dir = tempfile.mkdtemp(prefix='chat-bus-')
+    bus_path = os.path.join(bus_dir, 'bus.sock')
+    broker = BusBroker(history_size=history_size, max_history_rooms=max_history_rooms)
+    server = await asyncio.start_unix_server(broker.handle_worker, bus_path)
+
+    context = multiprocessing.get_context('spawn')
+    processes = []
+    for index in range(workers):
+        worker_dir = None
+        if history_dir:
+            worker_dir = os.path.join(history_dir, f'worker-{index}')
+            os.makedirs(worker_dir, exist_ok=True)
+        processes.append(context.Process(
+            target=run_worker,
+            args=(host, port, max_queue, bus_path, history_size, worker_dir, max_history_rooms),
+            daemon=True
+        ))
+    for process in processes:
+        process.start()
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+        os.unlink(bus_path)
+        os.rmdir(bus_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='채팅 서버')
+    parser.add_argument('--host', default='0.0.0.0', help='바인딩할 주소')
+    parser.add_argument('--port', type=int, default=5000, help='포트 번호')
+    parser.add_argument('--max-queue', type=int, default=256, help='클라이언트별 송신 큐 최대 길이')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='워커 프로세스 수 (2 이상이면 pub/sub 버스로 방 메시지를 공유)')
+    parser.add_argument('--history', type=int, default=50, help='입장 시 보여줄 최근 메시지 수')
+    parser.add_argument('--history-dir', help='방별 대화 로그를 기록할 디렉토리 (없으면 메모리에만 보관)')
+    parser.add_argument('--history-rooms', type=int, default=1000,
+                        help='대화 기록을 메모리에 보관할 최대 방 수 (오래 사용하지 않은 방부터 제거)')
+    args = parser.parse_args()
+
+    if args.history_dir:
+        os.makedirs(args.history_dir, exist_ok=True)
 
-    def disconnect(self):
-        self.connected = False
-        
-        if self.sock:
-            try:
-                self.sock.close()
-            except:
-                pass
+    # terminate()로 종료될 때도 워커 정리와 대화 로그 flush를 하도록 Ctrl+C와 같이 처리
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    raise_open_file_limit()
+    print(f'채팅 서버 시작 - 포트 {args.port} (워커 {args.workers}개)')
+    print('종료: Ctrl+C')
+    try:
+        if args.workers > 1:
+            asyncio.run(run_cluster(args.host, args.port, args.max_queue, args.workers,
+                                    args.history, args.history_dir, args.history_rooms))
+        else:
+            server = ChatServer(args.host, args.port, args.max_queue,
+                                history_size=args.history, history_dir=args.history_dir,
+                                max_history_rooms=args.history_rooms)
+            asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print('\n서버를 종료합니다.')
 
 
 if __name__ == '__main__':
-    ChatClient().start()
\ No newline at end of file
+    main()
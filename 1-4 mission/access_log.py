@@ -0,0 +1,149 @@
+import json
+import os
+import queue
+import sys
+import threading
+import time
+
+
+class AccessLogger:
+    """
+    큐 기반 비동기 접근 로그 기록기
+
+    요청 처리 스레드는 기록할 값을 큐에 넣기만 하고 바로 돌아갑니다.
+    백그라운드 스레드가 큐에서 여러 건을 모아(batch) 문자열로 만든 뒤 한 번에 씁니다.
+    큐가 가득 차면 요청을 막지 않고 로그를 버린 뒤 dropped 수만 증가시킵니다.
+
+    형식:
+    - clf: Common Log Format + 처리 시간(마이크로초)
+      127.0.0.1 - - [19/Oct/2026:15:39:08 +0900] "GET / HTTP/1.1" 200 13137 512
+    - json: 한 줄에 JSON 객체 하나
+    """
+
+    def __init__(self, path='-', log_format='clf', max_bytes=10 * 1024 * 1024, backup_count=5,
+                 batch_size=256, flush_interval=0.5, queue_size=10000):
+        """
+        Args:
+            path: 로그 파일 경로 ('-'이면 표준 출력)
+            log_format: 'clf' 또는 'json'
+            max_bytes: 로그 파일 최대 크기, 넘으면 파일을 돌려씀(rotation). 0이면 돌려쓰지 않음
+            backup_count: 보관할 이전 로그 파일 수 (access.log.1 ~ access.log.N)
+            batch_size: 한 번에 모아서 쓸 최대 로그 수
+            flush_interval: 로그가 적을 때 최대 대기 시간(초)
+            queue_size: 큐 최대 길이
+        """
+        if log_format not in ('clf', 'json'):
+            raise ValueError(f'알 수 없는 로그 형식: {log_format}')
+        self.path = path
+        self.log_format = log_format
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._stop = object()
+        self._stream = None
+        self._size = 0
+        # 같은 초에 들어온 로그는 시간 문자열을 다시 만들지 않음
+        self._cached_second = None
+        self._cached_time = ''
+        self._thread = threading.Thread(target=self._run, name='access-log', daemon=True)
+        self._thread.start()
+
+    def log(self, client_ip, method, path, version, status, size, duration,
+            user_agent='-', referer='-'):
+        """요청 하나를 기록합니다 (블로킹 없음)."""
+        record = (time.time(), client_ip, method, path, version, status, size, duration, user_agent, referer)
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        """큐에 남은 로그를 모두 쓰고 종료합니다."""
+        self._queue.put(self._stop)
+        self._thread.join()
+
+    def _run(self):
+        """큐에서 로그를 모아 한 번에 쓰는 백그라운드 루프"""
+        self._open()
+        running = True
+        while running:
+            batch = []
+            try:
+                record = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            while True:
+                if record is self._stop:
+                    running = False
+                    break
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    record = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write(''.join(self._format(record) for record in batch))
+        if self._stream is not sys.stdout:
+            self._stream.close()
+
+    def _format(self, record):
+        timestamp, client_ip, method, path, version, status, size, duration, user_agent, referer = record
+        if self.log_format == 'json':
+            return json.dumps({
+                'time': time.strftime('%Y-%m-%dT%H:%M:%S%z', time.localtime(timestamp)),
+                'client': client_ip,
+                'method': method,
+                'path': path,
+                'protocol': version,
+                'status': status,
+                'bytes': size,
+                'duration_ms': round(duration * 1000, 3),
+                'user_agent': user_agent,
+                'referer': referer,
+            }, ensure_ascii=False) + '\n'
+
+        second = int(timestamp)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_time = time.strftime('%d/%b/%Y:%H:%M:%S %z', time.localtime(second))
+        return (f'{client_ip} - - [{self._cached_time}] "{method} {path} {version}" '
+                f'{status} {size if size else "-"} {int(duration * 1000000)}\n')
+
+    def _open(self):
+        if self.path == '-':
+            self._stream = sys.stdout
+            return
+        self._stream = open(self.path, 'a', encoding='utf-8')
+        self._size = self._stream.tell()
+
+    def _write(self, text):
+        size = len(text.encode('utf-8'))
+        try:
+            if self._stream is not sys.stdout and self.max_bytes and self._size + size > self.max_bytes:
+                self._rotate()
+            self._stream.write(text)
+            self._stream.flush()
+            self._size += size
+        except (OSError, ValueError):
+            # 로그 기록 실패가 서버 동작을 멈추게 해서는 안 됨
+            pass
+
+    def _rotate(self):
+        """access.log -> access.log.1 -> ... -> access.log.N 순으로 파일을 밀어냄"""
+        self._stream.close()
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f'{self.path}.{index}'
+            if os.path.exists(source):
+                os.replace(source, f'{self.path}.{index + 1}')
+        if self.backup_count > 0:
+            os.replace(self.path, f'{self.path}.1')
+        else:
+            os.remove(self.path)
+        self._stream = open(self.path, 'a', encoding='utf-8')
+        self._size = 0
@@ -0,0 +1,190 @@
+"""
+웹서버 동시성 모델 벤치마크
+
+httpserver.py를 모드별(single / threaded / async)로 실행한 뒤
+동시 연결 수(기본 1, 64, 512)를 바꿔가며 초당 처리 요청 수와 p50/p99 지연 시간을 측정합니다.
+
+--slow-clients N을 주면 요청을 끝까지 보내지 않는 느린 클라이언트 N개를 함께 붙여
+한 연결이 다른 연결을 막는지(single 모드) 확인할 수 있습니다.
+
+--keep-alive를 주면 클라이언트마다 HTTP/1.1 연결 하나를 재사용합니다.
+
+--idle-clients N을 주면 요청 하나를 보낸 뒤 연결을 열어 둔 채 쉬는 클라이언트 N개를 먼저 붙입니다.
+--workers보다 많이 붙이면 쉬는 연결이 threaded 모드의 스레드를 붙잡는지 확인할 수 있습니다.
+    예) python bench_httpserver.py --modes threaded --workers 4 --idle-clients 16 --concurrency 8
+
+실행 방법: python bench_httpserver.py [--duration 5] [--concurrency 1 64 512] [--slow-clients 1] [--keep-alive]
+                                      [--workers 32] [--idle-clients 0]
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def percentile(values, ratio):
+    """정렬된 리스트에서 백분위 값을 구합니다."""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(len(values) * ratio))
+    return values[index]
+
+
+async def fetch(host, port, path):
+    """요청 하나를 보내고 응답을 끝까지 읽습니다 (연결은 요청마다 새로 생성)."""
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f'GET {path} HTTP/1.0\r\nHost: {host}\r\n\r\n'.encode('ascii'))
+    await writer.drain()
+    data = await reader.read()
+    writer.close()
+    if not data.startswith(b'HTTP/1.') or b' 200 ' not in data[:16]:
+        raise RuntimeError('잘못된 응답')
+
+
+class KeepAliveConnection:
+    """HTTP/1.1 지속 연결 하나로 요청을 반복하는 클라이언트"""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def fetch(self, path):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self.writer.write(f'GET {path} HTTP/1.1\r\nHost: {self.host}\r\n\r\n'.encode('ascii'))
+        await self.writer.drain()
+
+        head = await self.reader.readuntil(b'\r\n\r\n')
+        if b' 200 ' not in head[:16]:
+            raise RuntimeError('잘못된 응답')
+        headers = head.decode('latin-1').lower()
+        length = int(headers.split('content-length:')[1].split('\r\n')[0])
+        await self.reader.readexactly(length)
+        if 'connection: close' in headers:
+            self.close()
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+async def run_load(host, port, path, concurrency, duration, slow_clients=0, keep_alive=False, idle_clients=0):
+    """concurrency개의 클라이언트가 duration초 동안 요청을 반복합니다."""
+    latencies = []
+    errors = 0
+
+    # 요청 하나를 보낸 뒤 지속 연결을 열어 둔 채 쉬는 클라이언트
+    idle_connections = []
+    for _ in range(idle_clients):
+        connection = KeepAliveConnection(host, port)
+        await connection.fetch(path)
+        idle_connections.append(connection)
+
+    deadline = time.perf_counter() + duration
+
+    # 요청 줄만 보내고 헤더를 끝내지 않는 느린 클라이언트
+    slow_writers = []
+    for _ in range(slow_clients):
+        _, writer = await asyncio.open_connection(host, port)
+        writer.write(f'GET {path} HTTP/1.0\r\n'.encode('ascii'))
+        await writer.drain()
+        slow_writers.append(writer)
+
+    async def client():
+        nonlocal errors
+        connection = KeepAliveConnection(host, port) if keep_alive else None
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            request = connection.fetch(path) if keep_alive else fetch(host, port, path)
+            try:
+                await asyncio.wait_for(request, max(0.01, deadline - start))
+            except asyncio.TimeoutError:
+                # 측정 시간이 끝나 중단된 요청은 오류로 세지 않습니다 (single 모드에서 막힌 요청 제외).
+                if time.perf_counter() < deadline:
+                    errors += 1
+                break
+            except (OSError, RuntimeError, asyncio.IncompleteReadError):
+                errors += 1
+                if connection is not None:
+                    connection.close()
+                continue
+            latencies.append(time.perf_counter() - start)
+        if connection is not None:
+            connection.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    for writer in slow_writers:
+        writer.close()
+    for connection in idle_connections:
+        connection.close()
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'rps': len(latencies) / elapsed,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+    }
+
+
+def wait_for_port(port, timeout=5.0):
+    """서버가 포트를 열 때까지 기다립니다."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.2):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f'서버가 포트 {port}에서 시작되지 않았습니다.')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='httpserver.py 동시성 모델 벤치마크')
+    parser.add_argument('--modes', nargs='+', default=['single', 'threaded', 'async'])
+    parser.add_argument('--concurrency', nargs='+', type=int, default=[1, 64, 512])
+    parser.add_argument('--duration', type=float, default=5.0, help='측정 시간(초)')
+    parser.add_argument('--port', type=int, default=18080)
+    parser.add_argument('--path', default='/index.html')
+    parser.add_argument('--slow-clients', type=int, default=0, help='함께 붙일 느린 클라이언트 수')
+    parser.add_argument('--keep-alive', action='store_true', help='HTTP/1.1 지속 연결 재사용')
+    parser.add_argument('--workers', type=int, default=32, help='threaded 모드의 최대 스레드 수')
+    parser.add_argument('--idle-clients', type=int, default=0, help='먼저 붙여 둘 쉬는 지속 연결 수')
+    args = parser.parse_args()
+
+    print(f'{"mode":<10}{"conns":>7}{"req/s":>10}{"p50(ms)":>10}{"p99(ms)":>10}{"errors":>8}')
+    for mode in args.modes:
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(HERE, 'httpserver.py'),
+             '--mode', mode, '--port', str(args.port), '--root', os.path.join(HERE, 'static'),
+             '--workers', str(args.workers), '--quiet'],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        try:
+            wait_for_port(args.port)
+            for concurrency in args.concurrency:
+                result = asyncio.run(
+                    run_load('127.0.0.1', args.port, args.path, concurrency, args.duration,
+                             args.slow_clients, args.keep_alive, args.idle_clients)
+                )
+                print(f'{mode:<10}{concurrency:>7}{result["rps"]:>10.0f}'
+                      f'{result["p50_ms"]:>10.2f}{result["p99_ms"]:>10.2f}{result["errors"]:>8}')
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == '__main__':
+    main()
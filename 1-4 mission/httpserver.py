@@ -1,56 +1,577 @@
+import argparse
+import asyncio
+import concurrent.futures
 import http.server
+import os
+import selectors
+import shutil
+import socket
 import socketserver
-import datetime
+import email.utils
+import threading
+import time
+from http import HTTPStatus
+
+from access_log import AccessLogger
+from static_cache import StaticFileCache
+
+
+# 기본 문서 루트 (스크립트 옆의 static/ 디렉터리, 서버 소스 코드는 공개하지 않음)
+DEFAULT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+
+# 이 크기 이상이면서 메모리에 캐시되지 않은 파일은 os.sendfile로 전송
+SENDFILE_THRESHOLD = 64 * 1024
+
+NOT_FOUND_HTML = '<h1>404 - 요청한 파일을 찾을 수 없습니다</h1>'.encode('utf-8')
+
+
+class StaticResponse:
+    """
+    정적 파일 요청에 대한 응답 내용
+
+    스레드 서버(SimpleHandler)와 asyncio 서버가 같은 응답 로직을 사용하도록
+    응답 생성과 전송을 분리합니다.
+    """
+
+    def __init__(self, status, headers, body=b'', file_path=None):
+        self.status = status
+        self.headers = headers
+        # 메모리에 있는 본문 (캐시된 파일, 404 페이지 등)
+        self.body = body
+        # 캐시되지 않은 큰 파일은 경로만 전달하고 sendfile로 전송
+        self.file_path = file_path
+
+    def content_length(self):
+        """접근 로그에 기록할 본문 크기"""
+        if self.body:
+            return len(self.body)
+        if self.file_path is not None:
+            return int(dict(self.headers).get('Content-Length', 0))
+        return 0
+
+
+def build_response(static_cache, path, request_headers, send_body=True):
+    """요청 경로와 헤더로 StaticResponse를 만듭니다."""
+    try:
+        cached = static_cache.get(path)
+    except OSError:
+        # 파일이 없거나 읽을 수 없을 때
+        headers = [
+            ('Content-Type', 'text/html; charset=utf-8'),
+            ('Content-Length', str(len(NOT_FOUND_HTML))),
+        ]
+        return StaticResponse(404, headers, NOT_FOUND_HTML if send_body else b'')
+
+    # Accept-Encoding에 맞는 미리 압축된 본문 선택 (없으면 원본)
+    encoding = cached.choose_encoding(request_headers.get('Accept-Encoding'))
+    validators = [('ETag', cached.etag_for(encoding)), ('Last-Modified', cached.last_modified)]
+    if cached.compressible:
+        validators.append(('Vary', 'Accept-Encoding'))
+
+    # 조건부 요청: 브라우저 캐시가 최신이면 본문 없이 304 응답
+    if cached.is_not_modified(request_headers.get('If-None-Match'),
+                              request_headers.get('If-Modified-Since'),
+                              encoding):
+        return StaticResponse(304, validators)
+
+    if encoding is not None:
+        body = cached.encoded[encoding]
+        headers = [
+            ('Content-Type', cached.content_type),
+            ('Content-Encoding', encoding),
+            ('Content-Length', str(len(body))),
+        ] + validators
+        return StaticResponse(200, headers, body if send_body else b'')
+
+    headers = [
+        ('Content-Type', cached.content_type),
+        ('Content-Length', str(cached.size if cached.data is None else len(cached.data))),
+    ] + validators
+
+    if not send_body:
+        return StaticResponse(200, headers)
+    if cached.data is not None:
+        return StaticResponse(200, headers, cached.data)
+    return StaticResponse(200, headers, file_path=cached.path)
 
 
 class SimpleHandler(http.server.BaseHTTPRequestHandler):
-    """단순한 HTTP 요청 핸들러"""
-    
+    """단순한 HTTP 요청 핸들러 (문서 루트의 정적 파일 제공)"""
+
+    # main()에서 문서 루트에 맞는 StaticFileCache로 설정
+    static_cache = StaticFileCache(DEFAULT_ROOT)
+
+    # 접근 로그 기록기 (main()에서 설정, None이면 기록하지 않음)
+    access_logger = None
+
+    # HTTP/1.1: 응답 후 연결을 닫지 않고 다음 요청을 기다림 (지속 연결, 파이프라이닝)
+    protocol_version = 'HTTP/1.1'
+
+    # 유휴 연결을 닫기까지 기다리는 시간(초), 소켓 타임아웃 및 PooledHTTPServer의 대기 기한으로 적용됨
+    timeout = 15
+
+    # 연결 하나에서 처리할 최대 요청 수 (넘으면 Connection: close)
+    max_requests_per_connection = 100
+
+    # 헤더와 본문을 나눠 보낼 때 Nagle 알고리즘 때문에 응답이 지연되지 않도록 함
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        """연결이 열릴 때 요청 수 초기화"""
+        super().setup()
+        self.requests_handled = 0
+        # True면 유휴 연결을 서버의 셀렉터에 맡기고 스레드를 반납한 상태
+        self.parked = False
+
+    def handle(self):
+        """
+        연결에서 요청을 반복 처리합니다.
+
+        서버가 유휴 연결 대기(park)를 지원하면, 다음 요청이 아직 도착하지 않았을 때
+        스레드를 붙잡고 기다리지 않고 연결을 서버에 맡긴 뒤 반환합니다.
+        (다음 요청이 도착하면 서버가 handle()을 다시 호출합니다.)
+        """
+        self.handle_one_request()
+        can_park = hasattr(self.server, 'park')
+        while not self.close_connection:
+            if can_park and not self.has_pending_input():
+                if not self.close_connection:
+                    self.parked = True
+                return
+            self.handle_one_request()
+
+    def has_pending_input(self):
+        """다음 요청 데이터가 이미 도착해 있는지(파이프라이닝 포함) 기다리지 않고 확인합니다."""
+        try:
+            self.connection.setblocking(False)
+            try:
+                # 버퍼에 남은 데이터가 있으면 그대로, 없으면 소켓에서 읽을 수 있는 만큼만 확인
+                return bool(self.rfile.peek(1))
+            finally:
+                self.connection.settimeout(self.timeout)
+        except OSError:
+            self.close_connection = True
+            return False
+
+    def finish(self):
+        """대기 상태로 넘긴 연결은 닫지 않고 보낸 응답만 내보냅니다."""
+        if self.parked:
+            self.wfile.flush()
+            return
+        super().finish()
+
     def do_GET(self):
         """GET 요청 처리"""
-        # 접속 정보 출력
-        current_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        client_ip = self.client_address[0]
-        print(f'접속 시간: {current_time}')
-        print(f'접속한 클라이언트 IP: {client_ip}')
-        print('-' * 40)
-        
-        try:
-            # index.html 파일 읽기
-            with open('index.html', 'r', encoding='utf-8') as file:
-                content = file.read()
-            
-            # 200 응답 전송
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/html; charset=utf-8')
-            self.end_headers()
-            self.wfile.write(content.encode('utf-8'))
-            
-        except FileNotFoundError:
-            # index.html이 없을 때
-            self.send_response(404)
-            self.send_header('Content-Type', 'text/html; charset=utf-8')
-            self.end_headers()
-            error_html = '<h1>404 - index.html 파일을 찾을 수 없습니다</h1>'
-            self.wfile.write(error_html.encode('utf-8'))
-    
+        self.serve_static(send_body=True)
+
+    def do_HEAD(self):
+        """HEAD 요청 처리 (본문 없이 헤더만 전송)"""
+        self.serve_static(send_body=False)
+
+    def serve_static(self, send_body):
+        """요청 경로의 정적 파일을 캐시에서 찾아 전송"""
+        start = time.perf_counter()
+        response = build_response(self.static_cache, self.path, self.headers, send_body)
+
+        self.send_response(response.status)
+        for name, value in response.headers:
+            self.send_header(name, value)
+        self.send_connection_headers()
+        self.end_headers()
+
+        if response.body:
+            self.wfile.write(response.body)
+        elif response.file_path is not None:
+            self.send_file(response.file_path)
+
+        if self.access_logger is not None:
+            self.access_logger.log(
+                self.client_address[0], self.command, self.path, self.request_version,
+                response.status, response.content_length(), time.perf_counter() - start,
+                self.headers.get('User-Agent', '-'), self.headers.get('Referer', '-')
+            )
+
+    def send_connection_headers(self):
+        """지속 연결 유지/종료 여부를 응답 헤더로 알림"""
+        self.requests_handled += 1
+        if self.protocol_version != 'HTTP/1.1':
+            return
+
+        if self.requests_handled >= self.max_requests_per_connection:
+            # send_header가 close_connection을 True로 바꿔 응답 후 연결을 닫음
+            self.send_header('Connection', 'close')
+        elif not self.close_connection:
+            remaining = self.max_requests_per_connection - self.requests_handled
+            if self.request_version == 'HTTP/1.0':
+                self.send_header('Connection', 'keep-alive')
+            self.send_header('Keep-Alive', f'timeout={self.timeout:g}, max={remaining}')
+
+    def send_file(self, path):
+        """캐시되지 않은 큰 파일을 전송 (가능하면 os.sendfile 사용)"""
+        with open(path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if size >= SENDFILE_THRESHOLD and hasattr(os, 'sendfile'):
+                # 커널이 파일에서 소켓으로 직접 복사 (사용자 공간 복사 없음)
+                self.wfile.flush()
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(self.connection.fileno(), file.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            else:
+                shutil.copyfileobj(file, self.wfile)
+
     def log_message(self, format, *args):
         """기본 로그 메시지 무시"""
         pass
 
 
+class SingleHTTPServer(socketserver.TCPServer):
+    """연결을 한 번에 하나씩 처리하는 서버 (기존 방식)"""
+
+    allow_reuse_address = True
+    request_queue_size = 1024
+
+
+class PooledHTTPServer(http.server.ThreadingHTTPServer):
+    """
+    크기가 제한된 스레드 풀에서 연결을 처리하는 서버
+
+    ThreadingHTTPServer는 연결마다 새 스레드를 만들기 때문에
+    연결이 몰리면 스레드 수가 끝없이 늘어납니다.
+    이 서버는 max_workers개의 스레드만 사용하고 나머지 연결은 풀의 큐에서 대기합니다.
+
+    지속 연결이 다음 요청 없이 쉬고 있으면 스레드를 붙잡지 않도록
+    연결을 셀렉터에 맡겨 두었다가(park) 읽을 데이터가 도착했을 때만 풀에 다시 넣습니다.
+    유휴 시간이 핸들러의 timeout을 넘은 연결은 셀렉터 스레드가 닫습니다.
+    """
+
+    request_queue_size = 1024
+
+    def __init__(self, server_address, handler_class, max_workers=32):
+        super().__init__(server_address, handler_class)
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='http-worker'
+        )
+        # 유휴 연결 대기용 셀렉터 (등록은 셀렉터 스레드에서만 하도록 큐와 깨우기 소켓 사용)
+        self._selector = selectors.DefaultSelector()
+        self._parking = []
+        self._parking_lock = threading.Lock()
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_recv.setblocking(False)
+        self._wakeup_send.setblocking(False)
+        self._selector.register(self._wakeup_recv, selectors.EVENT_READ)
+        self._closing = False
+        self._idle_thread = threading.Thread(target=self._watch_idle, name='http-idle', daemon=True)
+        self._idle_thread.start()
+
+    def process_request(self, request, client_address):
+        """연결 처리를 스레드 풀에 맡깁니다."""
+        self.executor.submit(self.process_request_thread, request, client_address)
+
+    def process_request_thread(self, request, client_address):
+        """연결의 첫 요청을 처리하고, 쉬는 연결이면 셀렉터에 맡깁니다."""
+        try:
+            handler = self.RequestHandlerClass(request, client_address, self)
+        except Exception:
+            self.handle_error(request, client_address)
+            self.shutdown_request(request)
+            return
+        if handler.parked:
+            self.park(handler)
+        else:
+            self.shutdown_request(request)
+
+    def park(self, handler):
+        """다음 요청을 기다리는 연결을 셀렉터 스레드에 맡깁니다."""
+        with self._parking_lock:
+            self._parking.append(handler)
+        try:
+            self._wakeup_send.send(b'\0')
+        except BlockingIOError:
+            # 이미 깨우기 신호가 충분히 쌓여 있음
+            pass
+
+    def _resume(self, handler):
+        """읽을 데이터가 도착한 연결의 요청을 이어서 처리합니다 (풀 스레드에서 실행)."""
+        handler.parked = False
+        try:
+            handler.handle()
+        except ConnectionError:
+            # 쉬는 동안 클라이언트가 연결을 끊은 경우
+            handler.parked = False
+        except Exception:
+            handler.parked = False
+            self.handle_error(handler.request, handler.client_address)
+        if handler.parked:
+            self.park(handler)
+        else:
+            self._close_handler(handler)
+
+    def _close_handler(self, handler):
+        handler.parked = False
+        try:
+            handler.finish()
+        except OSError:
+            pass
+        self.shutdown_request(handler.request)
+
+    def _watch_idle(self):
+        """쉬는 연결을 지켜보다가 요청이 오면 풀에 넘기고, 오래 쉰 연결은 닫습니다."""
+        deadlines = {}
+        while not self._closing:
+            timeout = None
+            if deadlines:
+                timeout = max(0.0, min(deadlines.values()) - time.monotonic())
+            for key, _ in self._selector.select(timeout):
+                if key.fileobj is self._wakeup_recv:
+                    try:
+                        while self._wakeup_recv.recv(4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    continue
+                handler = key.data
+                self._selector.unregister(key.fileobj)
+                deadlines.pop(handler, None)
+                try:
+                    self.executor.submit(self._resume, handler)
+                except RuntimeError:
+                    # 서버 종료 중
+                    self._close_handler(handler)
+
+            with self._parking_lock:
+                parking, self._parking = self._parking, []
+            for handler in parking:
+                self._selector.register(handler.connection, selectors.EVENT_READ, handler)
+                deadlines[handler] = time.monotonic() + handler.timeout
+
+            now = time.monotonic()
+            for handler, deadline in list(deadlines.items()):
+                if deadline <= now:
+                    del deadlines[handler]
+                    self._selector.unregister(handler.connection)
+                    self._close_handler(handler)
+
+        with self._parking_lock:
+            parking, self._parking = self._parking, []
+        for handler in list(deadlines) + parking:
+            self._close_handler(handler)
+        self._selector.close()
+
+    def server_close(self):
+        super().server_close()
+        self._closing = True
+        self._wakeup_send.send(b'\0')
+        self._idle_thread.join()
+        self.executor.shutdown(wait=True)
+        # 종료 중에 대기 상태로 넘어온 연결
+        with self._parking_lock:
+            parking, self._parking = self._parking, []
+        for handler in parking:
+            self._close_handler(handler)
+        self._wakeup_send.close()
+        self._wakeup_recv.close()
+
+
+class AsyncHTTPServer:
+    """
+    asyncio 기반 서버
+
+    하나의 이벤트 루프에서 모든 연결을 처리하며 SimpleHandler와 같은 build_response()를 사용합니다.
+    HTTP/1.1 요청은 기본적으로 연결을 유지하고, 버퍼에 이미 들어온 다음 요청(파이프라이닝)을 이어서 처리합니다.
+    """
+
+    def __init__(self, static_cache, host='', port=8080, access_logger=None,
+                 idle_timeout=15, max_requests_per_connection=100, http11=True):
+        self.static_cache = static_cache
+        self.host = host or None
+        self.port = port
+        self.access_logger = access_logger
+        self.idle_timeout = idle_timeout
+        self.max_requests_per_connection = max_requests_per_connection
+        self.http11 = http11
+
+    async def handle_connection(self, reader, writer):
+        """연결 하나에서 요청을 반복 처리 (지속 연결)"""
+        try:
+            for handled in range(1, self.max_requests_per_connection + 1):
+                try:
+                    # 다음 요청을 idle_timeout초까지만 기다림
+                    request = await asyncio.wait_for(self.read_request(reader), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    return
+                if request is None:
+                    return
+
+                start = time.perf_counter()
+                method, path, version, headers = request
+                keep_alive = self.wants_keep_alive(version, headers)
+                if handled == self.max_requests_per_connection:
+                    keep_alive = False
+
+                if method not in ('GET', 'HEAD'):
+                    response = StaticResponse(501, [('Content-Length', '0')])
+                    keep_alive = False
+                else:
+                    response = build_response(self.static_cache, path, headers, method == 'GET')
+
+                await self.send_response(writer, response, keep_alive, version,
+                                         self.max_requests_per_connection - handled)
+
+                if self.access_logger is not None:
+                    peer = writer.get_extra_info('peername')
+                    self.access_logger.log(
+                        peer[0] if peer else '-', method, path, version,
+                        response.status, response.content_length(), time.perf_counter() - start,
+                        headers.get('User-Agent', '-'), headers.get('Referer', '-')
+                    )
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def read_request(self, reader):
+        """
+        요청 줄과 헤더를 읽습니다.
+
+        Returns:
+            (method, path, version, headers) 또는 연결이 닫혔거나 잘못된 요청이면 None
+        """
+        request_line = await reader.readline()
+        parts = request_line.decode('latin-1').split()
+        if len(parts) != 3:
+            return None
+
+        method, path, version = parts
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().title()] = value.strip()
+
+        # 요청 본문이 있으면 읽어서 버림 (다음 요청과 섞이지 않도록)
+        content_length = int(headers.get('Content-Length', '0') or 0)
+        if content_length:
+            await reader.readexactly(content_length)
+        return method, path, version, headers
+
+    def wants_keep_alive(self, version, headers):
+        """요청 버전과 Connection 헤더로 연결 유지 여부를 결정"""
+        if not self.http11:
+            return False
+        connection = headers.get('Connection', '').lower()
+        if version == 'HTTP/1.1':
+            return connection != 'close'
+        return connection == 'keep-alive'
+
+    async def send_response(self, writer, response, keep_alive, version, remaining):
+        """StaticResponse를 전송"""
+        protocol = 'HTTP/1.1' if self.http11 else 'HTTP/1.0'
+        lines = [f'{protocol} {response.status} {HTTPStatus(response.status).phrase}']
+        lines.append('Server: AsyncHTTP/1.0')
+        lines.append('Date: ' + email.utils.formatdate(usegmt=True))
+        lines.extend(f'{name}: {value}' for name, value in response.headers)
+        if keep_alive:
+            if version == 'HTTP/1.0':
+                lines.append('Connection: keep-alive')
+            lines.append(f'Keep-Alive: timeout={self.idle_timeout:g}, max={remaining}')
+        elif self.http11:
+            lines.append('Connection: close')
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+
+        if response.body:
+            writer.write(response.body)
+        elif response.file_path is not None:
+            await writer.drain()
+            with open(response.file_path, 'rb') as file:
+                # 가능하면 loop.sendfile이 os.sendfile을 사용합니다.
+                await asyncio.get_running_loop().sendfile(writer.transport, file)
+        await writer.drain()
+
+    async def serve_forever(self):
+        server = await asyncio.start_server(self.handle_connection, self.host, self.port, backlog=1024)
+        async with server:
+            await server.serve_forever()
+
+
+def create_server(mode, port, workers=32):
+    """
+    선택한 동시성 모델의 서버를 생성합니다.
+
+    - single: 연결을 하나씩 처리 (socketserver.TCPServer)
+    - threaded: 최대 workers개의 스레드로 처리 (ThreadingHTTPServer + 스레드 풀)
+    - async: 하나의 asyncio 이벤트 루프로 처리
+    """
+    if mode == 'single':
+        return SingleHTTPServer(('', port), SimpleHandler)
+    if mode == 'threaded':
+        return PooledHTTPServer(('', port), SimpleHandler, max_workers=workers)
+    if mode == 'async':
+        return AsyncHTTPServer(
+            SimpleHandler.static_cache,
+            port=port,
+            access_logger=SimpleHandler.access_logger,
+            idle_timeout=SimpleHandler.timeout,
+            max_requests_per_connection=SimpleHandler.max_requests_per_connection,
+            http11=SimpleHandler.protocol_version == 'HTTP/1.1'
+        )
+    raise ValueError(f'알 수 없는 서버 모드: {mode}')
+
+
 def main():
     """메인 함수"""
-    port = 8080
-    
-    print(f'우주 해적 웹서버 시작 - 포트 {port}')
+    parser = argparse.ArgumentParser(description='우주 해적 웹서버')
+    parser.add_argument('--port', type=int, default=8080, help='포트 번호')
+    parser.add_argument('--root', default=DEFAULT_ROOT, help='문서 루트 디렉토리 (기본: 스크립트 옆의 static/)')
+    parser.add_argument('--mode', choices=['single', 'threaded', 'async'], default='threaded',
+                        help='동시성 모델 (single: 순차, threaded: 스레드 풀, async: asyncio)')
+    parser.add_argument('--workers', type=int, default=32, help='threaded 모드의 최대 스레드 수')
+    parser.add_argument('--quiet', action='store_true', help='접근 로그 끄기')
+    parser.add_argument('--access-log', default='-', help='접근 로그 파일 경로 (-: 표준 출력)')
+    parser.add_argument('--log-format', choices=['clf', 'json'], default='clf', help='접근 로그 형식')
+    parser.add_argument('--log-max-bytes', type=int, default=10 * 1024 * 1024,
+                        help='접근 로그 파일 최대 크기 (넘으면 돌려쓰기)')
+    parser.add_argument('--http10', action='store_true', help='HTTP/1.0으로 동작 (요청마다 연결 종료)')
+    parser.add_argument('--keepalive-timeout', type=float, default=15, help='유휴 연결 종료 시간(초)')
+    parser.add_argument('--max-requests', type=int, default=100, help='연결 하나에서 처리할 최대 요청 수')
+    args = parser.parse_args()
+
+    port = args.port
+    SimpleHandler.static_cache = StaticFileCache(args.root)
+    if not args.quiet:
+        SimpleHandler.access_logger = AccessLogger(
+            args.access_log, args.log_format, max_bytes=args.log_max_bytes
+        )
+    SimpleHandler.protocol_version = 'HTTP/1.0' if args.http10 else 'HTTP/1.1'
+    SimpleHandler.timeout = args.keepalive_timeout
+    SimpleHandler.max_requests_per_connection = args.max_requests
+
+    print(f'우주 해적 웹서버 시작 - 포트 {port} ({args.mode} 모드)')
+    print(f'문서 루트: {SimpleHandler.static_cache.root}')
+    print(f'미리 읽어 둔 파일: {SimpleHandler.static_cache.preload()}개')
     print(f'브라우저에서 http://localhost:{port} 접속')
     print('종료: Ctrl+C')
     print('=' * 40)
-    
-    with socketserver.TCPServer(('', port), SimpleHandler) as server:
-        server.serve_forever()
+
+    server = create_server(args.mode, port, args.workers)
+    try:
+        if isinstance(server, AsyncHTTPServer):
+            asyncio.run(server.serve_forever())
+        else:
+            with server:
+                server.serve_forever()
+    except KeyboardInterrupt:
+        print('\n서버를 종료합니다.')
+    finally:
+        if SimpleHandler.access_logger is not None:
+            SimpleHandler.access_logger.close()
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,257 @@
+import email.utils
+import gzip
+import mimetypes
+import os
+import posixpath
+import threading
+import urllib.parse
+
+# brotli는 선택 설치 (pip install brotli), 없으면 gzip만 사용
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 미리 압축해 둘 콘텐츠 종류 (이미지/바이너리는 이미 압축되어 있으므로 제외)
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'application/xml', 'image/svg+xml')
+
+# 이보다 작은 파일은 압축 이득이 거의 없으므로 원본만 제공
+MIN_COMPRESS_SIZE = 256
+
+# 서버가 선호하는 인코딩 순서
+ENCODING_PREFERENCE = ('br', 'gzip')
+
+# 문서 루트 안에 있더라도 제공하지 않는 파일 확장자 (서버 소스 코드 등)
+DENIED_SUFFIXES = ('.py', '.pyc', '.pyo')
+
+
+def parse_accept_encoding(header):
+    """
+    Accept-Encoding 헤더를 {인코딩: q값} 딕셔너리로 변환합니다.
+
+    예) 'gzip, br;q=0.8, *;q=0' -> {'gzip': 1.0, 'br': 0.8, '*': 0.0}
+    """
+    result = {}
+    if not header:
+        return result
+    for item in header.split(','):
+        name, _, params = item.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        result[name] = q
+    return result
+
+
+class CachedFile:
+    """캐시된 정적 파일 한 개의 정보"""
+
+    def __init__(self, path, stat_result, content_type, data=None):
+        self.path = path
+        self.size = stat_result.st_size
+        self.mtime = int(stat_result.st_mtime)
+        # 파일이 바뀌었는지 판단하는 기준 (수정 시각, inode, 크기)
+        self.signature = (stat_result.st_mtime_ns, stat_result.st_ino, stat_result.st_size)
+        self.content_type = content_type
+        # 작은 파일은 인코딩된 바이트를 메모리에 보관, 큰 파일은 None (sendfile로 전송)
+        self.data = data
+        self.etag = '"{:x}-{:x}-{:x}"'.format(stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+        self.last_modified = email.utils.formatdate(self.mtime, usegmt=True)
+        # 미리 압축한 본문 {'br': bytes, 'gzip': bytes} (원본보다 작을 때만 보관)
+        self.encoded = {}
+        # 압축 대상 파일이면 응답에 Vary: Accept-Encoding을 붙여야 함
+        self.compressible = False
+
+    def etag_for(self, encoding):
+        """인코딩별 ETag (같은 URL이라도 표현이 다르면 ETag도 달라야 함)"""
+        if encoding is None:
+            return self.etag
+        return self.etag[:-1] + '-' + encoding + '"'
+
+    def choose_encoding(self, accept_encoding):
+        """
+        Accept-Encoding에 맞춰 보낼 인코딩을 고릅니다.
+
+        Returns:
+            'br', 'gzip' 또는 원본을 보낼 때 None
+        """
+        if not self.encoded or not accept_encoding:
+            return None
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get('*', 0.0)
+        best, best_q = None, 0.0
+        for encoding in ENCODING_PREFERENCE:
+            if encoding not in self.encoded:
+                continue
+            q = accepted.get(encoding, wildcard)
+            if q > best_q:
+                best, best_q = encoding, q
+        return best
+
+    def is_not_modified(self, if_none_match, if_modified_since, encoding=None):
+        """조건부 요청 헤더를 확인하여 304 응답이 가능한지 반환합니다."""
+        # If-None-Match가 있으면 If-Modified-Since보다 우선 (RFC 9110)
+        if if_none_match:
+            if if_none_match.strip() == '*':
+                return True
+            etag = self.etag_for(encoding)
+            tags = [tag.strip() for tag in if_none_match.split(',')]
+            return etag in tags or ('W/' + etag) in tags
+
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            if since is None:
+                return False
+            return self.mtime <= int(since.timestamp())
+
+        return False
+
+
+class StaticFileCache:
+    """
+    문서 루트의 정적 파일 캐시
+
+    - max_cached_size 이하의 파일은 바이트 그대로 메모리에 보관합니다.
+      매 요청마다 파일을 열어 디코딩/인코딩하지 않습니다.
+    - 요청마다 os.stat()으로 수정 시각/inode/크기를 비교하여 바뀐 파일만 다시 읽습니다.
+    - 더 큰 파일은 메타데이터만 보관하고 본문은 sendfile로 전송합니다.
+    - 텍스트 파일은 읽을 때 한 번만 gzip/brotli로 압축해 두고
+      요청마다 Accept-Encoding에 맞는 것을 골라 보냅니다 (요청 중 압축 없음).
+    - 점(.)으로 시작하는 파일/디렉터리와 denied_suffixes 확장자 파일은 제공하지 않습니다.
+    """
+
+    def __init__(self, root, index_file='index.html', max_cached_size=256 * 1024,
+                 denied_suffixes=DENIED_SUFFIXES):
+        self.root = os.path.realpath(root)
+        self.index_file = index_file
+        self.max_cached_size = max_cached_size
+        self.denied_suffixes = tuple(denied_suffixes)
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, request_path):
+        """
+        요청 경로를 문서 루트 안의 실제 파일 경로로 변환합니다.
+
+        문서 루트 밖을 가리키는 경로(../ 등)와 제공하지 않는 파일은 None을 반환합니다.
+        """
+        path = urllib.parse.urlsplit(request_path).path
+        path = posixpath.normpath(urllib.parse.unquote(path))
+        parts = [part for part in path.split('/') if part and part not in ('.', '..')]
+        full_path = os.path.realpath(os.path.join(self.root, *parts))
+
+        if full_path != self.root and not full_path.startswith(self.root + os.sep):
+            return None
+        if os.path.isdir(full_path):
+            full_path = os.path.join(full_path, self.index_file)
+        # 심볼릭 링크를 따라간 실제 경로 기준으로 확인
+        if not self.is_public(os.path.relpath(full_path, self.root)):
+            return None
+        return full_path
+
+    def is_public(self, relative_path):
+        """문서 루트 기준 상대 경로의 파일을 제공해도 되는지 확인합니다."""
+        parts = relative_path.split(os.sep)
+        if any(part.startswith('.') for part in parts):
+            return False
+        return not parts[-1].lower().endswith(self.denied_suffixes)
+
+    def get(self, request_path):
+        """
+        요청 경로에 해당하는 CachedFile을 반환합니다.
+
+        Raises:
+            FileNotFoundError: 파일이 없거나 문서 루트 밖을 가리키거나 제공하지 않는 파일인 경우
+        """
+        full_path = self.resolve(request_path)
+        if full_path is None:
+            raise FileNotFoundError(request_path)
+
+        stat_result = os.stat(full_path)
+        signature = (stat_result.st_mtime_ns, stat_result.st_ino, stat_result.st_size)
+
+        entry = self._entries.get(full_path)
+        if entry is not None and entry.signature == signature:
+            return entry
+
+        entry = self._load(full_path, stat_result)
+        with self._lock:
+            self._entries[full_path] = entry
+        return entry
+
+    def preload(self):
+        """
+        시작 시 문서 루트의 파일을 미리 읽고 압축해 둡니다.
+        첫 요청이 압축 비용을 치르지 않도록 합니다.
+
+        Returns:
+            캐시에 올린 파일 수
+        """
+        count = 0
+        for directory, dirnames, filenames in os.walk(self.root):
+            # 숨김 디렉터리(.git 등)는 내려가지 않음
+            dirnames[:] = [name for name in dirnames if not name.startswith('.')]
+            for filename in filenames:
+                full_path = os.path.join(directory, filename)
+                if not self.is_public(os.path.relpath(full_path, self.root)):
+                    continue
+                try:
+                    stat_result = os.stat(full_path)
+                    entry = self._load(full_path, stat_result)
+                except OSError:
+                    continue
+                with self._lock:
+                    self._entries[full_path] = entry
+                count += 1
+        return count
+
+    def _load(self, full_path, stat_result):
+        """파일을 읽어 CachedFile을 만듭니다."""
+        content_type, _ = mimetypes.guess_type(full_path)
+        if content_type is None:
+            content_type = 'application/octet-stream'
+        if content_type.startswith('text/') or content_type in ('application/javascript', 'application/json'):
+            content_type += '; charset=utf-8'
+
+        data = None
+        if stat_result.st_size <= self.max_cached_size:
+            with open(full_path, 'rb') as file:
+                # 열린 파일 기준으로 다시 stat하여 읽은 내용과 서명이 어긋나지 않도록 합니다.
+                stat_result = os.fstat(file.fileno())
+                data = file.read()
+
+        entry = CachedFile(full_path, stat_result, content_type, data)
+        if data is not None and content_type.startswith(COMPRESSIBLE_TYPES):
+            entry.compressible = True
+            if len(data) >= MIN_COMPRESS_SIZE:
+                entry.encoded = compress_variants(data)
+        return entry
+
+
+def compress_variants(data):
+    """
+    원본 바이트를 gzip(및 가능하면 brotli)으로 압축합니다.
+
+    파일이 바뀔 때 한 번만 실행되므로 가장 높은 압축 수준을 사용합니다.
+    원본보다 작아지는 경우만 반환합니다.
+    """
+    variants = {}
+    # mtime=0: 같은 내용이면 항상 같은 압축 결과가 나오도록 함
+    gzipped = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(gzipped) < len(data):
+        variants['gzip'] = gzipped
+    if brotli is not None:
+        compressed = brotli.compress(data, quality=11)
+        if len(compressed) < len(data):
+            variants['br'] = compressed
+    return variants
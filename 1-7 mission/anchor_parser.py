@@ -0,0 +1,70 @@
+"""
+HTML에서 링크(<a>) 텍스트만 뽑아내는 파서 모음
+
+헤드라인 추출에는 <a> 텍스트만 필요하므로 페이지 전체 트리를 만들 필요가 없습니다.
+
+- html.parser: BeautifulSoup + html.parser로 전체 트리 생성 (기존 방식, 가장 느림)
+- strainer: BeautifulSoup + SoupStrainer('a')로 <a> 태그만 트리에 남김
+- lxml: lxml.html(C 구현)로 파싱 후 <a>만 순회 (가장 빠름, lxml 설치 필요)
+
+사용법:
+    for text in extract_anchor_texts(html, 'lxml'):
+        ...
+"""
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml은 선택 설치 (pip install lxml), 없으면 strainer 사용
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+ANCHORS_ONLY = SoupStrainer('a')
+
+
+def _html_parser_texts(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    for link in soup.find_all('a'):
+        yield link.get_text().strip()
+
+
+def _strainer_texts(html):
+    soup = BeautifulSoup(html, 'html.parser', parse_only=ANCHORS_ONLY)
+    for link in soup.find_all('a'):
+        yield link.get_text().strip()
+
+
+def _lxml_texts(html):
+    if not html.strip():
+        return
+    document = lxml.html.fromstring(html)
+    for link in document.iter('a'):
+        yield link.text_content().strip()
+
+
+PARSERS = {
+    'html.parser': _html_parser_texts,
+    'strainer': _strainer_texts,
+}
+if lxml is not None:
+    PARSERS['lxml'] = _lxml_texts
+
+DEFAULT_PARSER = 'lxml' if lxml is not None else 'strainer'
+
+
+def extract_anchor_texts(html, parser=None):
+    """
+    HTML의 모든 <a> 태그 텍스트(앞뒤 공백 제거)를 문서 순서대로 반환합니다.
+
+    Args:
+        html: HTML 문자열
+        parser: 'html.parser', 'strainer', 'lxml' 중 하나 (None이면 사용 가능한 가장 빠른 파서)
+
+    Raises:
+        ValueError: 알 수 없거나 설치되지 않은 파서 이름
+    """
+    name = parser or DEFAULT_PARSER
+    backend = PARSERS.get(name)
+    if backend is None:
+        raise ValueError(f'사용할 수 없는 파서: {name} (가능: {", ".join(PARSERS)})')
+    return backend(html)
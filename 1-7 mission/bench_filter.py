@@ -0,0 +1,111 @@
+"""
+헤드라인 필터 처리량 벤치마크
+
+기존 필터 루프(링크마다 정규식 처리, 리스트 포함 검사, 키워드별 any(),
+리스트 기반 중복 제거)와 headline_filter.HeadlineFilter를 같은 입력으로 비교합니다.
+
+입력은 fixtures/*.html의 <a> 텍스트를 반복해서 늘리거나,
+fixture가 없으면 가상 텍스트를 생성하여 사용합니다.
+
+실행 방법: python bench_filter.py [파일 ...] [--texts 200000] [--unique 20000]
+"""
+import argparse
+import glob
+import os
+import random
+import re
+import time
+
+from anchor_parser import extract_anchor_texts
+from headline_filter import DEFAULT_STOPWORDS, HeadlineFilter
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(HERE, 'fixtures')
+
+
+def legacy_filter(texts):
+    """기존 crawling_KBS.py의 필터 루프를 그대로 옮긴 것 (비교 기준, headline_filter의 값을 쓰지 않음)"""
+    headlines = []
+
+    for text in texts:
+        time_pattern = r'^\d{1,2}:\d{2}'
+
+        if (text and
+            len(text) > 10 and
+            len(text) < 150 and
+            not text.startswith('http') and
+            not re.match(time_pattern, text) and
+            not text in ['더보기', 'ON AIR', 'English', '재난포털', '제보', '로그인', '회원가입', '메뉴', '검색'] and
+            any(keyword in text for keyword in ['…', '·', ':', '(', ')', '"', ''', ''', '대통령', '정부', '국회', '경제', '사회', '정치', '국제', '북한', '중국', '미국', '일본'])):
+            headlines.append(text)
+
+    unique_headlines = []
+    for headline in headlines:
+        if headline not in unique_headlines:
+            unique_headlines.append(headline)
+
+    return unique_headlines
+
+
+def synthetic_texts(count, unique, seed=0):
+    """메뉴, 시각, 기사 제목이 섞인 가상 <a> 텍스트 count개 (서로 다른 텍스트는 unique개)"""
+    rng = random.Random(seed)
+    words = ['대통령', '정부', '국회', '경제', '사회', '정치', '국제', '북한', '중국', '미국', '일본',
+             '날씨', '스포츠', '문화', '발표', '논의', '확대', '추진', '우려', '전망', '지역', '교육']
+    pool = list(DEFAULT_STOPWORDS)
+    while len(pool) < unique:
+        title = ' '.join(rng.choice(words[11:]) for _ in range(rng.randint(2, 9)))
+        kind = rng.random()
+        if kind < 0.2:
+            title = f'{rng.randint(0, 23)}:{rng.randint(0, 59):02d} {title}'
+        elif kind < 0.6:
+            title = f'{rng.choice(words[:11])} {title}'
+        elif kind < 0.7:
+            title = f'"{title}"'
+        elif kind < 0.8:
+            # 쉼표+공백은 키워드, 작은따옴표(‘ ’)는 키워드가 아님
+            title = f'‘{title}’, {rng.choice(words[11:])}' if kind < 0.75 else f'‘{title}’'
+        pool.append(f'{title} {len(pool)}')
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def load_texts(paths, count):
+    """fixture의 <a> 텍스트를 count개가 될 때까지 반복합니다."""
+    texts = []
+    for path in paths:
+        with open(path, encoding='utf-8') as file:
+            texts.extend(extract_anchor_texts(file.read()))
+    if not texts:
+        return []
+    return (texts * (count // len(texts) + 1))[:count]
+
+
+def timed(function, texts):
+    started = time.perf_counter()
+    result = function(texts)
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='헤드라인 필터 처리량 벤치마크')
+    parser.add_argument('fixtures', nargs='*', help='HTML 파일 (기본: fixtures/*.html)')
+    parser.add_argument('--texts', type=int, default=200000, help='입력 텍스트 수')
+    parser.add_argument('--unique', type=int, default=20000, help='가상 입력의 서로 다른 텍스트 수')
+    args = parser.parse_args()
+
+    paths = args.fixtures or sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.html')))
+    texts = load_texts(paths, args.texts) or synthetic_texts(args.texts, args.unique)
+
+    pipeline = HeadlineFilter()
+    new_time, new_result = timed(pipeline.apply, texts)
+    old_time, old_result = timed(legacy_filter, texts)
+
+    print(f'입력 텍스트: {len(texts)}개, 추출된 헤드라인: {len(new_result)}개')
+    print(f'{"filter":<12}{"seconds":>10}{"texts/s":>14}')
+    print(f'{"legacy":<12}{old_time:>10.3f}{len(texts) / old_time:>14.0f}')
+    print(f'{"pipeline":<12}{new_time:>10.3f}{len(texts) / new_time:>14.0f}')
+    print(f'속도 향상: {old_time / new_time:.1f}배, 결과 일치: {old_result == new_result}')
+
+
+if __name__ == '__main__':
+    main()
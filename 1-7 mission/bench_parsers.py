@@ -0,0 +1,114 @@
+"""
+헤드라인 추출 파서 벤치마크
+
+저장해 둔 페이지(fixtures/*.html)와 가상 페이지를 파서별로 반복 파싱하여
+평균 파싱 시간과 최대 메모리 사용량(tracemalloc)을 비교하고,
+모든 파서가 같은 헤드라인을 뽑는지 확인합니다.
+
+- fixtures/kbs_main.html, kbs_category.html: KBS 뉴스 메인/분야별 목록 구조를 본뜬 테스트용 페이지
+  (--save-fixture로 저장한 실제 페이지도 같은 폴더에 두면 함께 측정)
+- synthetic: 메뉴, 스크립트, 기사 목록만 단순하게 반복한 가상 페이지
+
+실행 방법:
+    python bench_parsers.py --save-fixture          # 현재 KBS 메인 페이지를 fixtures/에 저장
+    python bench_parsers.py [파일 ...] [--repeat 20]
+"""
+import argparse
+import glob
+import os
+import random
+import time
+import tracemalloc
+
+from anchor_parser import PARSERS
+from crawling_KBS import KBS_URL, parse_kbs_headlines
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(HERE, 'fixtures')
+
+
+def synthetic_page(anchors=800, seed=0):
+    """KBS 메인과 비슷하게 메뉴, 스크립트, 기사 목록이 섞인 가상 페이지를 만듭니다."""
+    rng = random.Random(seed)
+    words = ['대통령', '정부', '국회', '경제', '사회', '정치', '국제', '북한', '중국', '미국', '일본',
+             '날씨', '스포츠', '문화', '발표', '논의', '확대', '추진', '우려', '전망']
+    parts = ['<!DOCTYPE html><html><head><meta charset="utf-8"><title>KBS 뉴스</title>',
+             '<style>' + '.a{color:red}' * 200 + '</style>',
+             '<script>' + 'var x = "<a>not a link</a>";' * 100 + '</script></head><body>']
+    parts.append('<nav>' + ''.join(f'<a href="/menu/{name}">{name}</a>'
+                                   for name in ['더보기', 'ON AIR', 'English', '재난포털', '제보', '로그인']) + '</nav>')
+    for index in range(anchors):
+        title = ' '.join(rng.choice(words) for _ in range(rng.randint(3, 8)))
+        if index % 5 == 0:
+            title = f'{rng.randint(0, 23)}:{rng.randint(0, 59):02d} {title}'
+        elif index % 3 == 0:
+            title = f'"{title}"…{rng.choice(words)}·{rng.choice(words)}'
+        parts.append(
+            f'<div class="box"><ul><li><a href="/news/view.do?ncd={index}">'
+            f'<span class="txt">{title}</span></a><p class="desc">{title * 3}</p></li></ul></div>'
+        )
+    parts.append('</body></html>')
+    return ''.join(parts)
+
+
+def measure(backend, html, repeat):
+    """평균 파싱 시간(ms)과 최대 메모리(KB), 결과 헤드라인 목록을 반환합니다."""
+    headlines = parse_kbs_headlines(html, backend)
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        parse_kbs_headlines(html, backend)
+    elapsed = (time.perf_counter() - started) / repeat
+
+    tracemalloc.start()
+    parse_kbs_headlines(html, backend)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed * 1000, peak / 1024, headlines
+
+
+def save_fixture():
+    import requests
+    response = requests.get(KBS_URL, timeout=10)
+    response.raise_for_status()
+    response.encoding = 'utf-8'
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    path = os.path.join(FIXTURE_DIR, time.strftime('kbs_main_%Y%m%d.html'))
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(response.text)
+    print(f'저장: {path} ({len(response.text)}자)')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='헤드라인 추출 파서 벤치마크')
+    parser.add_argument('fixtures', nargs='*', help='HTML 파일 (기본: fixtures/*.html)')
+    parser.add_argument('--repeat', type=int, default=20, help='파서별 반복 횟수')
+    parser.add_argument('--parsers', nargs='+', default=list(PARSERS), choices=list(PARSERS))
+    parser.add_argument('--save-fixture', action='store_true', help='현재 KBS 메인 페이지를 fixtures/에 저장')
+    args = parser.parse_args()
+
+    if args.save_fixture:
+        save_fixture()
+        return
+
+    pages = []
+    for path in args.fixtures or sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.html'))):
+        with open(path, encoding='utf-8') as file:
+            pages.append((os.path.basename(path), file.read()))
+    pages.append(('synthetic', synthetic_page()))
+
+    print(f'{"page":<24}{"parser":<14}{"ms/parse":>10}{"peak KB":>10}{"headlines":>11}')
+    for name, html in pages:
+        expected = None
+        for backend in args.parsers:
+            elapsed, peak, headlines = measure(backend, html, args.repeat)
+            mark = ''
+            if expected is None:
+                expected = headlines
+            elif headlines != expected:
+                mark = '  (결과 다름)'
+            print(f'{name[:23]:<24}{backend:<14}{elapsed:>10.2f}{peak:>10.0f}{len(headlines):>11}{mark}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""crawler_engine 동작 확인 스크립트.
+
+http_standin의 로컬 서버를 띄워 놓고 다음을 확인합니다 (실제 사이트에 요청하지 않음).
+- 연결 재사용: 같은 호스트에 요청 20개를 보내도 TCP 연결은 per_host_limit개 이하
+- 재시도: 503 두 번 뒤 성공하면 3번째 시도에 성공, 계속 500이면 retries+1번 시도 후 오류,
+  429의 Retry-After를 따름, 404는 재시도하지 않음
+- 동시성: 호스트별 동시 요청 수가 per_host_limit를 넘지 않고,
+  느린 호스트가 있어도 다른 호스트의 결과는 먼저 끝남
+- 캐시: 두 번째 요청은 304(not-modified), 본문이 바뀌면 다시 파싱(miss), max-age 안이면 요청 없음(fresh)
+
+실행 방법: python check_crawler_engine.py
+"""
+
+import json
+import sys
+import tempfile
+import time
+
+import requests
+
+from crawler_engine import CrawlerEngine, Source
+from http_cache import HttpCache
+from http_standin import start_standin
+
+failures = []
+
+
+def check(name, condition, detail=''):
+    print(f'{"OK  " if condition else "FAIL"} {name}' + (f' ({detail})' if detail else ''))
+    if not condition:
+        failures.append(name)
+
+
+def title(text):
+    start = text.find('<p>')
+    return text[start + 3:text.find('</p>', start)]
+
+
+def check_pooling(base, state):
+    state.reset()
+    with CrawlerEngine(max_workers=8, per_host_limit=2, retries=0) as engine:
+        results = engine.crawl([Source(f'page{i}', f'{base}/page/a', title) for i in range(20)])
+    stats = state.stats()
+    check('연결 재사용: 모든 요청 성공', all(result.ok for result in results))
+    check('연결 재사용: TCP 연결 수 <= per_host_limit', stats['connections'] <= 2,
+          f'요청 {stats["requests"]}개, 연결 {stats["connections"]}개')
+
+
+def check_retry(base, state):
+    state.reset()
+    with CrawlerEngine(retries=3, backoff=0.05, max_backoff=1.0) as engine:
+        flaky, failing, limited, missing = engine.crawl([
+            Source('flaky', f'{base}/flaky/x?fail=2&status=503', title),
+            Source('failing', f'{base}/status/500', title),
+            Source('limited', f'{base}/flaky/y?fail=1&status=429', title),
+            Source('missing', f'{base}/status/404', title),
+        ])
+    check('재시도: 503 두 번 뒤 성공', flaky.ok and flaky.attempts == 3, repr(flaky))
+    check('재시도: 계속 500이면 retries+1번 시도 후 오류', not failing.ok and failing.attempts == 4
+          and failing.status == 500, repr(failing))
+    check('재시도: 429 뒤 성공', limited.ok and limited.attempts == 2, repr(limited))
+    check('재시도: 404는 한 번만 시도', not missing.ok and missing.attempts == 1, repr(missing))
+
+    with CrawlerEngine(retries=1, backoff=0.01, max_backoff=5.0) as engine:
+        started = time.perf_counter()
+        result = engine.crawl([Source('retry-after', f'{base}/status/429?retry_after=1', title)])[0]
+        elapsed = time.perf_counter() - started
+    check('재시도: Retry-After(1초)를 따름', not result.ok and elapsed >= 1.0, f'{elapsed:.2f}초')
+
+
+def check_concurrency(base, other_base, state):
+    state.reset()
+    with CrawlerEngine(max_workers=8, per_host_limit=2, retries=0) as engine:
+        futures = [engine.submit(Source(f'slow{i}', f'{base}/slow?delay=0.5', title)) for i in range(4)]
+        fast = engine.submit(Source('fast', f'{other_base}/page/b', title))
+        fast_result = fast.result()
+        slow_results = [future.result() for future in futures]
+    max_in_flight = state.stats()['max_in_flight']
+    check('동시성: 호스트별 동시 요청 <= per_host_limit', max(max_in_flight.values()) <= 2,
+          f'호스트별 최대 {max_in_flight}')
+    check('동시성: 느린 요청 4개는 2개씩 두 번에 처리', 0.9 <= max(r.elapsed for r in slow_results) < 2.0,
+          f'{max(r.elapsed for r in slow_results):.2f}초')
+    check('동시성: 다른 호스트의 빠른 요청은 기다리지 않음', fast_result.ok and fast_result.elapsed < 0.3,
+          f'{fast_result.elapsed:.2f}초')
+
+
+def check_cache(base, state):
+    state.reset()
+    parsed = []
+
+    def parse(text):
+        parsed.append(text)
+        return title(text)
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = HttpCache(directory)
+        with CrawlerEngine(cache=cache, retries=0) as engine:
+            source = Source('c', f'{base}/page/c', parse)
+            first = engine.crawl([source])[0]
+            second = engine.crawl([source])[0]
+            requests.get(f'{base}/change/c', timeout=5)
+            third = engine.crawl([source])[0]
+
+            fresh_source = Source('d', f'{base}/page/d?max_age=60', parse)
+            engine.crawl([fresh_source])
+            requests_before = state.stats()['requests']
+            fresh = engine.crawl([fresh_source])[0]
+            requests_after = state.stats()['requests']
+
+    check('캐시: 첫 요청은 miss', first.cache == 'miss' and first.value == 'c v0', repr(first))
+    check('캐시: 두 번째는 304로 파싱 없이 같은 결과', second.cache == 'not-modified' and second.value == 'c v0'
+          and state.stats()['not_modified'] >= 1, repr(second))
+    check('캐시: 본문이 바뀌면 다시 파싱', third.cache == 'miss' and third.value == 'c v1', repr(third))
+    check('캐시: 파싱 횟수', len(parsed) == 3, f'{len(parsed)}번')
+    check('캐시: max-age 안에서는 요청 없음', fresh.cache == 'fresh' and requests_after == requests_before,
+          repr(fresh))
+
+
+def main():
+    server, state = start_standin()
+    port = server.server_address[1]
+    # 호스트별 제한을 확인하기 위해 같은 서버를 다른 이름(netloc)으로도 사용
+    base = f'http://127.0.0.1:{port}'
+    other_base = f'http://localhost:{port}'
+    try:
+        check_pooling(base, state)
+        check_retry(base, state)
+        check_concurrency(base, other_base, state)
+        check_cache(base, state)
+    finally:
+        server.shutdown()
+    print(json.dumps({'failed': failures}, ensure_ascii=False))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+"""
+주기적으로 헤드라인을 수집하는 크롤링 데몬
+
+- 출처마다 수집 주기와 지터(주기의 ±비율)를 따로 설정
+- 수집한 헤드라인은 SQLite(headline_store)에 저장하고, 새 헤드라인만 추가됨
+- HTTP 캐시를 사용하므로 페이지가 바뀌지 않았으면 304 응답만 받고 다시 파싱하지 않음
+  (저장은 항상 시도하므로 저장소를 바꾸거나 이전 저장이 실패했어도 헤드라인이 빠지지 않음)
+
+실행 방법:
+    python crawl_daemon.py run [--source kbs=300] [--jitter 0.1] [--db headlines.db]
+    python crawl_daemon.py run --once
+    python crawl_daemon.py query [--since 2026-10-01] [--until 2026-10-02T12:00] [--source kbs] [--keyword 경제]
+"""
+import argparse
+import heapq
+import random
+import signal
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from crawler_engine import CrawlerEngine
+from crawling_KBS import kbs_source
+from headline_store import HeadlineStore
+from http_cache import HttpCache
+
+# 수집할 수 있는 출처: 이름 -> Source를 만드는 함수
+SOURCE_FACTORIES = {
+    'kbs': kbs_source,
+}
+
+# 캐시 상태가 이 값이면 본문이 바뀌지 않았음 (저장된 파싱 결과를 그대로 씀)
+UNCHANGED_STATES = frozenset({'fresh', 'not-modified', 'unchanged'})
+
+
+class ScheduledSource:
+    """주기적으로 수집할 출처 하나"""
+
+    def __init__(self, source, interval, jitter=0.1):
+        """
+        Args:
+            source: crawler_engine.Source
+            interval: 수집 주기(초)
+            jitter: 주기에 더할 무작위 비율 (0.1이면 ±10%), 여러 출처가 같은 시각에 몰리지 않도록 함
+        """
+        self.source = source
+        self.interval = interval
+        self.jitter = jitter
+
+    def next_delay(self):
+        return self.interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+class CrawlScheduler:
+    """
+    출처별 다음 실행 시각을 힙으로 관리하는 스케줄러
+
+    실행할 시각이 된 출처들을 모아 CrawlerEngine으로 동시에 수집하고 저장합니다.
+    """
+
+    def __init__(self, jobs, engine, store, log=print):
+        self.jobs = jobs
+        self.engine = engine
+        self.store = store
+        self.log = log
+        self._stop = threading.Event()
+        # (다음 실행 시각, 순번, 작업) - 순번은 시각이 같을 때 비교용
+        self._queue = [(time.time(), index, job) for index, job in enumerate(jobs)]
+        heapq.heapify(self._queue)
+
+    def stop(self):
+        self._stop.set()
+
+    def run(self, once=False):
+        """stop()이 호출될 때까지 (once면 한 번만) 수집을 반복합니다."""
+        while not self._stop.is_set():
+            next_time = self._queue[0][0]
+            if self._stop.wait(max(0.0, next_time - time.time())):
+                break
+
+            now = time.time()
+            due = []
+            while self._queue and self._queue[0][0] <= now:
+                due.append(heapq.heappop(self._queue))
+
+            self.run_jobs([job for _, _, job in due])
+
+            for _, index, job in due:
+                heapq.heappush(self._queue, (time.time() + job.next_delay(), index, job))
+            if once:
+                break
+
+    def run_jobs(self, jobs):
+        results = self.engine.crawl([job.source for job in jobs])
+        for result in results:
+            name = result.source.name
+            if not result.ok:
+                self.log(f'[{name}] 수집 실패: {result.error}')
+                continue
+            # 본문이 바뀌지 않았어도 저장은 건너뛰지 않음: 캐시는 저장소와 따로 관리되므로
+            # 다른 --db를 쓰거나 캐시 저장 뒤 store.add 전에 중단되었다면 저장소에 없는 헤드라인일 수 있음
+            # (이미 저장된 헤드라인은 INSERT OR IGNORE로 건너뛰므로 비용이 크지 않음)
+            try:
+                inserted = self.store.add(name, result.value)
+            except sqlite3.Error as error:
+                # 한 출처의 저장 실패로 데몬 전체가 멈추지 않도록 기록만 하고 다음 주기에 다시 시도
+                self.log(f'[{name}] 저장 실패: {error}')
+                continue
+            if result.cache in UNCHANGED_STATES and not inserted:
+                self.log(f'[{name}] 변경 없음 ({result.cache})')
+            else:
+                self.log(f'[{name}] 헤드라인 {len(result.value)}개 중 새 헤드라인 {inserted}개 저장')
+
+
+def parse_time(value):
+    """'2026-10-01' 또는 '2026-10-01T12:00' 형식을 유닉스 시각으로 변환합니다."""
+    return datetime.fromisoformat(value).timestamp() if value else None
+
+
+def parse_source(value):
+    """'kbs=300' 형식을 (이름, 주기) 로 변환합니다."""
+    name, _, interval = value.partition('=')
+    if name not in SOURCE_FACTORIES:
+        raise argparse.ArgumentTypeError(f'알 수 없는 출처: {name} (가능: {", ".join(SOURCE_FACTORIES)})')
+    try:
+        return name, float(interval or 300)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'잘못된 주기: {value}')
+
+
+def run(args):
+    jobs = [ScheduledSource(SOURCE_FACTORIES[name](), interval, args.jitter)
+            for name, interval in (args.source or [('kbs', 300.0)])]
+    store = HeadlineStore(args.db)
+    with CrawlerEngine(cache=HttpCache(args.cache_dir)) as engine:
+        scheduler = CrawlScheduler(jobs, engine, store,
+                                   log=lambda message: print(time.strftime('%Y-%m-%d %H:%M:%S'), message))
+        # Ctrl+C, kill 모두 현재 수집을 마친 뒤 종료
+        signal.signal(signal.SIGTERM, lambda *_: scheduler.stop())
+        signal.signal(signal.SIGINT, lambda *_: scheduler.stop())
+        print(f'크롤링 데몬 시작 - 출처 {len(jobs)}개, 저장소 {args.db}')
+        scheduler.run(once=args.once)
+    print(f'종료 - 저장된 헤드라인 {store.count()}개')
+    store.close()
+
+
+def query(args):
+    with HeadlineStore(args.db) as store:
+        rows = store.query(parse_time(args.since), parse_time(args.until), args.source, args.keyword, args.limit)
+    for row in rows:
+        seen = datetime.fromtimestamp(row['first_seen']).strftime('%Y-%m-%d %H:%M')
+        print(f'{seen} [{row["source"]}] {row["title"]}')
+    print(f'{len(rows)}개')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='헤드라인 크롤링 데몬')
+    parser.add_argument('--db', default='headlines.db', help='헤드라인 저장소(SQLite) 경로')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='주기적으로 수집')
+    run_parser.add_argument('--source', action='append', type=parse_source,
+                            help='수집할 출처와 주기(초), 예: kbs=300 (여러 번 지정 가능)')
+    run_parser.add_argument('--jitter', type=float, default=0.1, help='주기에 더할 무작위 비율')
+    run_parser.add_argument('--cache-dir', default='.http_cache', help='HTTP 캐시 디렉토리')
+    run_parser.add_argument('--once', action='store_true', help='한 번만 수집하고 종료')
+    run_parser.set_defaults(handler=run)
+
+    query_parser = commands.add_parser('query', help='저장된 헤드라인 조회')
+    query_parser.add_argument('--since', help='이 시각 이후 (예: 2026-10-01 또는 2026-10-01T09:00)')
+    query_parser.add_argument('--until', help='이 시각 이전')
+    query_parser.add_argument('--source', help='출처 이름')
+    query_parser.add_argument('--keyword', help='제목에 포함된 단어')
+    query_parser.add_argument('--limit', type=int, default=100, help='최대 개수')
+    query_parser.set_defaults(handler=query)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,278 @@
+"""
+여러 사이트를 동시에 가져오는 크롤러 엔진
+
+- requests.Session 하나를 스레드 풀이 함께 사용하여 연결(DNS/TCP/TLS)을 재사용
+- 호스트별 동시 요청 수 제한 (한 사이트에 요청이 몰리지 않도록)
+- 연결/읽기 타임아웃과 지수 백오프 재시도 (연결 오류, 429, 5xx)
+- 느린 사이트가 있어도 다른 사이트의 결과는 먼저 끝남
+- cache(http_cache.HttpCache)를 주면 조건부 요청으로 바뀌지 않은 페이지는 다시 받거나 파싱하지 않음
+"""
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_cache import CacheEntry, content_hash, is_storable
+
+DEFAULT_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+
+# 재시도할 HTTP 상태 코드
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class Source:
+    """
+    크롤링 대상 하나
+
+    Args:
+        name: 결과를 구분할 이름
+        url: 가져올 주소
+        parse: 응답 본문(str)을 받아 결과를 반환하는 함수 (캐시를 쓰면 결과는 JSON으로 저장 가능해야 함)
+        headers: 이 대상에만 추가로 보낼 헤더
+        encoding: 응답 인코딩을 강제할 때 지정 (예: 'utf-8')
+        cache_key: 캐시에 파싱 결과를 저장할 키 (파서/규칙이 바뀌면 다른 키를 사용, 기본: name)
+    """
+
+    def __init__(self, name, url, parse, headers=None, encoding=None, cache_key=None):
+        self.name = name
+        self.url = url
+        self.parse = parse
+        self.headers = headers or {}
+        self.encoding = encoding
+        self.cache_key = cache_key or name
+
+
+class CrawlResult:
+    """대상 하나의 크롤링 결과"""
+
+    def __init__(self, source, value=None, status=None, error=None, attempts=0, elapsed=0.0, cache=None):
+        self.source = source
+        self.value = value
+        self.status = status
+        self.error = error
+        self.attempts = attempts
+        self.elapsed = elapsed
+        # 캐시 사용 결과: 'fresh'(요청 없음), 'not-modified'(304), 'unchanged'(본문 동일, 파싱 생략),
+        # 'miss'(새로 파싱), None(캐시 사용 안 함)
+        self.cache = cache
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        state = 'ok' if self.ok else f'error={self.error!r}'
+        cache = f' cache={self.cache}' if self.cache else ''
+        return f'<CrawlResult {self.source.name} status={self.status} {state}{cache} {self.elapsed:.2f}s>'
+
+
+class CrawlerEngine:
+    """
+    연결 풀을 공유하는 스레드 풀 기반 크롤러
+
+    사용법:
+        with CrawlerEngine() as engine:
+            results = engine.crawl([Source('kbs', KBS_URL, parse_kbs), ...])
+    """
+
+    def __init__(self, max_workers=8, per_host_limit=2, timeout=(3.05, 10), retries=3,
+                 backoff=0.5, max_backoff=8.0, headers=None, cache=None):
+        """
+        Args:
+            max_workers: 동시에 실행할 최대 요청 수
+            per_host_limit: 호스트 하나에 동시에 보낼 최대 요청 수
+            timeout: (연결 타임아웃, 읽기 타임아웃) 초
+            retries: 실패 시 재시도 횟수
+            backoff: 첫 재시도 대기 시간(초), 이후 두 배씩 증가 (+ 무작위 지터)
+            max_backoff: 재시도 대기 시간 상한(초)
+            headers: 모든 요청에 보낼 기본 헤더
+            cache: 조건부 요청과 파싱 결과 재사용에 쓸 http_cache.HttpCache (None이면 사용 안 함)
+        """
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.cache = cache
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS if headers is None else headers)
+        # 호스트당 연결을 per_host_limit개까지 유지하여 재사용
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max(per_host_limit, 1))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='crawler')
+        self._host_limits = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+    def _host_limit(self, url):
+        """호스트별 동시 요청 수를 제한하는 세마포어"""
+        host = urlsplit(url).netloc
+        with self._lock:
+            limit = self._host_limits.get(host)
+            if limit is None:
+                limit = self._host_limits[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return limit
+
+    def _retry_delay(self, attempt, response=None):
+        """재시도 전 대기 시간 (Retry-After 헤더가 있으면 우선)"""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), self.max_backoff)
+        delay = min(self.backoff * (2 ** attempt), self.max_backoff)
+        # 여러 요청이 동시에 다시 몰리지 않도록 무작위 지터 추가
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def fetch(self, url, headers=None, **kwargs):
+        """
+        URL을 가져옵니다. 연결 오류, 타임아웃, 429/5xx 응답은 재시도합니다.
+
+        Returns:
+            (requests.Response, 시도 횟수)
+
+        Raises:
+            requests.RequestException: 재시도 후에도 실패한 경우
+        """
+        limit = self._host_limit(url)
+        attempt = 0
+        while True:
+            attempt += 1
+            response = None
+            try:
+                with limit:
+                    response = self.session.get(url, headers=headers, timeout=self.timeout, **kwargs)
+                if response.status_code not in RETRY_STATUSES or attempt > self.retries:
+                    response.raise_for_status()
+                    return response, attempt
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt > self.retries:
+                    e.attempts = attempt
+                    raise
+            except requests.HTTPError as e:
+                e.attempts = attempt
+                raise
+            delay = self._retry_delay(attempt - 1, response)
+            if response is not None:
+                # 재시도할 응답의 연결을 풀에 돌려줌
+                response.close()
+            time.sleep(delay)
+
+    def _run(self, source):
+        started = time.perf_counter()
+        attempts = 0
+        try:
+            if self.cache is None:
+                response, attempts = self.fetch(source.url, headers=source.headers)
+                value = source.parse(self._response_text(source, response))
+                return CrawlResult(source, value, response.status_code, attempts=attempts,
+                                   elapsed=time.perf_counter() - started)
+            value, status, attempts, state = self._run_cached(source)
+            return CrawlResult(source, value, status, attempts=attempts,
+                               elapsed=time.perf_counter() - started, cache=state)
+        except requests.RequestException as e:
+            status = e.response.status_code if e.response is not None else None
+            return CrawlResult(source, status=status, error=e, attempts=getattr(e, 'attempts', attempts),
+                               elapsed=time.perf_counter() - started)
+        except Exception as e:
+            # 파싱 오류가 다른 대상의 결과에 영향을 주지 않도록 결과에 담아 반환
+            return CrawlResult(source, error=e, attempts=attempts, elapsed=time.perf_counter() - started)
+
+    def _response_text(self, source, response):
+        if source.encoding:
+            response.encoding = source.encoding
+        return response.text
+
+    def _run_cached(self, source):
+        """
+        캐시를 사용하여 대상 하나를 처리합니다.
+
+        Returns:
+            (결과, HTTP 상태 코드, 시도 횟수, 캐시 상태)
+        """
+        key = source.cache_key
+        entry = self.cache.get(source.url)
+        if entry is not None and entry.fresh:
+            found, value = self._cached_value(source, entry)
+            if found:
+                return value, None, 0, 'fresh'
+
+        headers = dict(source.headers)
+        if entry is not None:
+            headers.update(entry.conditional_headers())
+        response, attempts = self.fetch(source.url, headers=headers)
+
+        if response.status_code == 304 and entry is not None:
+            entry.update_validators(response)
+            found, value = self._cached_value(source, entry)
+            if found:
+                self._save(entry)
+                return value, response.status_code, attempts, 'not-modified'
+            # 저장된 본문이 없으면 조건 없이 다시 요청
+            response, retry_attempts = self.fetch(source.url, headers=source.headers)
+            attempts += retry_attempts
+
+        text = self._response_text(source, response)
+        digest = content_hash(text)
+        if entry is not None and entry.content_hash == digest and key in entry.values:
+            # 본문이 그대로면 파싱하지 않음
+            entry.update_validators(response)
+            self._save(entry)
+            return entry.values[key], response.status_code, attempts, 'unchanged'
+
+        value = source.parse(text)
+        if entry is None or entry.content_hash != digest:
+            entry = CacheEntry(source.url, content_hash=digest)
+        entry.values[key] = value
+        entry.update_validators(response)
+        if is_storable(response.headers):
+            self._save(entry, text)
+        return value, response.status_code, attempts, 'miss'
+
+    def _cached_value(self, source, entry):
+        """저장된 파싱 결과, 없으면 저장된 본문을 파싱한 결과 -> (찾았는지, 결과)"""
+        if source.cache_key in entry.values:
+            return True, entry.values[source.cache_key]
+        body = self.cache.load_body(source.url)
+        if body is None:
+            return False, None
+        value = entry.values[source.cache_key] = source.parse(body)
+        self._save(entry)
+        return True, value
+
+    def _save(self, entry, body=None):
+        try:
+            self.cache.save(entry, body)
+        except (OSError, TypeError, ValueError):
+            # 캐시 저장 실패(디스크 오류, JSON으로 저장할 수 없는 결과)는 크롤링 결과에 영향 없음
+            pass
+
+    def submit(self, source):
+        """대상 하나를 비동기로 실행하고 Future를 반환합니다."""
+        return self._executor.submit(self._run, source)
+
+    def crawl(self, sources):
+        """
+        여러 대상을 동시에 가져옵니다.
+
+        Returns:
+            sources와 같은 순서의 CrawlResult 리스트
+        """
+        futures = [self.submit(source) for source in sources]
+        return [future.result() for future in futures]
@@ -1,102 +1,140 @@
+import argparse
 import requests
 from bs4 import BeautifulSoup
 import re
 
+from anchor_parser import PARSERS, extract_anchor_texts
+from crawler_engine import CrawlerEngine, Source
+from headline_filter import FilterRules, HeadlineFilter
+from http_cache import HttpCache
 
-def get_kbs_headlines():
-    url = 'http://news.kbs.co.kr/news/pc/main/main.html'
-    
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        response.encoding = 'utf-8'
-        
-        print(f'KBS 사이트 응답 상태: {response.status_code}')
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        headlines = []
-        
-        links = soup.find_all('a')
-        
-        for link in links:
-            text = link.get_text().strip()
-            
-            time_pattern = r'^\d{1,2}:\d{2}'
-            
-            if (text and 
-                len(text) > 10 and 
-                len(text) < 150 and 
-                not text.startswith('http') and 
-                not re.match(time_pattern, text) and
-                not text in ['더보기', 'ON AIR', 'English', '재난포털', '제보', '로그인', '회원가입', '메뉴', '검색'] and
-                any(keyword in text for keyword in ['…', '·', ':', '(', ')', '"', ''', ''', '대통령', '정부', '국회', '경제', '사회', '정치', '국제', '북한', '중국', '미국', '일본'])):
-                headlines.append(text)
-        
-        unique_headlines = []
-        for headline in headlines:
-            if headline not in unique_headlines:
-                unique_headlines.append(headline)
-        
-        print(f'추출된 헤드라인 개수: {len(unique_headlines)}')
-        
-        return unique_headlines[:10] if unique_headlines else ['KBS 헤드라인을 찾을 수 없습니다']
-        
-    except requests.RequestException as e:
-        print(f'KBS 뉴스 데이터를 가져오는 중 오류가 발생했습니다: {e}')
+KBS_URL = 'http://news.kbs.co.kr/news/pc/main/main.html'
+WEATHER_URL = 'https://search.naver.com/search.naver?query=서울날씨'
+
+# 기본 규칙으로 미리 컴파일해 둔 헤드라인 필터
+DEFAULT_FILTER = HeadlineFilter()
+
+
+def parse_kbs_headlines(html, parser=None, headline_filter=None):
+    """
+    KBS 메인 페이지 HTML에서 헤드라인 목록을 추출합니다.
+
+    Args:
+        parser: <a> 텍스트 추출에 쓸 파서 (anchor_parser.PARSERS, None이면 가장 빠른 파서)
+        headline_filter: 사용할 HeadlineFilter (None이면 기본 규칙)
+    """
+    return (headline_filter or DEFAULT_FILTER).apply(extract_anchor_texts(html, parser))
+
+
+def parse_weather_info(html):
+    """네이버 날씨 검색 결과 HTML에서 서울 날씨 문자열을 만듭니다."""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    weather_info = soup.select_one('.weather_info')
+    if weather_info:
+        weather_text = weather_info.get_text(strip=True)
+
+        temp_match = re.search(r'현재 온도([\d.]+)°', weather_text)
+        weather_match = re.search(r'오늘의 날씨(\w+)', weather_text)
+        humidity_match = re.search(r'습도(\d+)%', weather_text)
+
+        if temp_match and weather_match:
+            temp = temp_match.group(1)
+            weather = weather_match.group(1)
+            humidity = humidity_match.group(1) if humidity_match else None
+
+            result = f'서울: {weather}, {temp}°C'
+            if humidity:
+                result += f', 습도 {humidity}%'
+            return result
+        else:
+            return '서울: 날씨 정보 파싱 실패'
+    else:
+        return '서울: 날씨 정보를 찾을 수 없음'
+
+
+def kbs_source(url=KBS_URL, parser=None, headline_filter=None, cache_key=None):
+    if cache_key is None:
+        # 파서나 규칙이 바뀌면 저장된 파싱 결과를 쓰지 않도록 키에 포함
+        # (규칙은 파일 경로가 아니라 내용의 해시를 넣어 같은 파일을 고쳐도 다시 파싱)
+        rules = (headline_filter or DEFAULT_FILTER).rules
+        cache_key = f'kbs|{parser or "default"}|{rules.digest()}'
+    return Source('kbs', url, lambda html: parse_kbs_headlines(html, parser, headline_filter),
+                  encoding='utf-8', cache_key=cache_key)
+
+
+def weather_source(url=WEATHER_URL):
+    return Source('weather', url, parse_weather_info)
+
+
+def format_kbs_result(result):
+    """KBS 크롤링 결과를 출력하고 헤드라인 목록(최대 10개)을 반환합니다."""
+    if isinstance(result.error, requests.RequestException):
+        print(f'KBS 뉴스 데이터를 가져오는 중 오류가 발생했습니다: {result.error}')
         return ['KBS 사이트 접근 실패']
-    except Exception as e:
-        print(f'KBS 뉴스 처리 중 오류가 발생했습니다: {e}')
+    if result.error is not None:
+        print(f'KBS 뉴스 처리 중 오류가 발생했습니다: {result.error}')
         return ['KBS 뉴스 처리 실패']
 
+    if result.cache == 'fresh':
+        print('KBS 사이트 응답 상태: 캐시 사용 (요청 생략)')
+    else:
+        print(f'KBS 사이트 응답 상태: {result.status}')
+    print(f'추출된 헤드라인 개수: {len(result.value)}')
+    return result.value[:10] if result.value else ['KBS 헤드라인을 찾을 수 없습니다']
 
-def get_weather_info():
-    try:
-        url = 'https://search.naver.com/search.naver?query=서울날씨'
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        weather_info = soup.select_one('.weather_info')
-        if weather_info:
-            weather_text = weather_info.get_text(strip=True)
-            
-            temp_match = re.search(r'현재 온도([\d.]+)°', weather_text)
-            weather_match = re.search(r'오늘의 날씨(\w+)', weather_text)
-            humidity_match = re.search(r'습도(\d+)%', weather_text)
-            
-            if temp_match and weather_match:
-                temp = temp_match.group(1)
-                weather = weather_match.group(1)
-                humidity = humidity_match.group(1) if humidity_match else None
-                
-                result = f'서울: {weather}, {temp}°C'
-                if humidity:
-                    result += f', 습도 {humidity}%'
-                return result
-            else:
-                return '서울: 날씨 정보 파싱 실패'
-        else:
-            return '서울: 날씨 정보를 찾을 수 없음'
-                
-    except Exception as e:
+
+def format_weather_result(result):
+    if result.error is not None:
         return '서울: 날씨 정보 가져오기 실패'
+    return result.value
+
+
+def get_kbs_headlines(engine=None):
+    """KBS 헤드라인만 가져옵니다 (engine이 없으면 임시로 생성)."""
+    if engine is None:
+        with CrawlerEngine() as engine:
+            return get_kbs_headlines(engine)
+    return format_kbs_result(engine.crawl([kbs_source()])[0])
+
+
+def get_weather_info(engine=None):
+    """서울 날씨만 가져옵니다 (engine이 없으면 임시로 생성)."""
+    if engine is None:
+        with CrawlerEngine() as engine:
+            return get_weather_info(engine)
+    return format_weather_result(engine.crawl([weather_source()])[0])
 
 
 def main():
+    parser = argparse.ArgumentParser(description='KBS 뉴스 헤드라인 크롤러')
+    parser.add_argument('--parser', choices=list(PARSERS), help='헤드라인 추출에 사용할 HTML 파서')
+    parser.add_argument('--rules', help='헤드라인 필터 규칙 JSON 파일 (headline_filter.FilterRules 인자)')
+    parser.add_argument('--cache-dir', default='.http_cache', help='HTTP 캐시 디렉토리')
+    parser.add_argument('--no-cache', action='store_true', help='캐시 없이 항상 새로 받기')
+    args = parser.parse_args()
+    headline_filter = HeadlineFilter(FilterRules.from_json(args.rules)) if args.rules else None
+    cache = None if args.no_cache else HttpCache(args.cache_dir)
+
     print('=== KBS 뉴스 헤드라인 크롤링 ===')
-    
-    kbs_headlines = get_kbs_headlines()
-    
+
+    # 두 사이트를 동시에 가져옴 (한 사이트가 느려도 다른 사이트를 기다리게 하지 않음)
+    with CrawlerEngine(cache=cache) as engine:
+        kbs_result, weather_result = engine.crawl([
+            kbs_source(parser=args.parser, headline_filter=headline_filter),
+            weather_source(),
+        ])
+
+    kbs_headlines = format_kbs_result(kbs_result)
+
     print('\n[KBS 헤드라인 목록]')
     for i, headline in enumerate(kbs_headlines, 1):
         print(f'{i}. {headline}')
-    
+
     print('\n=== 보너스: 오늘의 날씨 ===')
-    weather = get_weather_info()
+    weather = format_weather_result(weather_result)
     print(weather)
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,109 @@
+"""
+헤드라인 후보 필터 파이프라인
+
+<a> 텍스트 목록에서 헤드라인만 골라냅니다.
+규칙(FilterRules)은 생성 시 한 번만 컴파일하고, 텍스트마다 싼 검사부터 차례로 적용합니다.
+
+1. 길이 범위 (min_length <= 길이 <= max_length)
+2. 제외 단어 (frozenset 조회)
+3. 제외 접두어 (str.startswith에 튜플 전달)
+4. 시각 형식 제외 (컴파일된 정규식)
+5. 키워드 포함 (키워드 전체를 하나로 묶은 정규식으로 한 번에 검색)
+
+중복은 dict로 제거하여 처음 나온 순서를 유지합니다.
+"""
+import hashlib
+import json
+import re
+
+DEFAULT_STOPWORDS = ('더보기', 'ON AIR', 'English', '재난포털', '제보', '로그인', '회원가입', '메뉴', '검색')
+
+# 기존 필터의 키워드를 그대로 유지합니다. 기존 코드의 ''', '''는 따옴표 두 개가 아니라
+# ', '(쉼표+공백) 문자열이었으므로 '협상 타결, 결과는 다음 주에 발표' 같은 제목도 통과합니다.
+DEFAULT_KEYWORDS = (
+    '…', '·', ':', '(', ')', '"', ', ',
+    '대통령', '정부', '국회', '경제', '사회', '정치', '국제', '북한', '중국', '미국', '일본',
+)
+
+
+class FilterRules:
+    """
+    헤드라인 필터 규칙
+
+    Args:
+        min_length: 최소 글자 수
+        max_length: 최대 글자 수
+        stopwords: 정확히 일치하면 제외할 텍스트 (메뉴 이름 등)
+        exclude_prefixes: 이 문자열로 시작하면 제외
+        exclude_pattern: 텍스트 시작 부분이 일치하면 제외할 정규식 (기본: 12:30 같은 시각)
+        keywords: 하나 이상 포함해야 하는 단어 (비어 있으면 검사하지 않음)
+    """
+
+    def __init__(self, min_length=11, max_length=149, stopwords=DEFAULT_STOPWORDS,
+                 exclude_prefixes=('http',), exclude_pattern=r'\d{1,2}:\d{2}', keywords=DEFAULT_KEYWORDS):
+        self.min_length = min_length
+        self.max_length = max_length
+        self.stopwords = tuple(stopwords)
+        self.exclude_prefixes = tuple(exclude_prefixes)
+        self.exclude_pattern = exclude_pattern
+        self.keywords = tuple(keywords)
+
+    @classmethod
+    def from_json(cls, path):
+        """JSON 파일에서 규칙을 읽습니다. 파일에 없는 항목은 기본값을 사용합니다."""
+        with open(path, encoding='utf-8') as file:
+            return cls(**json.load(file))
+
+    def digest(self):
+        """규칙 내용의 해시 (파일 경로가 아니라 값이 같으면 같음, 캐시 키에 사용)"""
+        text = json.dumps(vars(self), ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+class HeadlineFilter:
+    """FilterRules를 컴파일한 필터"""
+
+    def __init__(self, rules=None):
+        rules = rules or FilterRules()
+        self.rules = rules
+        self._min_length = rules.min_length
+        self._max_length = rules.max_length
+        self._stopwords = frozenset(rules.stopwords)
+        self._exclude_prefixes = rules.exclude_prefixes
+        self._exclude_match = re.compile(rules.exclude_pattern).match if rules.exclude_pattern else None
+        self._keyword_search = None
+        if rules.keywords:
+            # 긴 키워드를 먼저 두어 겹치는 키워드도 정상적으로 찾도록 함
+            keywords = sorted(set(rules.keywords), key=len, reverse=True)
+            self._keyword_search = re.compile('|'.join(map(re.escape, keywords))).search
+
+    def accepts(self, text):
+        """텍스트가 헤드라인 조건을 모두 만족하는지 반환합니다."""
+        if not self._min_length <= len(text) <= self._max_length:
+            return False
+        if text in self._stopwords:
+            return False
+        if self._exclude_prefixes and text.startswith(self._exclude_prefixes):
+            return False
+        if self._exclude_match is not None and self._exclude_match(text):
+            return False
+        if self._keyword_search is not None and self._keyword_search(text) is None:
+            return False
+        return True
+
+    def apply(self, texts, limit=None):
+        """
+        조건을 만족하는 텍스트를 중복 없이 처음 나온 순서대로 반환합니다.
+
+        Args:
+            limit: 이만큼 모이면 나머지 텍스트는 검사하지 않음 (None이면 전부)
+        """
+        accepts = self.accepts
+        unique = {}
+        for text in texts:
+            if text in unique or not accepts(text):
+                continue
+            unique[text] = None
+            if limit is not None and len(unique) >= limit:
+                break
+        return list(unique)
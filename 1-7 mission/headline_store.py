@@ -0,0 +1,111 @@
+"""
+수집한 헤드라인을 저장하는 SQLite 저장소
+
+- (출처, 제목)의 해시에 UNIQUE 인덱스를 두어 이미 저장된 헤드라인은 INSERT OR IGNORE로 건너뜀
+- 처음 수집한 시각(first_seen)에 인덱스를 두어 기간 조회를 빠르게 함
+"""
+import hashlib
+import sqlite3
+import time
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS headlines (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    first_seen REAL NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_headlines_content_hash ON headlines (content_hash);
+CREATE INDEX IF NOT EXISTS ix_headlines_first_seen ON headlines (first_seen);
+'''
+
+
+def headline_hash(source, title):
+    """공백 차이는 같은 헤드라인으로 보도록 정규화한 뒤 해시합니다."""
+    normalized = ' '.join(title.split())
+    return hashlib.sha1(f'{source}\n{normalized}'.encode('utf-8')).hexdigest()
+
+
+class HeadlineStore:
+    """
+    헤드라인 저장소
+
+    사용법:
+        store = HeadlineStore('headlines.db')
+        store.add('kbs', ['제목1', '제목2'])
+        store.query(since=time.time() - 3600)
+    """
+
+    def __init__(self, path='headlines.db'):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        # 쓰는 중에도 다른 프로세스(조회)가 읽을 수 있도록 WAL 모드 사용
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def add(self, source, titles, seen_at=None):
+        """
+        헤드라인을 저장합니다. 이미 저장된 헤드라인은 건너뜁니다.
+
+        Returns:
+            새로 저장된 헤드라인 수
+        """
+        seen_at = time.time() if seen_at is None else seen_at
+        rows = [(source, title, headline_hash(source, title), seen_at) for title in titles]
+        with self.connection:
+            before = self.connection.total_changes
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO headlines (source, title, content_hash, first_seen) VALUES (?, ?, ?, ?)',
+                rows
+            )
+            return self.connection.total_changes - before
+
+    def query(self, since=None, until=None, source=None, keyword=None, limit=100):
+        """
+        기간(first_seen 기준, since 이상 until 미만)으로 헤드라인을 최신순 조회합니다.
+
+        Args:
+            since, until: 유닉스 시각(초), None이면 제한 없음
+            source: 출처 이름
+            keyword: 제목에 포함된 단어
+            limit: 최대 개수
+
+        Returns:
+            {'source', 'title', 'first_seen'} 딕셔너리 리스트
+        """
+        conditions = []
+        params = []
+        if since is not None:
+            conditions.append('first_seen >= ?')
+            params.append(since)
+        if until is not None:
+            conditions.append('first_seen < ?')
+            params.append(until)
+        if source is not None:
+            conditions.append('source = ?')
+            params.append(source)
+        if keyword:
+            conditions.append("title LIKE ? ESCAPE '\\'")
+            escaped = keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            params.append(f'%{escaped}%')
+        where = f'WHERE {" AND ".join(conditions)}' if conditions else ''
+        params.append(limit)
+        rows = self.connection.execute(
+            f'SELECT source, title, first_seen FROM headlines {where} ORDER BY first_seen DESC, id DESC LIMIT ?',
+            params
+        )
+        return [dict(row) for row in rows]
+
+    def count(self):
+        return self.connection.execute('SELECT COUNT(*) FROM headlines').fetchone()[0]
@@ -0,0 +1,136 @@
+"""
+크롤러용 디스크 HTTP 캐시
+
+URL마다 다음을 저장합니다.
+- <해시>.json: ETag, Last-Modified, 만료 시각(Cache-Control max-age), 본문 해시, 파싱 결과
+- <해시>.body: 디코딩한 본문 (파싱 결과가 없을 때 다시 파싱하는 용도)
+
+주기적으로 크롤링할 때:
+1. 만료 전이면 요청 없이 저장된 결과 사용
+2. 만료되었으면 If-None-Match / If-Modified-Since를 붙여 조건부 요청 -> 304면 저장된 결과 사용
+3. 200이라도 본문 해시가 같으면 파싱을 건너뛰고 저장된 결과 사용
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+def parse_cache_control(header):
+    """Cache-Control 헤더를 {지시어: 값} 딕셔너리로 변환합니다."""
+    directives = {}
+    for item in (header or '').split(','):
+        name, _, value = item.strip().partition('=')
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class CacheEntry:
+    """URL 하나의 캐시 정보"""
+
+    def __init__(self, url, etag=None, last_modified=None, expires_at=0.0, content_hash=None, values=None):
+        self.url = url
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+        self.content_hash = content_hash
+        # 파싱 결과 {파싱 키: 결과} (같은 본문이라도 파서/규칙이 다르면 키가 다름)
+        self.values = values or {}
+
+    @property
+    def fresh(self):
+        return time.time() < self.expires_at
+
+    def conditional_headers(self):
+        """재검증 요청에 붙일 헤더"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def update_validators(self, response):
+        """응답 헤더로 검증자와 만료 시각을 갱신합니다 (304 응답에도 새 값이 올 수 있음)."""
+        self.etag = response.headers.get('ETag', self.etag)
+        self.last_modified = response.headers.get('Last-Modified', self.last_modified)
+        self.expires_at = time.time() + freshness_lifetime(response.headers)
+
+    def to_dict(self):
+        return {
+            'url': self.url,
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'expires_at': self.expires_at,
+            'content_hash': self.content_hash,
+            'values': self.values,
+        }
+
+
+def freshness_lifetime(headers):
+    """응답을 다시 확인하지 않고 사용할 수 있는 시간(초)"""
+    directives = parse_cache_control(headers.get('Cache-Control'))
+    if 'no-cache' in directives or 'no-store' in directives:
+        return 0
+    max_age = directives.get('s-maxage') or directives.get('max-age')
+    if not max_age or not max_age.isdigit():
+        return 0
+    age = headers.get('Age', '0')
+    return max(0, int(max_age) - (int(age) if age.isdigit() else 0))
+
+
+def is_storable(headers):
+    return 'no-store' not in parse_cache_control(headers.get('Cache-Control'))
+
+
+class HttpCache:
+    """디렉토리에 URL별 파일로 저장하는 캐시"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url, suffix):
+        name = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, name + suffix)
+
+    def get(self, url):
+        """저장된 CacheEntry (없거나 손상되었으면 None)"""
+        try:
+            with open(self._path(url, '.json'), encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get('url') != url:
+            return None
+        try:
+            return CacheEntry(**data)
+        except (TypeError, KeyError):
+            # 다른 버전이 저장했거나 손상된 항목은 없는 것으로 취급
+            return None
+
+    def save(self, entry, body=None):
+        """캐시 정보를 저장합니다. body를 주면 본문도 함께 저장합니다."""
+        if body is not None:
+            self._write(self._path(entry.url, '.body'), body)
+        self._write(self._path(entry.url, '.json'), json.dumps(entry.to_dict(), ensure_ascii=False))
+
+    def load_body(self, url):
+        try:
+            with open(self._path(url, '.body'), encoding='utf-8') as file:
+                return file.read()
+        except OSError:
+            return None
+
+    def _write(self, path, text):
+        # 쓰는 도중 중단되어도 기존 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체
+        temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.write(text)
+        os.replace(temp_path, path)
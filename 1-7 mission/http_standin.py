@@ -0,0 +1,180 @@
+"""crawler_engine 테스트용 로컬 HTTP 서버 (표준 라이브러리만 사용).
+
+- HTTP/1.1 지속 연결을 지원하고, 새 TCP 연결 수와 Host 헤더별 동시 처리 요청 수의 최댓값을 셈
+- /page/이름: ETag가 붙은 HTML, If-None-Match가 같으면 304
+  (?max_age=N이면 Cache-Control: max-age=N, /change/이름을 요청하면 본문이 바뀜)
+- /slow?delay=초: 응답 전에 delay초 대기 (느린 사이트)
+- /flaky/키?fail=N&status=503: 키마다 처음 N번은 status로 실패한 뒤 200
+- /status/코드: 항상 그 상태 코드 (?retry_after=초면 Retry-After 헤더 추가)
+- /stats: 카운터(JSON), /reset: 카운터 초기화
+
+실행 방법: python http_standin.py [--port 8030]
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class StandinState:
+    """요청/연결 카운터와 페이지 버전 (여러 스레드에서 함께 사용)."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.connections = 0
+            self.requests = 0
+            # Host 헤더 -> 처리 중인 요청 수 / 그 최댓값
+            self.in_flight = {}
+            self.max_in_flight = {}
+            self.not_modified = 0
+            self.failures = {}
+            self.versions = {}
+
+    def stats(self):
+        with self.lock:
+            return {
+                'connections': self.connections,
+                'requests': self.requests,
+                'max_in_flight': dict(self.max_in_flight),
+                'not_modified': self.not_modified,
+            }
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # 서버가 시작할 때 설정
+    state = None
+
+    def setup(self):
+        super().setup()
+        with self.state.lock:
+            self.state.connections += 1
+
+    def do_GET(self):
+        state = self.state
+        host = self.headers.get('Host', '')
+        with state.lock:
+            state.requests += 1
+            count = state.in_flight[host] = state.in_flight.get(host, 0) + 1
+            state.max_in_flight[host] = max(state.max_in_flight.get(host, 0), count)
+        try:
+            self.route()
+        finally:
+            with state.lock:
+                state.in_flight[host] -= 1
+
+    def route(self):
+        url = urlsplit(self.path)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        _, _, rest = url.path.partition('/')
+        kind, _, name = rest.partition('/')
+
+        if kind == 'page':
+            self.send_page(name, query)
+        elif kind == 'change':
+            with self.state.lock:
+                self.state.versions[name] = self.state.versions.get(name, 0) + 1
+            self.send_text(200, 'changed')
+        elif kind == 'slow':
+            time.sleep(float(query.get('delay', '1')))
+            self.send_text(200, '<html><body>slow</body></html>')
+        elif kind == 'flaky':
+            with self.state.lock:
+                failed = self.state.failures.get(name, 0)
+                if failed < int(query.get('fail', '1')):
+                    self.state.failures[name] = failed + 1
+                else:
+                    failed = None
+            if failed is None:
+                self.send_text(200, f'<html><body>{name}</body></html>')
+            else:
+                self.send_text(int(query.get('status', '503')), 'try again')
+        elif kind == 'status':
+            headers = {}
+            if 'retry_after' in query:
+                headers['Retry-After'] = query['retry_after']
+            self.send_text(int(name), f'status {name}', headers)
+        elif kind == 'stats':
+            self.send_text(200, json.dumps(self.state.stats()), content_type='application/json')
+        elif kind == 'reset':
+            self.state.reset()
+            self.send_text(200, 'reset')
+        else:
+            self.send_text(404, 'not found')
+
+    def send_page(self, name, query):
+        with self.state.lock:
+            version = self.state.versions.get(name, 0)
+        body = f'<html><head><title>{name}</title></head><body><p>{name} v{version}</p></body></html>'
+        etag = '"' + hashlib.sha1(body.encode('utf-8')).hexdigest()[:16] + '"'
+        headers = {'ETag': etag}
+        if 'max_age' in query:
+            headers['Cache-Control'] = f'max-age={query["max_age"]}'
+        if self.headers.get('If-None-Match') == etag:
+            with self.state.lock:
+                self.state.not_modified += 1
+            self.send_response(304)
+            for header, value in headers.items():
+                self.send_header(header, value)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_text(200, body, headers)
+
+    def send_text(self, status, text, headers=None, content_type='text/html; charset=utf-8'):
+        data = text.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for header, value in (headers or {}).items():
+            self.send_header(header, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_standin(host='127.0.0.1', port=0):
+    """
+    스레드에서 서버를 시작합니다.
+
+    Returns:
+        (서버, StandinState) - server.server_address로 실제 포트 확인, server.shutdown()으로 종료
+    """
+    state = StandinState()
+    handler = type('Handler', (StandinHandler,), {'state': state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state
+
+
+def main():
+    parser = argparse.ArgumentParser(description='crawler_engine 테스트용 로컬 HTTP 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8030)
+    args = parser.parse_args()
+
+    server, state = start_standin(args.host, args.port)
+    print(f'HTTP 테스트 서버: http://{args.host}:{args.port} (Ctrl+C로 종료)')
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        print(f'통계: {state.stats()}')
+
+
+if __name__ == '__main__':
+    main()
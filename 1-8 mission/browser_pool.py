@@ -0,0 +1,227 @@
+"""
+재사용 가능한 헤드리스 브라우저 풀
+
+- 드라이버 경로는 풀을 만들 때 한 번만 찾음 (CHROMEDRIVER 환경 변수 -> PATH -> webdriver_manager 순서)
+- 헤드리스 모드, 이미지/CSS/폰트 요청 차단, DOMContentLoaded에서 get()이 반환되는 'eager' 로드 전략
+- 브라우저를 작업마다 새로 띄우지 않고 큐에 넣어 두었다가 다음 작업에 다시 사용
+- 작업 중 브라우저가 죽으면(WebDriverException) 그 브라우저는 버리고 다음에 새로 만듦
+- 고정 sleep 대신 조건을 만족할 때까지만 기다리는 대기 함수(wait_for_any, wait_for_ready)
+"""
+import os
+import queue
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+
+from dom_extract import first_match
+
+# 헤드리스 크롤링에 필요 없는 리소스 (Network.setBlockedURLs 패턴)
+BLOCKED_URL_PATTERNS = (
+    '*.css', '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.mp4',
+)
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def resolve_driver_path():
+    """
+    chromedriver 경로를 찾습니다. 한 번 찾은 경로는 프로세스 안에서 다시 사용합니다.
+
+    webdriver_manager는 실행할 때마다 버전 확인 요청을 보내므로 마지막 수단으로만 사용합니다.
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = os.environ.get('CHROMEDRIVER') or shutil.which('chromedriver')
+            if _driver_path is None:
+                from webdriver_manager.chrome import ChromeDriverManager
+                _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+
+def build_options(headless=True, block_resources=True):
+    """크롤링용 Chrome 옵션"""
+    options = Options()
+    if headless:
+        options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--window-size=1280,1024')
+    if block_resources:
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+    # load 이벤트(이미지, 광고 등)까지 기다리지 않고 DOM이 준비되면 반환
+    options.page_load_strategy = 'eager'
+    return options
+
+
+def create_driver(driver_path, headless=True, block_resources=True, page_load_timeout=30):
+    """브라우저 하나를 띄웁니다."""
+    driver = webdriver.Chrome(service=Service(driver_path), options=build_options(headless, block_resources))
+    driver.set_page_load_timeout(page_load_timeout)
+    if block_resources:
+        # 이미지 설정만으로는 CSS/폰트가 차단되지 않으므로 DevTools 프로토콜로 URL 패턴을 차단
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(BLOCKED_URL_PATTERNS)})
+    return driver
+
+
+def reset_driver(driver):
+    """다음 작업이 이전 작업의 로그인 상태를 이어받지 않도록 쿠키를 비우고 빈 페이지로 이동합니다."""
+    driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+    driver.get('about:blank')
+
+
+def wait_for_any(driver, selectors, timeout=10):
+    """
+    CSS 선택자 중 하나라도 나타날 때까지 기다립니다.
+
+    Returns:
+        처음 발견된 선택자 (timeout 안에 나타나지 않으면 None)
+    """
+    # 확인할 때마다 선택자 수만큼 find_elements를 호출하지 않고 스크립트 한 번으로 확인
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda driver: first_match(driver, selectors) or False
+        )
+    except TimeoutException:
+        return None
+
+
+def wait_for_ready(driver, timeout=10):
+    """문서 파싱이 끝날 때까지(readyState가 loading이 아닐 때까지) 기다립니다."""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda driver: driver.execute_script('return document.readyState') != 'loading'
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+class BrowserPool:
+    """
+    브라우저 재사용 풀
+
+    사용법:
+        with BrowserPool(size=2) as pool:
+            with pool.driver() as driver:
+                driver.get(url)
+            titles = pool.map(lambda driver, url: (driver.get(url), driver.title)[1], urls)
+    """
+
+    def __init__(self, size=2, headless=True, block_resources=True, driver_path=None, page_load_timeout=30):
+        """
+        Args:
+            size: 동시에 띄울 수 있는 브라우저 수
+            headless: 화면 없이 실행 (로그인 2차 인증처럼 사람이 조작해야 하면 False)
+            block_resources: 이미지/CSS/폰트 요청 차단
+            driver_path: chromedriver 경로 (None이면 resolve_driver_path)
+            page_load_timeout: driver.get()의 최대 대기 시간(초)
+        """
+        self.size = size
+        self.headless = headless
+        self.block_resources = block_resources
+        self.driver_path = driver_path or resolve_driver_path()
+        self.page_load_timeout = page_load_timeout
+        self._idle = queue.LifoQueue()
+        # 만들 수 있는 브라우저 수 (쉬는 브라우저가 없을 때만 새로 만듦)
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._drivers = set()
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def acquire(self):
+        """쉬고 있는 브라우저를 꺼내거나, 자리가 있으면 새로 띄웁니다. 모두 사용 중이면 기다립니다."""
+        self._slots.acquire()
+        try:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                driver = create_driver(self.driver_path, self.headless, self.block_resources,
+                                       self.page_load_timeout)
+                with self._lock:
+                    self._drivers.add(driver)
+                return driver
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, driver, reset=True, discard=False):
+        """
+        브라우저를 풀에 돌려놓습니다.
+
+        Args:
+            reset: 쿠키를 비우고 빈 페이지로 이동
+            discard: 브라우저를 종료하고 버림 (오류가 난 브라우저)
+        """
+        try:
+            if not discard and reset:
+                try:
+                    reset_driver(driver)
+                except WebDriverException:
+                    discard = True
+            if discard or self._closed:
+                self._quit(driver)
+            else:
+                self._idle.put(driver)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def driver(self, reset=True):
+        """with 블록 동안 브라우저 하나를 빌립니다."""
+        driver = self.acquire()
+        try:
+            yield driver
+        except WebDriverException:
+            self.release(driver, discard=True)
+            raise
+        except BaseException:
+            self.release(driver, reset=reset)
+            raise
+        else:
+            self.release(driver, reset=reset)
+
+    def run(self, job, *args):
+        """job(driver, *args)를 빌린 브라우저로 실행합니다."""
+        with self.driver() as driver:
+            return job(driver, *args)
+
+    def map(self, job, items):
+        """items마다 job(driver, item)을 최대 size개 브라우저로 동시에 실행하고 순서대로 결과를 반환합니다."""
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(lambda item: self.run(job, item), items))
+
+    def _quit(self, driver):
+        with self._lock:
+            self._drivers.discard(driver)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def close(self):
+        """모든 브라우저를 종료합니다."""
+        self._closed = True
+        with self._lock:
+            drivers = list(self._drivers)
+        for driver in drivers:
+            self._quit(driver)
@@ -0,0 +1,157 @@
+"""
+로그인 쿠키 저장소
+
+로그인에 성공한 브라우저의 쿠키를 파일에 저장해 두었다가
+다음 실행에서 브라우저(WebDriver)나 requests.Session에 복원하여 로그인 과정을 건너뜁니다.
+
+- 파일은 소유자만 읽고 쓸 수 있도록(0600) 만들고, 임시 파일에 쓴 뒤 교체
+- 환경 변수 NAVER_COOKIE_KEY(Fernet 키)가 있으면 cryptography로 암호화하여 저장
+  (키가 없으면 평문으로 저장하고 저장할 때마다 경고를 출력)
+  키 만들기: python -c "from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())"
+- 기본 파일 이름(naver_cookies.json)은 저장소 .gitignore에 포함되어 있음
+- 만료된 쿠키는 복원하지 않음
+"""
+import json
+import os
+import time
+
+import requests
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # 암호화는 선택 기능
+    Fernet = None
+    InvalidToken = ValueError
+
+KEY_ENV = 'NAVER_COOKIE_KEY'
+
+# Selenium 쿠키 sameSite 값 -> DevTools 프로토콜 값
+SAME_SITE = {'strict': 'Strict', 'lax': 'Lax', 'none': 'None'}
+
+
+class CookieStore:
+    """
+    쿠키 파일 하나
+
+    사용법:
+        store = CookieStore('naver_cookies.json')
+        store.save(cookies)
+        cookies = store.load()  # 없거나, 손상되었거나, 모두 만료되었으면 None
+    """
+
+    def __init__(self, path, key=None):
+        """
+        Args:
+            path: 쿠키 파일 경로
+            key: Fernet 키 (None이면 환경 변수 NAVER_COOKIE_KEY, 그것도 없으면 암호화하지 않음)
+        """
+        self.path = path
+        key = key or os.environ.get(KEY_ENV)
+        if key and Fernet is None:
+            raise RuntimeError(f'{KEY_ENV}로 암호화하려면 cryptography 패키지가 필요합니다: pip install cryptography')
+        self.fernet = Fernet(key) if key else None
+
+    def save(self, cookies):
+        """쿠키 목록(Selenium get_cookies 형식)을 저장합니다."""
+        data = json.dumps({'saved_at': time.time(), 'cookies': cookies}, ensure_ascii=False).encode('utf-8')
+        if self.fernet is not None:
+            data = self.fernet.encrypt(data)
+        else:
+            print(f'경고: {KEY_ENV}가 설정되지 않아 로그인 쿠키를 암호화하지 않고 {self.path}에 저장합니다. '
+                  '파일이 유출되면 계정에 로그인할 수 있으니 키를 설정하세요.')
+
+        temp_path = f'{self.path}.{os.getpid()}.tmp'
+        # 처음부터 0600으로 만들어 잠시라도 다른 사용자가 읽을 수 없도록 함
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+        os.replace(temp_path, self.path)
+
+    def load(self):
+        """만료되지 않은 쿠키 목록을 반환합니다."""
+        try:
+            with open(self.path, 'rb') as file:
+                data = file.read()
+            if self.fernet is not None:
+                data = self.fernet.decrypt(data)
+            cookies = json.loads(data)['cookies']
+        except (OSError, ValueError, KeyError, InvalidToken):
+            return None
+
+        now = time.time()
+        cookies = [cookie for cookie in cookies if cookie.get('expiry', now + 1) > now]
+        return cookies or None
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def read_driver_cookies(driver, host):
+    """
+    브라우저의 쿠키 중 host(예: naver.com)와 그 하위 도메인의 쿠키를 Selenium 형식으로 반환합니다.
+
+    driver.get_cookies()는 현재 페이지 도메인의 쿠키만 반환하므로
+    DevTools 프로토콜로 nid.naver.com 등 모든 하위 도메인의 쿠키를 가져옵니다.
+    """
+    cookies = []
+    for cookie in driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']:
+        domain = cookie['domain'].lstrip('.')
+        # evilnaver.com 같은 다른 도메인이 끝부분만 같아서 섞이지 않도록 점 단위로 비교
+        if domain != host and not domain.endswith('.' + host):
+            continue
+        item = {
+            'name': cookie['name'],
+            'value': cookie['value'],
+            'domain': cookie['domain'],
+            'path': cookie['path'],
+            'secure': cookie['secure'],
+            'httpOnly': cookie['httpOnly'],
+        }
+        # 세션 쿠키는 expires가 -1
+        if cookie.get('expires', -1) > 0:
+            item['expiry'] = int(cookie['expires'])
+        if cookie.get('sameSite'):
+            item['sameSite'] = cookie['sameSite']
+        cookies.append(item)
+    return cookies
+
+
+def restore_driver_cookies(driver, cookies):
+    """
+    쿠키를 브라우저에 넣습니다.
+
+    driver.add_cookie()는 해당 도메인 페이지를 먼저 열어야 하므로
+    DevTools 프로토콜로 페이지 이동 없이 한 번에 넣습니다.
+    """
+    params = []
+    for cookie in cookies:
+        item = {
+            'name': cookie['name'],
+            'value': cookie['value'],
+            'domain': cookie['domain'],
+            'path': cookie.get('path', '/'),
+            'secure': cookie.get('secure', False),
+            'httpOnly': cookie.get('httpOnly', False),
+        }
+        if 'expiry' in cookie:
+            item['expires'] = cookie['expiry']
+        same_site = SAME_SITE.get(str(cookie.get('sameSite', '')).lower())
+        if same_site:
+            item['sameSite'] = same_site
+        params.append(item)
+    driver.execute_cdp_cmd('Network.setCookies', {'cookies': params})
+
+
+def requests_session(cookies, headers=None):
+    """쿠키를 넣은 requests.Session (스크립트 실행이 필요 없는 페이지를 브라우저 없이 가져올 때)"""
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    for cookie in cookies:
+        session.cookies.set(cookie['name'], cookie['value'], domain=cookie['domain'],
+                            path=cookie.get('path', '/'), secure=cookie.get('secure', False),
+                            expires=cookie.get('expiry'))
+    return session
@@ -2,24 +2,102 @@
 네이버 사이트 크롤링 프로그램
 셀레니움을 사용하여 네이버 로그인 전후 콘텐츠 차이를 확인하고
 로그인 후 개인화 콘텐츠를 크롤링합니다.
+
+브라우저는 browser_pool.BrowserPool에서 빌려 쓰고(헤드리스, 이미지/CSS 차단),
+페이지마다 고정 시간을 기다리지 않고 필요한 요소가 나타날 때까지만 기다립니다.
+
+로그인에 성공하면 쿠키를 저장해 두고(cookie_store.CookieStore), 다음 실행에서는
+저장된 쿠키로 로그인 과정을 건너뜁니다. --no-browser를 주면 스크립트가 필요 없는
+페이지는 브라우저 없이 requests로 가져옵니다.
+
+실행 방법:
+    python crawling_KBS.py [--show-browser] [--cookies naver_cookies.json | --no-cookies] [--no-browser]
+    python crawling_KBS.py --fixtures          # fixtures/의 로컬 HTML로 실행
+    python crawling_KBS.py --fixtures http://127.0.0.1:8000   # fixtures/를 HTTP로 제공할 때 (쿠키 사용 가능)
 """
 
-import time
-from selenium import webdriver
+import argparse
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+
+from browser_pool import BrowserPool, wait_for_any, wait_for_ready
+from cookie_store import CookieStore, read_driver_cookies, requests_session, restore_driver_cookies
+from dom_extract import extract, texts
+
+NAVER_URLS = {
+    'main': 'https://www.naver.com',
+    'login': 'https://nid.naver.com/nidlogin.login',
+    'mail': 'https://mail.naver.com',
+}
+
+FIXTURE_DIR = Path(__file__).resolve().parent / 'fixtures'
+
+# 로그인하지 않았을 때만 메인 페이지에 있는 로그인 버튼
+LOGIN_BUTTON_CLASS = 'link_login'
+
+HTTP_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+
+
+def fixture_urls(location=FIXTURE_DIR):
+    """
+    로컬 HTML(main.html, login.html, mail.html)을 네이버 페이지 대신 사용하는 주소
+
+    Args:
+        location: fixture 디렉토리, 또는 그 디렉토리를 제공하는 HTTP 주소 (file://에서는 쿠키가 저장되지 않음)
+    """
+    location = str(location)
+    if location.startswith(('http://', 'https://')):
+        return {name: f'{location.rstrip("/")}/{name}.html' for name in NAVER_URLS}
+    directory = Path(location).resolve()
+    return {name: (directory / f'{name}.html').as_uri() for name in NAVER_URLS}
+
+
+class ClassCollector(HTMLParser):
+    """HTML에 사용된 class 이름을 모읍니다."""
+
+    def __init__(self):
+        super().__init__()
+        self.classes = set()
+
+    def handle_starttag(self, tag, attrs):
+        for name, value in attrs:
+            if name == 'class' and value:
+                self.classes.update(value.split())
+
+
+def page_classes(html):
+    collector = ClassCollector()
+    collector.feed(html)
+    return collector.classes
 
 
 class NaverCrawler:
     """네이버 크롤링을 위한 클래스"""
     
-    def __init__(self):
-        """크롤러 초기화"""
+    def __init__(self, pool=None, urls=None, headless=True, cookie_store=None):
+        """
+        크롤러 초기화
+
+        Args:
+            pool: 브라우저를 빌릴 BrowserPool (None이면 브라우저 하나짜리 풀을 만들어 사용)
+            urls: NAVER_URLS 대신 사용할 주소 (테스트용 로컬 HTML 등)
+            headless: pool을 직접 만들 때 화면 없이 실행할지 여부
+            cookie_store: 로그인 쿠키를 저장/복원할 CookieStore (None이면 매번 로그인)
+        """
+        self.pool = pool
+        self.owns_pool = pool is None
+        self.headless = headless if pool is None else pool.headless
+        self.urls = dict(NAVER_URLS, **(urls or {}))
+        self.cookie_store = cookie_store
         self.driver = None
+        # 브라우저 없이 페이지를 가져올 때 사용하는 requests.Session
+        self.session = None
         self.login_content = []
         self.mail_titles = []
         self.is_logged_in = False
@@ -28,12 +106,9 @@ class NaverCrawler:
         """셀레니움 웹드라이버 설정"""
         print('웹드라이버 설정 중...')
         
-        chrome_options = Options()
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        if self.pool is None:
+            self.pool = BrowserPool(size=1, headless=self.headless)
+        self.driver = self.pool.acquire()
         
         print('웹드라이버 설정 완료')
         return True
@@ -44,8 +119,7 @@ class NaverCrawler:
         
         # 로그인 전 네이버 메인 페이지 접속
         print('로그인 전 네이버 메인 페이지 분석 중...')
-        self.driver.get('https://www.naver.com')
-        time.sleep(2)
+        self.driver.get(self.urls['main'])
         
         # 로그인 전 특징적인 콘텐츠들 확인
         login_before = []
@@ -56,13 +130,18 @@ class NaverCrawler:
             {'name': '뉴스', 'selector': '.news_area'}
         ]
         
+        wait_for_ready(self.driver)
+        wait_for_any(self.driver, [element['selector'] for element in check_elements], timeout=5)
+        
+        # 모든 요소의 존재 여부를 한 번의 스크립트 호출로 확인
+        found = extract(self.driver, {
+            element['name']: {'selector': element['selector'], 'text': False, 'limit': 1}
+            for element in check_elements
+        })
         for element in check_elements:
-            try:
-                if self.driver.find_elements(By.CSS_SELECTOR, element['selector']):
-                    login_before.append(element['name'])
-                    print(f"  발견: {element['name']}")
-            except:
-                pass
+            if found[element['name']]:
+                login_before.append(element['name'])
+                print(f"  발견: {element['name']}")
         
         # 로그인 후 예상되는 콘텐츠들
         print('\n로그인 후 예상 콘텐츠:')
@@ -88,8 +167,7 @@ class NaverCrawler:
             return False
         
         # 네이버 로그인 페이지로 이동
-        self.driver.get('https://nid.naver.com/nidlogin.login')
-        time.sleep(2)
+        self.driver.get(self.urls['login'])
         
         # 아이디 입력
         id_input = WebDriverWait(self.driver, 10).until(
@@ -104,23 +182,86 @@ class NaverCrawler:
         # 로그인 버튼 클릭
         login_btn = self.driver.find_element(By.ID, 'log.login')
         login_btn.click()
-        time.sleep(3)
         
-        # 2차 인증 처리
-        print('2차 인증이 필요한 경우 브라우저에서 수동으로 처리해주세요.')
-        input('인증 완료 후 엔터를 눌러주세요...')
+        # 로그인 페이지를 벗어날 때까지 대기
+        try:
+            WebDriverWait(self.driver, 10).until(EC.url_changes(self.urls['login']))
+        except TimeoutException:
+            pass
+        
+        # 2차 인증 처리 (아직 로그인 페이지에 있고, 브라우저 화면이 보일 때만 사람이 처리 가능)
+        if 'login' in self.driver.current_url:
+            if self.headless:
+                # 화면 없이 실행 중이면 2차 인증(캡차, 기기 확인 등)을 처리할 수 없음
+                print('네이버 로그인 실패: 로그인 페이지를 벗어나지 못했습니다.')
+                print('2차 인증이 필요할 수 있으니 --show-browser 옵션으로 다시 실행해 브라우저에서 인증해주세요.')
+                return False
+            print('2차 인증이 필요한 경우 브라우저에서 수동으로 처리해주세요.')
+            input('인증 완료 후 엔터를 눌러주세요...')
         
         # 로그인 성공 여부 확인
         current_url = self.driver.current_url
         
-        if 'naver.com' in current_url and 'login' not in current_url:
+        if self.site_host() in urlsplit(current_url).netloc and 'login' not in current_url:
             self.is_logged_in = True
             print('네이버 로그인 성공!')
+            self.save_session()
             return True
         else:
             print('네이버 로그인 실패')
             return False
     
+    def save_session(self):
+        """로그인한 브라우저의 쿠키를 저장합니다."""
+        if self.cookie_store is None:
+            return
+        cookies = read_driver_cookies(self.driver, self.site_hostname())
+        if cookies:
+            self.cookie_store.save(cookies)
+            print(f'로그인 쿠키 {len(cookies)}개를 저장했습니다.')
+    
+    def restore_session(self):
+        """저장된 쿠키를 브라우저에 넣고, 로그인 상태가 유지되는지 확인합니다."""
+        cookies = self.cookie_store.load() if self.cookie_store else None
+        if not cookies:
+            return False
+        
+        restore_driver_cookies(self.driver, cookies)
+        self.driver.get(self.urls['main'])
+        wait_for_ready(self.driver)
+        login_button = {'selector': f'.{LOGIN_BUTTON_CLASS}', 'text': False, 'limit': 1}
+        if extract(self.driver, {'login_button': login_button})['login_button']:
+            print('저장된 로그인 쿠키가 만료되어 다시 로그인합니다.')
+            self.cookie_store.clear()
+            return False
+        
+        self.is_logged_in = True
+        print('저장된 로그인 쿠키로 로그인했습니다.')
+        return True
+    
+    def restore_http_session(self):
+        """저장된 쿠키로 브라우저 없이 로그인 상태의 requests.Session을 만듭니다."""
+        cookies = self.cookie_store.load() if self.cookie_store else None
+        if not cookies:
+            return False
+        
+        session = requests_session(cookies, HTTP_HEADERS)
+        try:
+            response = session.get(self.urls['main'], timeout=10)
+            response.raise_for_status()
+        except Exception as e:
+            print(f'브라우저 없이 페이지를 가져오지 못했습니다: {e}')
+            session.close()
+            return False
+        if LOGIN_BUTTON_CLASS in page_classes(response.text):
+            session.close()
+            return False
+        
+        self.session = session
+        self.is_logged_in = True
+        print('저장된 로그인 쿠키로 로그인했습니다. (브라우저 사용 안 함)')
+        return True
+    
     def get_login_content(self):
         """로그인 후에만 보이는 콘텐츠 크롤링"""
         if not self.is_logged_in:
@@ -129,24 +270,25 @@ class NaverCrawler:
         
         print('\n=== 로그인 후 콘텐츠 크롤링 ===')
         
-        # 네이버 메인 페이지 새로고침
-        self.driver.get('https://www.naver.com')
-        time.sleep(3)
+        if self.driver is None and self.session is not None:
+            # 브라우저 없이 메인 페이지 HTML의 class만 확인
+            classes = page_classes(self.session.get(self.urls['main'], timeout=10).text)
+        else:
+            # 네이버 메인 페이지 새로고침
+            self.driver.get(self.urls['main'])
+            wait_for_any(self.driver, ['.news_area', '.mail', '#query'], timeout=5)
+            found = extract(self.driver, {name: {'selector': f'.{name}', 'text': False, 'limit': 1}
+                                          for name in ('news_area', 'mail')})
+            classes = {name for name, items in found.items() if items}
         
         content_list = []
         
         # 개인화된 콘텐츠들 확인
-        try:
-            if self.driver.find_elements(By.CLASS_NAME, 'news_area'):
-                content_list.append('개인화된 뉴스 추천 콘텐츠')
-        except:
-            pass
+        if 'news_area' in classes:
+            content_list.append('개인화된 뉴스 추천 콘텐츠')
         
-        try:
-            if self.driver.find_elements(By.CLASS_NAME, 'mail'):
-                content_list.append('네이버 메일 알림 정보')
-        except:
-            pass
+        if 'mail' in classes:
+            content_list.append('네이버 메일 알림 정보')
         
         # 시뮬레이션 데이터
         if not content_list:
@@ -173,9 +315,13 @@ class NaverCrawler:
         
         print('\n=== 네이버 메일 제목 크롤링 ===')
         
+        if self.driver is None:
+            # 메일 목록은 스크립트로 그려지므로 브라우저가 필요
+            print('메일 목록은 브라우저가 필요하여 건너뜁니다.')
+            return []
+        
         # 네이버 메일 페이지로 이동
-        self.driver.get('https://mail.naver.com')
-        time.sleep(5)
+        self.driver.get(self.urls['mail'])
         
         mail_titles = []
         
@@ -186,18 +332,18 @@ class NaverCrawler:
             '.mail_list tr .subject'
         ]
         
+        # 메일 목록은 스크립트로 그려지므로 목록이 나타날 때까지 대기
+        wait_for_any(self.driver, mail_selectors, timeout=10)
+        
+        # 모든 선택자의 텍스트를 한 번의 스크립트 호출로 가져온 뒤 기존 순서대로 처리
+        found = extract(self.driver, {selector: selector for selector in mail_selectors})
         for selector in mail_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    title = element.text.strip()
-                    if title and len(title) > 5 and title not in mail_titles:
-                        mail_titles.append(title)
-                
-                if len(mail_titles) >= 5:
-                    break
-            except:
-                pass
+            for title in texts(found[selector]):
+                if len(title) > 5 and title not in mail_titles:
+                    mail_titles.append(title)
+            
+            if len(mail_titles) >= 5:
+                break
         
         # 실제 메일 제목을 찾을 수 없으면 시뮬레이션 데이터 사용
         if len(mail_titles) < 3:
@@ -239,41 +385,79 @@ class NaverCrawler:
         
         return all_content
     
+    def site_host(self):
+        """로그인 후 머물러야 하는 사이트 (www.naver.com -> naver.com, 로컬 파일이면 빈 문자열)"""
+        host = urlsplit(self.urls['main']).netloc
+        return host[4:] if host.startswith('www.') else host
+    
+    def site_hostname(self):
+        """쿠키 도메인과 비교할 호스트 이름 (포트 제외)"""
+        return self.site_host().split(':')[0]
+    
     def close_driver(self):
-        """웹드라이버 종료"""
+        """웹드라이버를 풀에 돌려놓고, 직접 만든 풀이면 종료"""
+        if self.session is not None:
+            self.session.close()
+            self.session = None
         if self.driver:
-            self.driver.quit()
+            self.pool.release(self.driver)
+            self.driver = None
+        if self.pool is not None and self.owns_pool:
+            self.pool.close()
+            self.pool = None
             print('웹드라이버 종료')
 
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description='네이버 로그인 전후 콘텐츠 크롤링')
+    parser.add_argument('--show-browser', action='store_true',
+                        help='브라우저 화면 표시 (2차 인증을 직접 처리해야 할 때)')
+    parser.add_argument('--fixtures', nargs='?', const=str(FIXTURE_DIR),
+                        help='네이버 대신 로컬 HTML 디렉토리 또는 그 HTTP 주소 사용 (기본: fixtures/)')
+    parser.add_argument('--cookies', default='naver_cookies.json', help='로그인 쿠키 파일')
+    parser.add_argument('--no-cookies', action='store_true', help='로그인 쿠키를 저장/복원하지 않음')
+    parser.add_argument('--no-browser', action='store_true',
+                        help='저장된 쿠키가 유효하면 브라우저 없이 가져올 수 있는 페이지만 크롤링')
+    args = parser.parse_args()
+    
     print('네이버 크롤링 프로그램 시작')
     print('=' * 60)
     
-    crawler = NaverCrawler()
+    urls = fixture_urls(args.fixtures) if args.fixtures else None
+    cookie_store = None if args.no_cookies else CookieStore(args.cookies)
+    crawler = NaverCrawler(urls=urls, headless=not args.show_browser, cookie_store=cookie_store)
     
     try:
-        # 1. 웹드라이버 설정
-        crawler.setup_driver()
+        logged_in = args.no_browser and crawler.restore_http_session()
         
-        # 2. 로그인 전후 콘텐츠 차이 분석
-        crawler.analyze_content_difference()
+        if not logged_in:
+            # 1. 웹드라이버 설정
+            crawler.setup_driver()
+            
+            # 2. 로그인 전후 콘텐츠 차이 분석
+            crawler.analyze_content_difference()
+            
+            # 3. 저장된 쿠키로 로그인 시도
+            logged_in = crawler.restore_session()
         
-        # 3. 사용자 입력 받기
-        print('\n' + '=' * 60)
-        username = input('네이버 아이디를 입력하세요: ')
-        password = input('네이버 비밀번호를 입력하세요: ')
+        if not logged_in:
+            # 4. 사용자 입력 받기
+            print('\n' + '=' * 60)
+            username = input('네이버 아이디를 입력하세요: ')
+            password = input('네이버 비밀번호를 입력하세요: ')
+            
+            # 5. 로그인 시도
+            logged_in = crawler.login_to_naver(username, password)
         
-        # 4. 로그인 시도
-        if crawler.login_to_naver(username, password):
-            # 5. 로그인 후 콘텐츠 크롤링
+        if logged_in:
+            # 6. 로그인 후 콘텐츠 크롤링
             crawler.get_login_content()
             
-            # 6. 메일 제목 크롤링 (보너스)
+            # 7. 메일 제목 크롤링 (보너스)
             crawler.get_mail_titles()
             
-            # 7. 결과 출력
+            # 8. 결과 출력
             results = crawler.display_results()
             
             print('\n' + '=' * 60)
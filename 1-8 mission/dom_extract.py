@@ -0,0 +1,99 @@
+"""
+한 번의 execute_script로 여러 선택자를 추출하는 도구
+
+find_elements()와 element.text, element.get_attribute()는 호출할 때마다 WebDriver 왕복이 생기므로
+요소가 많을수록 느려집니다. 추출할 선택자를 딕셔너리로 선언하여 브라우저에 한 번에 보내고,
+브라우저 안에서 텍스트와 속성을 모두 읽어 하나의 결과로 받습니다. (페이지당 왕복 1회)
+
+사용법:
+    page = extract(driver, {
+        'titles': 'tr.mail_item .subject',
+        'links': {'selector': 'a.news', 'attrs': ['href'], 'limit': 10},
+        'login_button': {'selector': '.link_login', 'text': False, 'limit': 1},
+    })
+    page['titles']          # [{'text': '제목1'}, {'text': '제목2'}, ...]
+    page['links'][0]        # {'text': '...', 'attrs': {'href': '...'}}
+    bool(page['login_button'])
+"""
+
+EXTRACT_SCRIPT = '''
+const fields = arguments[0];
+const result = {};
+for (const [key, field] of Object.entries(fields)) {
+    let nodes;
+    try {
+        nodes = document.querySelectorAll(field.selector);
+    } catch (error) {
+        result[key] = null;  // 잘못된 선택자
+        continue;
+    }
+    const count = field.limit === null ? nodes.length : Math.min(nodes.length, field.limit);
+    const items = [];
+    for (let i = 0; i < count; i++) {
+        const node = nodes[i];
+        const item = {};
+        if (field.text) {
+            // Selenium의 element.text처럼 화면에 보이는 텍스트
+            item.text = (node.innerText || '').trim();
+        }
+        if (field.attrs.length) {
+            item.attrs = {};
+            for (const name of field.attrs) {
+                item.attrs[name] = node.getAttribute(name);
+            }
+        }
+        items.push(item);
+    }
+    result[key] = items;
+}
+return result;
+'''
+
+# 선택자 중 처음으로 요소가 있는 선택자 (없으면 null)
+FIRST_MATCH_SCRIPT = '''
+for (const selector of arguments[0]) {
+    if (document.querySelector(selector) !== null) {
+        return selector;
+    }
+}
+return null;
+'''
+
+
+def normalize_fields(fields):
+    """{이름: 선택자 또는 {'selector', 'attrs', 'text', 'limit'}}를 스크립트에 넘길 형식으로 바꿉니다."""
+    normalized = {}
+    for key, field in fields.items():
+        if isinstance(field, str):
+            field = {'selector': field}
+        normalized[key] = {
+            'selector': field['selector'],
+            'attrs': list(field.get('attrs', ())),
+            'text': field.get('text', True),
+            'limit': field.get('limit'),
+        }
+    return normalized
+
+
+def extract(driver, fields):
+    """
+    선언한 선택자들의 텍스트/속성을 한 번의 왕복으로 가져옵니다.
+
+    Args:
+        fields: {이름: CSS 선택자} 또는 {이름: {'selector', 'attrs'(속성 이름 목록), 'text'(기본 True), 'limit'}}
+
+    Returns:
+        {이름: [{'text': ..., 'attrs': {...}}, ...]} (선택자가 잘못되었으면 빈 리스트)
+    """
+    result = driver.execute_script(EXTRACT_SCRIPT, normalize_fields(fields))
+    return {key: result.get(key) or [] for key in fields}
+
+
+def first_match(driver, selectors):
+    """요소가 있는 첫 번째 선택자 (없으면 None)"""
+    return driver.execute_script(FIRST_MATCH_SCRIPT, list(selectors))
+
+
+def texts(items):
+    """extract 결과에서 비어 있지 않은 텍스트만 순서대로 꺼냅니다."""
+    return [item['text'] for item in items if item.get('text')]
@@ -0,0 +1,79 @@
+"""메시지 생성 벤치마크.
+
+수신자마다 MIMEMultipart를 새로 만들고 html.replace 후 직렬화하던 기존 방식과
+미리 컴파일한 mail_template.MessageTemplate.render를 비교합니다.
+(SMTP로 보낼 bytes를 만드는 데까지의 CPU 시간)
+
+실행 방법: python bench_template.py [--recipients 100000] [--legacy 20000]
+"""
+
+import argparse
+import email
+import time
+from email.header import Header
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+from mail_template import MessageTemplate
+from mission import HTML_TEMPLATE
+
+SENDER = 'sender@naver.com'
+SUBJECT = '네이버 HTML 메일'
+
+
+def legacy_render(name, email_address):
+    """기존 create_message + 직렬화 (비교 기준)."""
+    msg = MIMEMultipart('alternative')
+    msg['Subject'] = Header(SUBJECT, 'utf-8')
+    msg['From'] = SENDER
+    msg['To'] = email_address
+    msg.attach(MIMEText(HTML_TEMPLATE.replace('{name}', name), 'html', 'utf-8'))
+    return msg.as_bytes(policy=msg.policy.clone(linesep='\r\n'))
+
+
+def timed(render, recipients):
+    started = time.perf_counter()
+    size = 0
+    for name, email_address in recipients:
+        size += len(render(name, email_address))
+    return time.perf_counter() - started, size
+
+
+def check(template, recipients):
+    """렌더링 결과를 파싱하여 본문과 받는 사람이 올바른지 확인."""
+    for name, email_address in recipients:
+        msg = email.message_from_bytes(template.render(name, email_address))
+        body = msg.get_payload()[0].get_payload(decode=True).decode('utf-8')
+        if msg['To'] != email_address or body != HTML_TEMPLATE.format(name=name):
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='메시지 생성 벤치마크')
+    parser.add_argument('--recipients', type=int, default=100000, help='수신자 수')
+    parser.add_argument('--legacy', type=int, default=20000, help='기존 방식으로 생성할 수신자 수 (느리므로 일부만)')
+    args = parser.parse_args()
+
+    recipients = [(f'user{i}', f'user{i}@example.com') for i in range(args.recipients)]
+
+    started = time.perf_counter()
+    template = MessageTemplate(SENDER, SUBJECT, HTML_TEMPLATE)
+    compile_time = time.perf_counter() - started
+
+    new_time, new_size = timed(template.render, recipients)
+    legacy_count = min(args.legacy, len(recipients))
+    old_time, _ = timed(legacy_render, recipients[:legacy_count])
+
+    new_per = new_time / len(recipients) * 1e6
+    old_per = old_time / legacy_count * 1e6
+    print(f'수신자: {len(recipients)}명 (기존 방식은 {legacy_count}명), 템플릿 컴파일: {compile_time * 1e3:.2f}ms')
+    print(f'{"방식":<10}{"us/통":>10}{"통/초":>12}')
+    print(f'{"legacy":<10}{old_per:>10.1f}{1e6 / old_per:>12.0f}')
+    print(f'{"template":<10}{new_per:>10.1f}{1e6 / new_per:>12.0f}')
+    print(f'속도 향상: {old_per / new_per:.1f}배, 전체 {new_time:.2f}초, {new_size / 1e6:.1f}MB')
+    print(f'결과 확인: {check(template, recipients[:100])}')
+
+
+if __name__ == '__main__':
+    main()
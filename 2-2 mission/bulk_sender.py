@@ -0,0 +1,383 @@
+"""대량 메일 발송 엔진.
+
+- 로그인한 SMTP 연결 N개가 하나의 작업 큐를 나눠서 처리
+- 고정 sleep 대신 토큰 버킷으로 초당 발송 수 제한 (연결 수와 무관하게 전체 속도 기준)
+- 서버가 PIPELINING을 지원하면 MAIL FROM / RCPT TO / DATA를 한 번에 보내 왕복을 줄임
+- 연결이 끊기거나 4xx 임시 오류면 다시 연결하여 재시도, 5xx 영구 오류는 바로 실패 처리
+- 수신자마다 결과(성공 여부, 응답 코드, 시도 횟수, 소요 시간) 기록
+
+실행 예 (로컬 테스트 서버: python smtp_standin.py --port 8025):
+    python bulk_sender.py mail_target_list.csv --host 127.0.0.1 --port 8025 --no-tls \\
+        --sender me@example.com --connections 8 --rate 200 --report report.csv
+"""
+
+import argparse
+import csv
+import getpass
+import queue
+import re
+import smtplib
+import ssl
+import threading
+import time
+
+from mail_template import MessageTemplate
+
+_LEADING_DOT = re.compile(br'(?m)^\.')
+
+
+class SendResult:
+    """수신자 한 명의 발송 결과."""
+
+    __slots__ = ('name', 'email', 'ok', 'code', 'error', 'attempts', 'elapsed', 'worker')
+
+    def __init__(self, name, email):
+        self.name = name
+        self.email = email
+        self.ok = False
+        self.code = None
+        self.error = None
+        self.attempts = 0
+        self.elapsed = 0.0
+        self.worker = None
+
+    def __repr__(self):
+        state = 'ok' if self.ok else f'error={self.error!r}'
+        return f'<SendResult {self.email} {state} code={self.code} attempts={self.attempts}>'
+
+
+class TokenBucket:
+    """스레드 여러 개가 함께 쓰는 토큰 버킷 (rate: 초당 발송 수, burst: 한 번에 몰아 보낼 수 있는 수)."""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, stop=None):
+        """토큰 하나를 꺼냅니다. 없으면 다음 토큰이 찰 때까지 기다립니다.
+
+        stop(threading.Event)이 설정되면 기다리지 않고 False를 반환합니다.
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+            if stop is None:
+                time.sleep(wait)
+            elif stop.wait(wait):
+                return False
+
+
+class SmtpConnection:
+    """로그인한 SMTP 연결 하나 (끊기면 connect()로 다시 연결)."""
+
+    def __init__(self, host, port, username=None, password=None, starttls=True, use_ssl=False,
+                 timeout=30, pipelining=True):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.use_ssl = use_ssl
+        self.timeout = timeout
+        self.pipelining = pipelining
+        self.smtp = None
+        self.can_pipeline = False
+
+    def connect(self):
+        """연결, STARTTLS, 로그인."""
+        self.close()
+        context = ssl.create_default_context()
+        if self.use_ssl:
+            smtp = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout, context=context)
+        else:
+            smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            smtp.ehlo()
+            if self.starttls and not self.use_ssl:
+                smtp.starttls(context=context)
+                smtp.ehlo()
+            if self.password:
+                smtp.login(self.username, self.password)
+        except BaseException:
+            smtp.close()
+            raise
+        self.smtp = smtp
+        self.can_pipeline = self.pipelining and smtp.has_extn('pipelining')
+
+    def close(self):
+        if self.smtp is None:
+            return
+        try:
+            self.smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self.smtp.close()
+        self.smtp = None
+
+    def send(self, sender, recipient, data):
+        """메시지 하나를 보냅니다 (data: CRLF 줄바꿈의 bytes). 서버의 최종 응답 코드를 반환합니다."""
+        if self.smtp is None:
+            self.connect()
+        if self.can_pipeline:
+            try:
+                commands = f'MAIL FROM:<{sender}>\r\nRCPT TO:<{recipient}>\r\nDATA\r\n'.encode('ascii')
+            except UnicodeEncodeError:
+                commands = None  # 한글 주소 등은 SMTPUTF8이 필요하므로 smtplib에 맡김
+            if commands is not None:
+                return self._send_pipelined(sender, recipient, commands, data)
+        self.smtp.sendmail(sender, [recipient], data)
+        return 250
+
+    def _send_pipelined(self, sender, recipient, commands, data):
+        smtp = self.smtp
+        smtp.send(commands)
+        mail_code, mail_reply = smtp.getreply()
+        rcpt_code, rcpt_reply = smtp.getreply()
+        data_code, data_reply = smtp.getreply()
+
+        if data_code == 354:
+            if mail_code != 250 or rcpt_code not in (250, 251):
+                # 명령이 거절되었는데 DATA를 받은 경우: 빈 본문으로 끝내고 초기화
+                smtp.send(b'.\r\n')
+                smtp.getreply()
+            else:
+                body = _LEADING_DOT.sub(b'..', data)
+                if not body.endswith(b'\r\n'):
+                    body += b'\r\n'
+                smtp.send(body + b'.\r\n')
+                code, reply = smtp.getreply()
+                if code != 250:
+                    smtp.rset()
+                    raise smtplib.SMTPDataError(code, reply)
+                return code
+
+        smtp.rset()
+        if mail_code != 250:
+            raise smtplib.SMTPSenderRefused(mail_code, mail_reply, sender)
+        if rcpt_code not in (250, 251):
+            raise smtplib.SMTPRecipientsRefused({recipient: (rcpt_code, rcpt_reply)})
+        raise smtplib.SMTPDataError(data_code, data_reply)
+
+
+def error_code(error):
+    """SMTP 오류의 응답 코드 (코드가 없는 오류는 None)."""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return next(iter(error.recipients.values()))[0]
+    return getattr(error, 'smtp_code', None)
+
+
+def is_retryable(error):
+    """다시 시도하면 성공할 수 있는 오류인지 (연결 오류, 4xx 임시 오류)."""
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    code = error_code(error)
+    if code is not None:
+        return 400 <= code < 500
+    if isinstance(error, smtplib.SMTPException):
+        return False
+    # 연결 거부, 타임아웃 등 네트워크 오류
+    return isinstance(error, OSError)
+
+
+class BulkSender:
+    """SMTP 연결 풀로 수신자별 메시지를 발송합니다.
+
+    사용법:
+        sender = BulkSender('smtp.naver.com', 587, 'me@naver.com', password, connections=4, rate=2)
+        results = sender.send(recipients, lambda name, email: create_message(...))
+    """
+
+    def __init__(self, host, port, username=None, password=None, sender=None, connections=4,
+                 rate=None, burst=1, starttls=True, use_ssl=False, timeout=30, retries=2,
+                 retry_delay=1.0, pipelining=True):
+        """
+        Args:
+            sender: 봉투 발신자 주소 (None이면 username)
+            connections: 동시에 사용할 SMTP 연결 수
+            rate: 전체 초당 발송 수 (None이면 제한 없음)
+            burst: 토큰 버킷 크기
+            retries: 연결 오류/임시 오류 시 추가 시도 횟수
+            retry_delay: 재시도 전 대기 시간(초), 시도마다 두 배
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.sender = sender or username
+        self.connections = connections
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.starttls = starttls
+        self.use_ssl = use_ssl
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.pipelining = pipelining
+        self.stop_event = threading.Event()
+        # 인증 실패처럼 모든 연결에 해당하는 오류 (발송을 멈춘 원인)
+        self.fatal_error = None
+
+    def new_connection(self):
+        return SmtpConnection(self.host, self.port, self.username, self.password, self.starttls,
+                              self.use_ssl, self.timeout, self.pipelining)
+
+    def send(self, recipients, build_message, on_result=None):
+        """수신자마다 build_message(name, email)로 만든 메시지를 보냅니다.
+
+        Args:
+            recipients: (이름, 이메일) 목록
+            build_message: (이름, 이메일) -> email.message.Message 또는 CRLF 줄바꿈의 bytes
+                (mail_template.MessageTemplate.render)
+            on_result: 결과가 나올 때마다 호출할 함수 (여러 스레드에서 호출됨)
+
+        Returns:
+            recipients 순서대로 SendResult 목록
+        """
+        self.stop_event.clear()
+        self.fatal_error = None
+        results = [SendResult(name, email) for name, email in recipients]
+        jobs = queue.SimpleQueue()
+        for result in results:
+            jobs.put(result)
+
+        callback_lock = threading.Lock()
+
+        def report(result):
+            if on_result is not None:
+                with callback_lock:
+                    on_result(result)
+
+        workers = [
+            threading.Thread(target=self._worker, args=(number, jobs, build_message, report),
+                             name=f'smtp-{number}', daemon=True)
+            for number in range(min(self.connections, len(results)))
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            for worker in workers:
+                worker.join()
+        except KeyboardInterrupt:
+            # 보내는 중인 메시지까지만 마치고 종료
+            self.stop_event.set()
+            for worker in workers:
+                worker.join()
+            raise
+        return results
+
+    def _worker(self, number, jobs, build_message, report):
+        connection = self.new_connection()
+        try:
+            while True:
+                try:
+                    result = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                if self.stop_event.is_set():
+                    result.error = '중단됨'
+                elif self.bucket is not None and not self.bucket.acquire(self.stop_event):
+                    result.error = '중단됨'
+                else:
+                    result.worker = number
+                    self._deliver(connection, result, build_message)
+                report(result)
+        finally:
+            connection.close()
+
+    def _deliver(self, connection, result, build_message):
+        started = time.perf_counter()
+        try:
+            data = build_message(result.name, result.email)
+            if not isinstance(data, bytes):
+                # 메시지의 정책(MIMEMultipart는 compat32)을 유지하면서 SMTP 규격의 CRLF 줄바꿈으로 직렬화
+                data = data.as_bytes(policy=data.policy.clone(linesep='\r\n'))
+        except Exception as e:
+            result.error = f'메시지 생성 실패: {e}'
+            return
+
+        for attempt in range(1, self.retries + 2):
+            result.attempts = attempt
+            try:
+                result.code = connection.send(self.sender, result.email, data)
+                result.ok = True
+                result.error = None
+                break
+            except Exception as e:
+                result.code = error_code(e)
+                result.error = str(e) or type(e).__name__
+                if isinstance(e, smtplib.SMTPAuthenticationError):
+                    # 다른 연결도 같은 계정이므로 모두 멈춤
+                    self.fatal_error = e
+                    self.stop_event.set()
+                    break
+                if not is_retryable(e) or attempt > self.retries or self.stop_event.is_set():
+                    break
+                # 연결 상태를 알 수 없으므로 새로 연결
+                connection.close()
+                if self.stop_event.wait(self.retry_delay * 2 ** (attempt - 1)):
+                    break
+        result.elapsed = time.perf_counter() - started
+
+
+def write_report(path, results):
+    """수신자별 결과를 CSV로 저장."""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['email', 'name', 'ok', 'code', 'attempts', 'elapsed', 'error'])
+        for r in results:
+            writer.writerow([r.email, r.name, int(r.ok), r.code or '', r.attempts, f'{r.elapsed:.3f}', r.error or ''])
+
+
+def main():
+    from mission import HTML_TEMPLATE, read_csv
+
+    parser = argparse.ArgumentParser(description='CSV 수신자에게 HTML 메일 대량 발송')
+    parser.add_argument('csv', nargs='?', default='mail_target_list.csv', help='수신자 CSV')
+    parser.add_argument('--host', default='smtp.naver.com')
+    parser.add_argument('--port', type=int, default=587)
+    parser.add_argument('--ssl', action='store_true', help='처음부터 TLS로 연결 (보통 465 포트)')
+    parser.add_argument('--no-tls', action='store_true', help='STARTTLS 사용 안 함 (로컬 테스트 서버)')
+    parser.add_argument('--sender', help='발신자 이메일 (로그인 아이디)')
+    parser.add_argument('--password', help='비밀번호 (없으면 입력받음, 빈 값이면 로그인 안 함)')
+    parser.add_argument('--subject', default='네이버 HTML 메일')
+    parser.add_argument('--connections', type=int, default=4, help='동시에 사용할 SMTP 연결 수')
+    parser.add_argument('--rate', type=float, default=1.0, help='초당 발송 수 (0이면 제한 없음)')
+    parser.add_argument('--burst', type=int, default=1, help='한 번에 몰아 보낼 수 있는 수')
+    parser.add_argument('--retries', type=int, default=2)
+    parser.add_argument('--report', help='수신자별 결과 CSV 경로')
+    args = parser.parse_args()
+
+    recipients = read_csv(args.csv)
+    if not recipients:
+        return
+    sender = args.sender or input('발신자 이메일: ').strip()
+    password = args.password if args.password is not None else getpass.getpass('비밀번호: ')
+
+    bulk = BulkSender(args.host, args.port, sender, password, connections=args.connections,
+                      rate=args.rate or None, burst=args.burst, starttls=not args.no_tls,
+                      use_ssl=args.ssl, retries=args.retries)
+
+    def on_result(r):
+        print(f'✓ {r.email}' if r.ok else f'✗ {r.email}: {r.error}')
+
+    template = MessageTemplate(sender, args.subject, HTML_TEMPLATE)
+    started = time.perf_counter()
+    results = bulk.send(recipients, template.render, on_result)
+    elapsed = time.perf_counter() - started
+
+    success = sum(r.ok for r in results)
+    print(f'\n결과: 성공 {success}, 실패 {len(results) - success} ({elapsed:.2f}초, {len(results) / elapsed:.1f}통/초)')
+    if args.report:
+        write_report(args.report, results)
+        print(f'결과 저장: {args.report}')
+
+
+if __name__ == '__main__':
+    main()
@@ -2,10 +2,39 @@
 
 import smtplib
 import csv
+from functools import lru_cache
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.header import Header
-import time
+
+from bulk_sender import BulkSender
+from mail_template import MessageTemplate, Template
+
+# HTML 템플릿 ({name}은 수신자 이름, {{ }}는 { }로 출력)
+HTML_TEMPLATE = '''
+<!DOCTYPE html>
+<html>
+<head><meta charset="UTF-8">
+
+<style>
+body{{font-family:'Malgun Gothic',Arial;margin:0;padding:0}}
+.box{{max-width:600px;margin:20px auto;border:1px solid #ddd}}
+.head{{background:#03C75A;color:#fff;padding:20px;text-align:center}}
+.body{{padding:30px}}
+</style>
+</head>
+
+<body>
+<div class="box">
+<div class="head"><h1>네이버 메일</h1></div>
+<div class="body"><p><strong>{name}</strong>님 안녕하세요!</p>
+<p>네이버 SMTP를 통한 HTML 메일 발송 테스트입니다.</p>
+<ul><li>개인화된 메시지</li><li>HTML 스타일링</li><li>CSV 기반 발송</li></ul>
+</div>
+</div>
+</body>
+</html>
+'''
 
 
 def read_csv(filename):
@@ -24,33 +53,43 @@ def read_csv(filename):
     return recipients
 
 
+@lru_cache(maxsize=8)
+def compile_template(html):
+    """템플릿은 한 번만 파싱."""
+    return Template(html)
+
+
 def create_message(sender, name, email, subject, html):
-    """HTML 메시지 생성."""
+    """
+    HTML 메시지 생성.
+
+    {name}만 채우고 다른 {단어}는 그대로 둡니다. 이름은 HTML 이스케이프하며, {{ }}는 { }로 출력합니다.
+    """
     msg = MIMEMultipart('alternative')
     msg['Subject'] = Header(subject, 'utf-8')
     msg['From'] = sender
     msg['To'] = email
-    msg.attach(MIMEText(html.replace('{name}', name), 'html', 'utf-8'))
+    msg.attach(MIMEText(compile_template(html).render({'name': name}), 'html', 'utf-8'))
     return msg
 
 
-def send_individual(sender, password, recipients, subject, html):
-    """개별 발송."""
-    success = fail = 0
+def send_individual(sender, password, recipients, subject, html, connections=2, rate=1.0,
+                    host='smtp.naver.com', port=587):
+    """개별 발송 (SMTP 연결 connections개, 전체 초당 rate통)."""
+    bulk = BulkSender(host, port, sender, password, connections=connections, rate=rate)
+    template = MessageTemplate(sender, subject, compile_template(html))
     
-    with smtplib.SMTP('smtp.naver.com', 587) as smtp:
-        smtp.starttls()
-        smtp.login(sender, password)
-        for name, email in recipients:
-            try:
-                smtp.send_message(create_message(sender, name, email, subject, html))
-                print(f'✓ {email}')
-                success += 1
-                time.sleep(1)
-            except Exception as e:
-                print(f'✗ {email}: {e}')
-                fail += 1
-    return success, fail
+    def on_result(result):
+        if result.ok:
+            print(f'✓ {result.email}')
+        else:
+            print(f'✗ {result.email}: {result.error}')
+    
+    results = bulk.send(recipients, template.render, on_result)
+    if bulk.fatal_error is not None:
+        raise bulk.fatal_error
+    success = sum(result.ok for result in results)
+    return success, len(results) - success
 
 
 def send_bulk(sender, password, recipients, subject, html):
@@ -102,31 +141,7 @@ def main():
         print('네이버 메일 설정을 먼저 완료해주세요.')
         return
     
-    # HTML 템플릿
-    html = '''
-<!DOCTYPE html>
-<html>
-<head><meta charset="UTF-8">
-
-<style>
-body{{font-family:'Malgun Gothic',Arial;margin:0;padding:0}}
-.box{{max-width:600px;margin:20px auto;border:1px solid #ddd}}
-.head{{background:#03C75A;color:#fff;padding:20px;text-align:center}}
-.body{{padding:30px}}
-</style>
-</head>
-
-<body>
-<div class="box">
-<div class="head"><h1>네이버 메일</h1></div>
-<div class="body"><p><strong>{name}</strong>님 안녕하세요!</p>
-<p>네이버 SMTP를 통한 HTML 메일 발송 테스트입니다.</p>
-<ul><li>개인화된 메시지</li><li>HTML 스타일링</li><li>CSV 기반 발송</li></ul>
-</div>
-</div>
-</body>
-</html>
-'''
+    html = HTML_TEMPLATE
     
     # 발송 방식 선택
     print('\n[발송 방식]')
@@ -0,0 +1,89 @@
+"""bulk_sender 테스트용 로컬 SMTP 서버 (aiosmtpd 필요: pip install aiosmtpd).
+
+- PIPELINING을 광고하고, 받은 메시지는 저장하지 않고 개수만 셈
+- 주소에 reject가 있으면 550, tempfail이 있으면 처음 한 번만 451로 거절
+- --drop-every N: 연결마다 N통을 받은 뒤 다음 메시지에서 연결을 끊음 (재연결 확인용)
+- --delay: 메시지마다 응답 지연(초) (원격 서버의 왕복 시간 흉내)
+- --auth: 아무 아이디/비밀번호나 허용하는 AUTH PLAIN/LOGIN 제공 (TLS 없이)
+
+실행 방법: python smtp_standin.py [--port 8025] [--drop-every 50] [--delay 0.05] [--auth]
+"""
+
+import argparse
+import asyncio
+import time
+
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+
+class CountingHandler:
+    """받은 메시지 수를 세는 aiosmtpd 핸들러."""
+
+    def __init__(self, drop_every=0, delay=0.0):
+        self.drop_every = drop_every
+        self.delay = delay
+        self.received = 0
+        self.rejected = 0
+        self.dropped = 0
+        self.tempfailed = set()
+        self.per_session = {}
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        session.host_name = hostname
+        return responses[:-1] + ['250-PIPELINING'] + responses[-1:]
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if 'reject' in address:
+            self.rejected += 1
+            return '550 5.1.1 Mailbox unavailable'
+        if 'tempfail' in address and address not in self.tempfailed:
+            self.tempfailed.add(address)
+            return '451 4.3.0 Try again later'
+        envelope.rcpt_tos.append(address)
+        return '250 OK'
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        count = self.per_session[id(session)] = self.per_session.get(id(session), 0) + 1
+        if self.drop_every and count > self.drop_every:
+            # 받지 않고 연결을 끊음 (클라이언트는 다시 연결하여 보내야 함)
+            self.dropped += 1
+            self.per_session.pop(id(session))
+            server.transport.close()
+            return '421 4.4.2 Closing connection'
+        self.received += 1
+        return '250 Message accepted'
+
+
+def accept_any(server, session, envelope, mechanism, auth_data):
+    return AuthResult(success=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='테스트용 로컬 SMTP 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8025)
+    parser.add_argument('--drop-every', type=int, default=0, help='연결마다 N통 후 연결 끊기')
+    parser.add_argument('--delay', type=float, default=0.0, help='메시지마다 응답 지연(초)')
+    parser.add_argument('--auth', action='store_true', help='아무 계정이나 허용하는 AUTH 사용')
+    args = parser.parse_args()
+
+    handler = CountingHandler(args.drop_every, args.delay)
+    options = {'authenticator': accept_any, 'auth_require_tls': False} if args.auth else {}
+    controller = Controller(handler, hostname=args.host, port=args.port, **options)
+    controller.start()
+    print(f'SMTP 테스트 서버: {args.host}:{args.port} (Ctrl+C로 종료)')
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        controller.stop()
+        print(f'수신 {handler.received}통, 거절 {handler.rejected}, 연결 끊기 {handler.dropped}')
+
+
+if __name__ == '__main__':
+    main()
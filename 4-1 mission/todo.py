@@ -1,4 +1,7 @@
 # todo.py
+# 실행 방법: PYTHONPATH=.. python todo.py
+#   (저장소 루트의 common 패키지를 사용하므로 PYTHONPATH에 저장소 루트를 지정합니다.
+#    Windows: set PYTHONPATH=.. 후 python todo.py)
 
 from fastapi import FastAPI, APIRouter, HTTPException
 from typing import Dict, List, Optional
@@ -15,6 +18,9 @@ except ImportError:
     print('---' * 10)
     exit() # 모델 없이는 실행 중단
 
+from common.rate_limit import AdmissionController, AdmissionControlMiddleware, RateLimit
+from common.metrics import REGISTRY, MetricsMiddleware, render_metrics_response
+
 # 전역 todo_list
 todo_list: List[Dict] = []
 
@@ -23,6 +29,9 @@ CSV_FILE = 'todo_data.csv'
 # 2. (수정) CSV 파일 헤더에 'id'를 포함하여 고정합니다.
 CSV_FIELDNAMES = ['id', 'title', 'description', 'completed']
 
+# CSV 저장(flush)에 걸린 시간 (/metrics)
+CSV_FLUSH_DURATION = REGISTRY.histogram('todo_csv_flush_seconds', 'TODO CSV 파일 저장 시간')
+
 
 def load_todos_from_csv():
     '''
@@ -58,7 +67,7 @@ def save_todos_to_csv():
     (고정된 CSV_FIELDNAMES 사용)
     '''
     try:
-        with open(CSV_FILE, 'w', encoding='utf-8', newline='') as file:
+        with CSV_FLUSH_DURATION.time(), open(CSV_FILE, 'w', encoding='utf-8', newline='') as file:
             # 3. (수정) fieldnames를 고정된 값으로 사용
             writer = csv.DictWriter(file, fieldnames=CSV_FIELDNAMES)
             writer.writeheader()
@@ -92,6 +101,37 @@ async def lifespan(app: FastAPI):
 app = FastAPI(lifespan=lifespan)
 router = APIRouter()
 
+# 과부하 방지: 클라이언트/라우트 분류별 토큰 버킷 + 동시 실행 제한
+# - list: 전체 목록 조회 (응답이 가장 큼)
+# - write: 추가/수정/삭제 (CSV 전체를 다시 저장)
+admission_controller = AdmissionController(
+    route_rules=[
+        ('GET', '/retrieve_todo', 'list'),
+        ('POST|PUT|DELETE', '/.*', 'write'),
+    ],
+    limits={
+        'list': RateLimit(rate=5, burst=10),
+        'write': RateLimit(rate=10, burst=20),
+        'default': RateLimit(rate=50, burst=100),
+    },
+    max_concurrent=16,
+    max_queue=32,
+    queue_timeout=1.0
+)
+app.add_middleware(AdmissionControlMiddleware, controller=admission_controller)
+
+# 요청 지연 시간/응답 크기/처리 중 요청 수 기록 (바깥쪽 미들웨어라 429/503 응답도 기록됨)
+app.add_middleware(MetricsMiddleware)
+REGISTRY.add_collector(lambda: [
+    (f'admission_{name}', 'gauge', f'승인 제어 {name}', value)
+    if name in ('in_flight', 'queued') else
+    (f'admission_{name}_total', 'counter', f'승인 제어 {name}', value)
+    for name, value in admission_controller.stats().items()
+])
+REGISTRY.add_collector(lambda: [
+    ('todo_items', 'gauge', '메모리에 로드된 TODO 항목 수', len(todo_list))
+])
+
 
 @router.post('/add_todo')
 async def add_todo(todo_item: TodoItem) -> Dict:
@@ -203,6 +243,25 @@ async def delete_single_todo(todo_id: int) -> Dict:
 # --- ---
 
 
+@router.get('/metrics', include_in_schema=False)
+async def metrics():
+    '''
+    Prometheus 텍스트 포맷으로 메트릭을 반환하는 GET 엔드포인트
+    '''
+    return render_metrics_response()
+
+
+@router.get('/admission_stats')
+async def admission_stats() -> Dict:
+    '''
+    속도 제한/승인 제어 카운터를 반환하는 GET 엔드포인트
+    '''
+    return {
+        'status': 'success',
+        'data': admission_controller.stats()
+    }
+
+
 # 라우터를 앱에 등록
 app.include_router(router)
 
@@ -215,4 +274,4 @@ if __name__ == '__main__':
     except ImportError:
         print('Error: uvicorn이 설치되어 있지 않습니다.')
         print('  pip install uvicorn')
-        print('  uvicorn todo:app --reload')
\ No newline at end of file
+        print('  PYTHONPATH=.. uvicorn todo:app --reload')
\ No newline at end of file
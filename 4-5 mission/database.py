@@ -1,6 +1,5 @@
 # database.py
 from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 # 데이터베이스 접속 주소
@@ -14,5 +13,6 @@ engine = create_engine(
 # 세션 설정
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Base 객체 생성 (이 부분이 없어서 에러가 난 것입니다)
-Base = declarative_base()
\ No newline at end of file
+# Base 객체 (4-6 mission과 함께 쓰는 common/board_models.py의 Base, 모델과 마이그레이션이 같은 메타데이터를 사용)
+from common import board_models
+Base = board_models.Base
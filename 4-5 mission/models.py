@@ -1,20 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
-from database import Base
+# 모델은 4-6 mission과 함께 쓰는 common/board_models.py에 정의되어 있습니다.
+# (마이그레이션도 common/board_migrations 하나를 함께 사용)
+from common.board_models import Answer, Base, ChangeSequence, Question
 
-class Question(Base):
-    __tablename__ = 'question'
-
-    id = Column(Integer, primary_key=True)
-    subject = Column(String, nullable=False)
-    content = Column(Text, nullable=False)
-    create_date = Column(DateTime, nullable=False)
-
-class Answer(Base):
-    __tablename__ = 'answer'
-
-    id = Column(Integer, primary_key=True)
-    content = Column(Text, nullable=False)
-    create_date = Column(DateTime, nullable=False)
-    question_id = Column(Integer, ForeignKey('question.id'))
-    question = relationship('Question', backref='answers')
\ No newline at end of file
+__all__ = ['Answer', 'Base', 'ChangeSequence', 'Question']
@@ -0,0 +1,113 @@
+"""그룹 커밋 작성기(QuestionBatchWriter) 동작 확인 스크립트.
+
+임시 디렉토리에 board.db를 만들고(alembic upgrade head) 다음을 확인합니다 (board.db는 건드리지 않음).
+- 묶음 커밋: 동시에 들어온 요청이 한 트랜잭션으로 커밋됨
+- 실패 격리: 요청 처리용 세션이 쓰기 트랜잭션을 연 상태에서 작성기의 묶음이 실패해도
+  그 요청의 쓰기는 되돌려지지 않고, 같은 묶음의 정상 요청은 하나씩 다시 커밋됨
+
+실행 방법 (4-6 mission 디렉토리에서): PYTHONPATH=.. python check_batch_writer.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# database.py의 DATABASE_URL(sqlite:///board.db)은 현재 디렉토리 기준이므로 import 전에 임시 디렉토리로 이동
+WORKDIR = tempfile.mkdtemp()
+os.chdir(WORKDIR)
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import func, select
+
+from database import ALEMBIC_INI, SessionLocal, WriterSessionLocal
+from domain.question.batch_writer import QuestionBatchWriter
+from domain.question.service import next_change_seqs
+from models import Question
+from schemas import QuestionCreate
+
+failures = []
+
+
+def check(name, condition, detail=''):
+    print(f'{"OK  " if condition else "FAIL"} {name}' + (f' ({detail})' if detail else ''))
+    if not condition:
+        failures.append(name)
+
+
+def subjects():
+    with SessionLocal() as db:
+        return set(db.execute(select(Question.subject)).scalars())
+
+
+def submit_all(writer, questions):
+    """질문들을 동시에 submit하고 (결과 또는 예외) 목록을 반환합니다."""
+    results = [None] * len(questions)
+
+    def submit(index):
+        try:
+            results[index] = writer.submit(questions[index])
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=submit, args=(index,)) for index in range(len(questions))]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def check_batching(writer):
+    threads, results = submit_all(writer, [QuestionCreate(subject=f'batch {i}', content='내용') for i in range(20)])
+    for thread in threads:
+        thread.join()
+    ok = [result for result in results if isinstance(result, Question)]
+    check('묶음 커밋: 모든 요청 성공', len(ok) == 20, f'{len(ok)}개')
+    check('묶음 커밋: 모두 저장됨', {f'batch {i}' for i in range(20)} <= subjects())
+
+
+def check_failure_isolation(writer):
+    # 요청 처리용 세션에서 쓰기 트랜잭션을 열어 둠 (아직 커밋하지 않음)
+    request_db = SessionLocal()
+    request_db.add(Question(subject='open request', content='내용', change_seq=next_change_seqs(request_db)[0]))
+    request_db.flush()
+
+    # 같은 묶음에 NOT NULL 위반 요청과 정상 요청을 함께 넣어 묶음 커밋을 실패시킴
+    bad = QuestionCreate.model_construct(subject=None, content='내용')
+    good = QuestionCreate(subject='good in failed batch', content='내용')
+    threads, results = submit_all(writer, [bad, good])
+
+    time.sleep(0.3)
+    request_db.commit()
+    request_db.close()
+    for thread in threads:
+        thread.join()
+
+    saved = subjects()
+    check('실패 격리: 잘못된 요청은 오류', isinstance(results[0], Exception), repr(results[0]))
+    check('실패 격리: 같은 묶음의 정상 요청은 저장', isinstance(results[1], Question)
+          and 'good in failed batch' in saved, repr(results[1]))
+    check('실패 격리: 열려 있던 요청 트랜잭션은 되돌려지지 않음', 'open request' in saved)
+    with SessionLocal() as db:
+        seqs = db.execute(select(func.count(Question.change_seq.distinct()), func.count())).one()
+    check('실패 격리: change_seq 중복 없음', seqs[0] == seqs[1], f'{seqs[0]}/{seqs[1]}')
+
+
+def main():
+    command.upgrade(Config(ALEMBIC_INI), 'head')
+    writer = QuestionBatchWriter(WriterSessionLocal, max_batch_size=50, max_delay=0.05)
+    writer.start()
+    try:
+        check_batching(writer)
+        check_failure_isolation(writer)
+    finally:
+        writer.stop()
+    print(json.dumps({'failed': failures}, ensure_ascii=False))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
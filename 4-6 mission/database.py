@@ -5,14 +5,20 @@
 프로젝트의 데이터베이스 계층 초기화 단계에서 실행됩니다.
 """
 import contextlib
-from sqlalchemy import create_engine
+import os
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from common.metrics import REGISTRY
+
 # SQLite 데이터베이스 설정
 # 동작: 프로젝트 루트에 board.db 파일을 생성하거나 연결합니다
 DATABASE_URL = 'sqlite:///board.db'
 
+# Alembic 설정 파일 경로 (sqlalchemy.url이 DATABASE_URL과 같은 board.db를 가리킵니다)
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'alembic.ini')
+
 # autocommit=False로 설정
 # 동작: SQLAlchemy 엔진을 생성합니다. 이 엔진은 데이터베이스와의 연결을 관리합니다.
 # - connect_args: SQLite의 스레드 안전성 체크 비활성화 (멀티스레드 환경 대비)
@@ -31,15 +37,80 @@ engine = create_engine(
 # - bind=engine: 위에서 생성한 엔진과 연결
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 동작: 그룹 커밋 작성기(domain/question/batch_writer.py) 전용 엔진과 세션 팩토리입니다.
+# StaticPool은 연결이 하나뿐이므로 작성기가 engine을 같이 쓰면 작성기의 commit()/rollback()이
+# 같은 연결에서 진행 중인 다른 요청의 트랜잭션까지 커밋하거나 되돌립니다.
+# 별도 연결을 쓰면 두 트랜잭션이 분리되고, 동시에 쓰려고 하면 SQLite 잠금으로 순서가 정해집니다.
+writer_engine = create_engine(
+    DATABASE_URL,
+    connect_args={'check_same_thread': False},
+    poolclass=StaticPool,
+    echo=False
+)
+WriterSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=writer_engine)
+
+# 연결 풀 메트릭 (/metrics)
+DB_POOL_CHECKOUTS = REGISTRY.counter('db_pool_checkouts_total', '연결 풀에서 연결을 꺼낸 횟수')
+DB_POOL_CHECKED_OUT = REGISTRY.gauge('db_pool_checked_out', '현재 사용 중인 연결 수')
+DB_POOL_WAIT = REGISTRY.histogram('db_pool_wait_seconds', '세션이 연결을 얻기까지 기다린 시간')
+
+
+@event.listens_for(engine, 'checkout')
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    DB_POOL_CHECKOUTS.inc()
+    DB_POOL_CHECKED_OUT.inc()
+
+
+@event.listens_for(engine, 'checkin')
+def _on_checkin(dbapi_connection, connection_record):
+    DB_POOL_CHECKED_OUT.dec()
+
+
 @contextlib.contextmanager
 def get_db():
     db = SessionLocal()
     print("--- DB 세션 연결됨 ---")  # 테스트용 로그 추가
     try:
+        # 동작: 연결을 미리 얻어 풀 대기 시간을 측정합니다.
+        with DB_POOL_WAIT.time():
+            db.connection()
         yield db
     except Exception:
         db.rollback()
         raise
     finally:
         print("--- DB 세션 종료됨 ---")  # 테스트용 로그 추가
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def check_schema_revision():
+    """
+    데이터베이스 스키마가 최신 마이그레이션(head)인지 확인합니다.
+    
+    동작 흐름:
+    1. alembic.ini의 script_location(common/board_migrations)에서 head 리비전을 읽음
+    2. alembic_version 테이블에서 현재 DB의 리비전을 읽음
+    3. 두 값이 다르면 RuntimeError를 발생시켜 서버 기동을 중단
+    
+    Returns:
+        현재 DB의 리비전 문자열
+        
+    Raises:
+        RuntimeError: DB 리비전이 head와 다른 경우 (alembic upgrade head 필요)
+    """
+    from alembic.config import Config
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    script = ScriptDirectory.from_config(Config(ALEMBIC_INI))
+    head_revision = script.get_current_head()
+
+    with engine.connect() as connection:
+        current_revision = MigrationContext.configure(connection).get_current_revision()
+
+    if current_revision != head_revision:
+        raise RuntimeError(
+            f'DB 스키마 리비전({current_revision})이 최신({head_revision})이 아닙니다. '
+            '"alembic upgrade head"를 먼저 실행하세요.'
+        )
+    return current_revision
@@ -0,0 +1,209 @@
+"""
+질문(Question) 그룹 커밋(group commit) 모듈
+
+짧은 시간 동안 들어온 질문 등록 요청을 모아 하나의 트랜잭션으로 커밋합니다.
+요청마다 커밋(SQLite fsync)하는 대신 묶음당 한 번만 커밋하므로
+순간적으로 요청이 몰릴 때 DB 잠금 대기가 줄어듭니다.
+
+각 호출자는 자신의 질문이 커밋될 때까지 기다린 뒤 결과를 받으므로
+응답을 받은 질문은 항상 디스크에 기록된 상태입니다.
+대신 최대 max_delay 초만큼 응답이 늦어질 수 있습니다 (durability window).
+
+워커 스레드가 비정상 종료되면 대기 중인 모든 요청에 예외를 전달하고,
+이후의 submit()은 바로 실패합니다. 호출자는 최대 submit_timeout 초까지만 기다립니다.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import List, Optional, Tuple
+
+from models import Question
+from schemas import QuestionCreate
+from domain.question.service import next_change_seqs
+
+# 동작: 워커 스레드 종료 신호로 사용하는 객체
+_STOP = object()
+
+# 동작: submit()이 커밋을 기다리는 기본 최대 시간(초)
+DEFAULT_SUBMIT_TIMEOUT = 10.0
+
+
+class QuestionBatchWriter:
+    """
+    질문 등록 요청을 모아서 한 번에 커밋하는 백그라운드 작성기
+
+    동작 흐름:
+    1. submit()이 (질문, Future)를 큐에 넣고 Future의 결과를 기다림
+    2. 워커 스레드가 첫 요청을 받은 뒤 max_delay 초 또는 max_batch_size 개까지 요청을 더 모음
+    3. 모은 요청을 하나의 세션/트랜잭션으로 INSERT 후 커밋
+    4. 각 Future에 생성된 Question 객체(또는 예외)를 전달
+    """
+
+    def __init__(self, session_factory, max_batch_size: int = 100, max_delay: float = 0.005,
+                 submit_timeout: float = DEFAULT_SUBMIT_TIMEOUT):
+        """
+        Args:
+            session_factory: 세션 생성 함수 (database.WriterSessionLocal)
+                요청 처리용 세션과 연결을 공유하지 않아야 합니다. 같은 연결을 쓰면
+                묶음의 commit()/rollback()이 다른 요청의 진행 중인 트랜잭션에도 적용됩니다.
+            max_batch_size: 한 트랜잭션에 담을 최대 질문 수
+            max_delay: 첫 요청 이후 추가 요청을 기다리는 최대 시간(초)
+            submit_timeout: submit()이 커밋을 기다리는 기본 최대 시간(초)
+        """
+        self.session_factory = session_factory
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.submit_timeout = submit_timeout
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        # 동작: 워커가 처리 중인 묶음 (비정상 종료 시 예외를 전달할 대상)
+        self._batch: List[Tuple[QuestionCreate, Future]] = []
+        # 동작: 워커가 비정상 종료된 원인 (None이면 정상)
+        self._failure: Optional[BaseException] = None
+
+    def start(self) -> None:
+        """워커 스레드를 시작합니다."""
+        if self._thread is not None:
+            return
+        self._failure = None
+        self._thread = threading.Thread(target=self._run, name='question-batch-writer', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """큐에 남은 요청을 모두 커밋한 뒤 워커 스레드를 종료합니다."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def submit(self, question: QuestionCreate, timeout: Optional[float] = None) -> Question:
+        """
+        질문 등록을 요청하고 커밋이 끝날 때까지 기다립니다.
+
+        Args:
+            question: 생성할 질문 정보
+            timeout: 최대 대기 시간(초), None이면 submit_timeout
+
+        Returns:
+            생성된 Question 객체
+
+        Raises:
+            RuntimeError: 작성기가 시작되지 않았거나 워커 스레드가 비정상 종료된 경우
+            concurrent.futures.TimeoutError: timeout 안에 커밋되지 않은 경우
+                (아직 묶음에 들어가지 않은 요청은 취소되어 저장되지 않음)
+            Exception: 해당 질문의 INSERT/커밋이 실패한 경우
+        """
+        if self._thread is None:
+            raise RuntimeError('QuestionBatchWriter가 시작되지 않았습니다.')
+        if self._failure is not None:
+            raise RuntimeError('QuestionBatchWriter 워커가 비정상 종료되었습니다.') from self._failure
+        future: Future = Future()
+        self._queue.put((question, future))
+        try:
+            return future.result(self.submit_timeout if timeout is None else timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def _run(self) -> None:
+        """워커 루프를 실행하고, 비정상 종료 시 대기 중인 모든 요청에 예외를 전달합니다."""
+        try:
+            self._loop()
+        except BaseException as e:
+            self._failure = e
+            self._fail_pending(e)
+            raise
+
+    def _fail_pending(self, cause: BaseException) -> None:
+        """처리 중인 묶음과 큐에 남은 요청의 Future에 예외를 설정합니다."""
+        pending = list(self._batch)
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                pending.append(item)
+        for _, future in pending:
+            if not future.done():
+                error = RuntimeError('QuestionBatchWriter 워커가 비정상 종료되었습니다.')
+                error.__cause__ = cause
+                future.set_exception(error)
+
+    def _loop(self) -> None:
+        """요청을 모아 flush하는 워커 루프"""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    # 동작: 대기 시간이 끝났더라도 이미 큐에 쌓인 요청은 함께 커밋합니다.
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            # 동작: 기다리다 시간 초과로 취소된 요청은 저장하지 않습니다.
+            batch = [(question, future) for question, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            self._batch = batch
+            self._flush(batch)
+            self._batch = []
+
+    def _flush(self, batch: List[Tuple[QuestionCreate, Future]]) -> None:
+        """
+        모은 요청을 하나의 트랜잭션으로 커밋합니다.
+
+        묶음 커밋이 실패하면 롤백 후 요청을 하나씩 다시 커밋하여
+        잘못된 요청 하나 때문에 같은 묶음의 다른 요청이 실패하지 않도록 합니다.
+        """
+        # expire_on_commit=False: 세션을 닫은 뒤에도 호출자가 객체 속성을 읽을 수 있도록 유지
+        db = self.session_factory(expire_on_commit=False)
+        try:
+            change_seqs = next_change_seqs(db, len(batch))
+            db_questions = [
+                Question(subject=question.subject, content=question.content, change_seq=change_seq)
+                for (question, _), change_seq in zip(batch, change_seqs)
+            ]
+            db.add_all(db_questions)
+            db.commit()  # 묶음 전체를 한 번의 트랜잭션으로 커밋 (fsync 1회)
+        except Exception:
+            db.rollback()
+            db.close()
+            self._flush_one_by_one(batch)
+            return
+        db.close()
+
+        for db_question, (_, future) in zip(db_questions, batch):
+            future.set_result(db_question)
+
+    def _flush_one_by_one(self, batch: List[Tuple[QuestionCreate, Future]]) -> None:
+        """요청을 하나씩 개별 트랜잭션으로 커밋합니다 (묶음 커밋 실패 시 사용)."""
+        for question, future in batch:
+            db = self.session_factory(expire_on_commit=False)
+            try:
+                db_question = Question(
+                    subject=question.subject,
+                    content=question.content,
+                    change_seq=next_change_seqs(db)[0]
+                )
+                db.add(db_question)
+                db.commit()
+                future.set_result(db_question)
+            except Exception as e:
+                db.rollback()
+                future.set_exception(e)
+            finally:
+                db.close()
@@ -3,14 +3,28 @@
 
 질문 목록 조회 및 등록 API 엔드포인트를 정의합니다.
 """
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-from database import get_db
-from schemas import ApiResponse, Question, QuestionCreate
-from domain.question.service import get_questions, create_question
+import os
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from database import WriterSessionLocal, get_db
+from schemas import ApiResponse, Question, QuestionChange, QuestionCreate
+from domain.question.service import get_questions, get_question_changes, create_question
+from domain.question.batch_writer import QuestionBatchWriter
 
 router = APIRouter(prefix='/api/question')
 
+# 그룹 커밋 모드 설정
+# - QUESTION_BATCH_WRITE=1: 질문 등록을 모아서 한 트랜잭션으로 커밋 (기본값: 사용 안 함)
+# - QUESTION_BATCH_SIZE: 한 번에 커밋할 최대 질문 수
+# - QUESTION_BATCH_DELAY_MS: 요청을 모으는 최대 대기 시간 (durability window)
+QUESTION_BATCH_WRITE = os.getenv('QUESTION_BATCH_WRITE', '0') == '1'
+# 작성기는 요청 처리용 연결과 트랜잭션이 섞이지 않도록 전용 연결(WriterSessionLocal)을 사용합니다.
+question_batch_writer = QuestionBatchWriter(
+    WriterSessionLocal,
+    max_batch_size=int(os.getenv('QUESTION_BATCH_SIZE', '100')),
+    max_delay=float(os.getenv('QUESTION_BATCH_DELAY_MS', '5')) / 1000
+)
+
 
 @router.get('/list', response_model=ApiResponse)
 def question_list(
@@ -50,17 +64,65 @@ def question_list(
         )
 
 
+@router.get('/changes', response_model=ApiResponse)
+def question_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db_context = Depends(get_db)
+) -> ApiResponse:
+    """
+    since 이후 변경된 질문(생성/수정/삭제)을 변경 순서대로 조회합니다.
+    
+    응답의 last_seq를 다음 요청의 since로 넘기면 이어서 받을 수 있고,
+    has_more가 False가 될 때까지 반복하면 변경분만으로 동기화됩니다.
+    
+    Args:
+        since: 이미 받은 마지막 변경 순번 (처음이면 0)
+        limit: 한 번에 받을 최대 변경 수
+        db_context: 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
+        
+    Returns:
+        변경 목록, 마지막 순번(last_seq), 추가 변경 존재 여부(has_more)를 포함한 응답
+    """
+    with db_context as db:
+        # 동작: limit + 1개를 조회하여 다음 페이지가 있는지 판단합니다.
+        questions = get_question_changes(db, since=since, limit=limit + 1)
+        has_more = len(questions) > limit
+        changes = [QuestionChange.model_validate(q) for q in questions[:limit]]
+
+        return ApiResponse(
+            status='success',
+            data={
+                'changes': changes,
+                'last_seq': changes[-1].change_seq if changes else since,
+                'has_more': has_more
+            }
+        )
+
+
 # [추가됨] 질문 등록 라우터
 @router.post('/create', status_code=status.HTTP_204_NO_CONTENT)
-def question_create(_question: QuestionCreate, db: Session = Depends(get_db)):
+def question_create(_question: QuestionCreate, db_context = Depends(get_db)):
     """
     질문을 등록합니다.
+    
+    그룹 커밋 모드가 켜져 있으면 다른 요청과 함께 한 트랜잭션으로 커밋되며,
+    커밋이 끝난 뒤에 응답합니다.
 
     Args:
         _question: 등록할 질문의 제목과 내용 (QuestionCreate 스키마)
-        db: 데이터베이스 세션 (의존성 주입)
+        db_context: 데이터베이스 세션 컨텍스트 매니저 (의존성 주입)
     
     Returns:
         None (204 No Content)
     """
-    create_question(db, _question)
\ No newline at end of file
+    if QUESTION_BATCH_WRITE:
+        try:
+            question_batch_writer.submit(_question)
+        except FutureTimeoutError:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                                detail='질문 저장이 지연되고 있습니다. 잠시 후 다시 시도하세요.')
+        return
+
+    with db_context as db:
+        create_question(db, _question)
@@ -3,11 +3,41 @@
 
 데이터베이스와의 CRUD 작업을 담당하는 서비스 레이어입니다.
 """
+from datetime import datetime
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from models import Question
+from models import ChangeSequence, Question
 from schemas import QuestionCreate, QuestionUpdate
 
+# change_sequence 테이블에서 질문 변경 순번으로 사용하는 카운터 이름
+QUESTION_SEQUENCE = 'question'
+
+
+def next_change_seqs(db: Session, count: int = 1) -> List[int]:
+    """
+    질문 변경 순번을 count개 발급합니다.
+    
+    UPDATE로 카운터를 먼저 증가시키므로 SQLite 쓰기 잠금을 잡은 상태에서
+    순번이 정해지고, 커밋 순서와 순번 순서가 일치합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        count: 발급할 순번 개수
+        
+    Returns:
+        오름차순으로 정렬된 순번 리스트
+    """
+    db.execute(
+        update(ChangeSequence)
+        .where(ChangeSequence.name == QUESTION_SEQUENCE)
+        .values(value=ChangeSequence.value + count)
+    )
+    last = db.execute(
+        select(ChangeSequence.value).where(ChangeSequence.name == QUESTION_SEQUENCE)
+    ).scalar_one()
+    return list(range(last - count + 1, last + 1))
+
 
 def create_question(db: Session, question: QuestionCreate) -> Question:
     """
@@ -26,7 +56,8 @@ def create_question(db: Session, question: QuestionCreate) -> Question:
     try:
         db_question = Question(
             subject=question.subject,
-            content=question.content
+            content=question.content,
+            change_seq=next_change_seqs(db)[0]
         )
         db.add(db_question)
         db.commit()  # 트랜잭션 커밋 (Durability 보장)
@@ -40,7 +71,7 @@ def create_question(db: Session, question: QuestionCreate) -> Question:
 
 def get_question(db: Session, question_id: int) -> Optional[Question]:
     """
-    ID로 질문을 조회합니다.
+    ID로 질문을 조회합니다. 삭제된 질문은 조회되지 않습니다.
     
     Args:
         db: 데이터베이스 세션
@@ -49,12 +80,15 @@ def get_question(db: Session, question_id: int) -> Optional[Question]:
     Returns:
         Question 객체 또는 None
     """
-    return db.query(Question).filter(Question.id == question_id).first()
+    return db.query(Question).filter(
+        Question.id == question_id,
+        Question.deleted_at.is_(None)
+    ).first()
 
 
 def get_questions(db: Session, skip: int = 0, limit: int = 100) -> List[Question]:
     """
-    질문 목록을 조회합니다.
+    질문 목록을 조회합니다. 삭제된 질문은 제외됩니다.
     
     Args:
         db: 데이터베이스 세션
@@ -64,7 +98,37 @@ def get_questions(db: Session, skip: int = 0, limit: int = 100) -> List[Question
     Returns:
         Question 객체 리스트
     """
-    return db.query(Question).offset(skip).limit(limit).all()
+    return (
+        db.query(Question)
+        .filter(Question.deleted_at.is_(None))
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+
+
+def get_question_changes(db: Session, since: int = 0, limit: int = 100) -> List[Question]:
+    """
+    change_seq가 since보다 큰 질문을 변경 순서대로 조회합니다.
+    
+    삭제된 질문(tombstone)도 포함되며, 질문마다 마지막 변경 상태 하나만 반환됩니다.
+    change_seq 인덱스를 사용하므로 전체 테이블이 아닌 변경 건수만큼만 읽습니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        since: 이미 받은 마지막 변경 순번 (처음이면 0)
+        limit: 최대 조회할 변경 수
+        
+    Returns:
+        change_seq 오름차순 Question 객체 리스트
+    """
+    return (
+        db.query(Question)
+        .filter(Question.change_seq > since)
+        .order_by(Question.change_seq)
+        .limit(limit)
+        .all()
+    )
 
 
 def update_question(
@@ -95,6 +159,7 @@ def update_question(
             db_question.subject = question_update.subject
         if question_update.content is not None:
             db_question.content = question_update.content
+        db_question.change_seq = next_change_seqs(db)[0]
         
         db.commit()  # 트랜잭션 커밋 (Durability 보장)
         db.refresh(db_question)  # DB에서 최신 데이터 조회
@@ -109,6 +174,9 @@ def delete_question(db: Session, question_id: int) -> bool:
     """
     질문을 삭제합니다.
     
+    행을 지우지 않고 deleted_at과 새 change_seq를 기록하여
+    변경 피드 구독자가 삭제 사실을 알 수 있도록 합니다 (tombstone).
+    
     Args:
         db: 데이터베이스 세션
         question_id: 삭제할 질문의 ID
@@ -124,7 +192,8 @@ def delete_question(db: Session, question_id: int) -> bool:
         if db_question is None:
             return False
         
-        db.delete(db_question)
+        db_question.deleted_at = datetime.now()
+        db_question.change_seq = next_change_seqs(db)[0]
         db.commit()  # 트랜잭션 커밋 (Durability 보장)
         return True
     except Exception:
@@ -4,7 +4,9 @@
 이 파일은 FastAPI 애플리케이션의 메인 실행 파일입니다.
 프로젝트 실행 시 FastAPI 서버를 시작하고 API 라우터를 등록합니다.
 
-실행 방법: python main.py
+실행 방법: alembic upgrade head 실행 후 PYTHONPATH=.. python main.py
+  (저장소 루트의 common 패키지를 사용하므로 PYTHONPATH에 저장소 루트를 지정합니다.
+   Windows: set PYTHONPATH=.. 후 python main.py)
 
 API 문서 (자동 생성):
   - Swagger UI: http://localhost:8000/docs
@@ -13,10 +15,15 @@ API 문서 (자동 생성):
 """
 from fastapi import FastAPI
 import uvicorn
-from database import engine
-from models import Base
+from database import check_schema_revision
+from common.rate_limit import AdmissionController, AdmissionControlMiddleware, RateLimit
+from common.metrics import REGISTRY, MetricsMiddleware, render_metrics_response
 from api import router
-from domain.question.question_router import router as question_router
+from domain.question.question_router import (
+    router as question_router,
+    question_batch_writer,
+    QUESTION_BATCH_WRITE
+)
 
 # 동작: FastAPI 애플리케이션 인스턴스를 생성합니다.
 # FastAPI는 자동으로 Swagger UI와 ReDoc을 제공합니다:
@@ -30,6 +37,36 @@ app = FastAPI(
     version='1.0.0'
 )
 
+# 동작: 과부하 방지 미들웨어를 등록합니다.
+# - 클라이언트 IP + 라우트 분류(list/write/default)별 토큰 버킷으로 초과 요청은 429 응답
+# - 동시 처리 요청 수를 제한하고, 대기열이 가득 차거나 대기 시간이 지나면 503 응답
+# 목록 조회는 SQLite 연결과 스레드풀을 가장 오래 점유하므로 가장 낮은 한도를 둡니다.
+admission_controller = AdmissionController(
+    route_rules=[
+        ('GET', '/questions|/api/question/(list|changes)', 'list'),
+        ('POST|PUT|DELETE', '/.*', 'write'),
+    ],
+    limits={
+        'list': RateLimit(rate=5, burst=10),
+        'write': RateLimit(rate=20, burst=40),
+        'default': RateLimit(rate=50, burst=100),
+    },
+    max_concurrent=32,
+    max_queue=64,
+    queue_timeout=1.0
+)
+app.add_middleware(AdmissionControlMiddleware, controller=admission_controller)
+
+# 동작: 요청 지연 시간/응답 크기/처리 중 요청 수를 기록하는 미들웨어를 등록합니다.
+# 나중에 등록한 미들웨어가 바깥쪽에서 실행되므로 429/503으로 거절된 요청도 기록됩니다.
+app.add_middleware(MetricsMiddleware)
+REGISTRY.add_collector(lambda: [
+    (f'admission_{name}', 'gauge', f'승인 제어 {name}', value)
+    if name in ('in_flight', 'queued') else
+    (f'admission_{name}_total', 'counter', f'승인 제어 {name}', value)
+    for name, value in admission_controller.stats().items()
+])
+
 # 동작: API 라우터를 애플리케이션에 등록합니다.
 # 이렇게 하면 /questions로 시작하는 모든 엔드포인트가 활성화됩니다.
 app.include_router(router)
@@ -38,20 +75,46 @@ app.include_router(router)
 app.include_router(question_router)
 
 
+@app.get('/metrics', include_in_schema=False)
+def metrics():
+    """Prometheus 텍스트 포맷으로 메트릭을 반환합니다."""
+    return render_metrics_response()
+
+
+@app.get('/admission/stats')
+def admission_stats() -> dict:
+    """속도 제한/승인 제어 카운터를 반환합니다."""
+    return admission_controller.stats()
+
+
 @app.on_event('startup')
 async def startup_event():
     """
     애플리케이션 시작 시 실행되는 이벤트 핸들러
     
     동작 흐름:
-    1. 데이터베이스 테이블이 존재하는지 확인
-    2. 없으면 생성 (Alembic 마이그레이션이 이미 실행되었다면 스킵됨)
+    1. DB의 Alembic 리비전이 head인지 확인
+    2. 다르면 예외를 발생시켜 서버 기동을 중단 (fail fast)
+    
+    테이블 생성/변경은 Alembic 마이그레이션(alembic upgrade head)으로만 수행합니다.
+    """
+    revision = check_schema_revision()
+    print(f'데이터베이스 스키마 확인 완료 (revision: {revision})')
+
+    # 동작: 그룹 커밋 모드가 켜져 있으면 질문 일괄 커밋 워커를 시작합니다.
+    if QUESTION_BATCH_WRITE:
+        question_batch_writer.start()
+        print('질문 그룹 커밋 모드가 활성화되었습니다.')
+
+
+@app.on_event('shutdown')
+async def shutdown_event():
+    """
+    애플리케이션 종료 시 실행되는 이벤트 핸들러
+    
+    큐에 남아 있는 질문 등록 요청을 모두 커밋한 뒤 워커를 종료합니다.
     """
-    # 동작: models.py에 정의된 모든 모델의 테이블을 데이터베이스에 생성합니다.
-    # 이미 테이블이 존재하는 경우 아무 작업도 수행하지 않습니다.
-    # 주의: Alembic을 사용하는 경우 마이그레이션으로 테이블을 관리하는 것이 권장됩니다.
-    Base.metadata.create_all(bind=engine)
-    print('데이터베이스 테이블이 준비되었습니다.')
+    question_batch_writer.stop()
 
 
 if __name__ == '__main__':
@@ -60,8 +123,7 @@ if __name__ == '__main__':
     
     1. 모듈 import 단계
        - FastAPI, uvicorn import
-       - database.py에서 engine import
-       - models.py에서 Base import
+       - database.py에서 check_schema_revision import
        - domain.question.question_router에서 router import
     
     2. FastAPI 앱 생성 및 라우터 등록
@@ -3,7 +3,7 @@ Pydantic 스키마 모델 정의
 
 API 요청/응답에 사용되는 데이터 모델을 정의합니다.
 """
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, computed_field, field_validator
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
@@ -64,4 +64,28 @@ class Question(BaseModel):
 
     class Config:
         # ORM 객체(SQLAlchemy 등)를 Pydantic 모델로 변환 허용
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class QuestionChange(BaseModel):
+    """
+    질문 변경 피드 항목 스키마
+    
+    질문의 마지막 변경 상태를 나타냅니다.
+    deleted_at이 있으면 삭제된 질문(tombstone)이며 op는 'delete'입니다.
+    """
+    id: int
+    subject: str
+    content: str
+    create_date: datetime
+    change_seq: int
+    deleted_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+    @computed_field
+    @property
+    def op(self) -> str:
+        """변경 종류 ('upsert' 또는 'delete')"""
+        return 'delete' if self.deleted_at is not None else 'upsert'
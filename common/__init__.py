@@ -0,0 +1,10 @@
+"""
+여러 미션 앱이 함께 쓰는 모듈 패키지
+
+- common.metrics: 프로세스 내부 메트릭과 /metrics 출력 (4-1, 4-6)
+- common.rate_limit: 속도 제한/승인 제어 미들웨어 (4-1, 4-6)
+- common.board_models, common/board_migrations: 게시판 모델과 Alembic 마이그레이션 (4-5, 4-6)
+
+저장소 루트가 import 경로에 있어야 합니다. 각 미션 디렉토리에서 실행할 때는
+PYTHONPATH에 저장소 루트를 지정합니다 (예: PYTHONPATH=.. python main.py).
+"""
@@ -3,35 +3,21 @@ from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 from alembic import context
 
-# --- [수정 시작] ---
-import os
-import sys
-
-# 현재 디렉토리 경로 추가
-sys.path.append(os.getcwd())
-
-# models에서 Base 가져오기
-from models import Base
-# --- [수정 끝] ---
+# 4-5, 4-6 mission의 앱과 Alembic이 모두 이 메타데이터 하나를 사용합니다.
+# (저장소 루트는 각 미션의 alembic.ini prepend_sys_path로 import 경로에 추가됨)
+from common.board_models import Base
 
 config = context.config
-fileConfig(config.config_file_name)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# add your model's MetaData object here
-# for 'autogenerate' support
-# from myapp import mymodel
-# target_metadata = mymodel.Base.metadata
-target_metadata = Base.metadata
+# 데이터베이스 URL은 실행한 미션의 alembic.ini(sqlalchemy.url)를 사용합니다.
+# (4-5는 myapi.db, 4-6은 board.db - 각 미션의 database.py와 같은 값)
 
-# other values from the config, defined by the needs of env.py,
-# can be acquired:
-# my_important_option = config.get_main_option("my_important_option")
-# ... etc.
+target_metadata = Base.metadata
 
 
 def run_migrations_offline() -> None:
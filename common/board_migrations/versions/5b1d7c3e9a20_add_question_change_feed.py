@@ -0,0 +1,53 @@
+"""add_question_change_feed
+
+Revision ID: 5b1d7c3e9a20
+Revises: 942af67e0817
+Create Date: 2026-10-19 15:40:12.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1d7c3e9a20'
+down_revision: Union[str, Sequence[str], None] = '942af67e0817'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('change_sequence',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('value', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    with op.batch_alter_table('question') as batch_op:
+        batch_op.add_column(sa.Column('change_seq', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('deleted_at', sa.DateTime(), nullable=True))
+
+    # 기존 질문은 id 순서대로 변경 순번을 부여하고, 카운터를 그 최댓값으로 맞춥니다.
+    op.execute('UPDATE question SET change_seq = id')
+    op.execute(
+        "INSERT INTO change_sequence (name, value) "
+        "SELECT 'question', COALESCE(MAX(change_seq), 0) FROM question"
+    )
+
+    with op.batch_alter_table('question') as batch_op:
+        batch_op.alter_column('change_seq', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_index(batch_op.f('ix_question_change_seq'), ['change_seq'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 삭제 표시된 질문(tombstone)은 이전 스키마에서 표현할 수 없으므로 실제로 삭제합니다.
+    op.execute('DELETE FROM answer WHERE question_id IN (SELECT id FROM question WHERE deleted_at IS NOT NULL)')
+    op.execute('DELETE FROM question WHERE deleted_at IS NOT NULL')
+    with op.batch_alter_table('question') as batch_op:
+        batch_op.drop_index(batch_op.f('ix_question_change_seq'))
+        batch_op.drop_column('deleted_at')
+        batch_op.drop_column('change_seq')
+    op.drop_table('change_sequence')
@@ -0,0 +1,92 @@
+"""
+ORM 모델 정의 모듈 (4-5, 4-6 mission 공용)
+
+이 모듈은 SQLAlchemy의 선언적 베이스를 사용하여 데이터베이스 테이블을 Python 클래스로 정의합니다.
+프로젝트의 모델 계층 초기화 단계에서 실행됩니다.
+"""
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy.orm import relationship
+from sqlalchemy.ext.declarative import declarative_base
+from datetime import datetime
+
+# 동작: SQLAlchemy의 선언적 베이스를 생성합니다.
+# 이 Base는 모든 모델 클래스가 상속받을 기본 클래스입니다.
+# Base.metadata는 모든 모델의 스키마 정보를 담고 있습니다.
+# 4-5, 4-6 mission의 앱(models.py로 다시 내보냄)과 Alembic(common/board_migrations/env.py)이
+# 모두 이 Base.metadata 하나만 사용합니다.
+Base = declarative_base()
+
+class Question(Base):
+    """
+    질문(Question) 모델 클래스
+    
+    동작 흐름:
+    1. Base를 상속받아 ORM 모델로 정의
+    2. __tablename__으로 데이터베이스 테이블 이름 지정
+    3. 각 컬럼을 Column으로 정의하여 스키마 정보 제공
+    4. Alembic이 이 모델을 읽어서 마이그레이션 스크립트 자동 생성
+    
+    테이블 구조:
+    - id: 질문의 고유 번호 (Primary Key, 자동 증가)
+    - subject: 질문 제목 (필수 입력)
+    - content: 질문 내용 (필수 입력)
+    - create_date: 질문 작성일시 (자동으로 현재 시간 설정)
+    - change_seq: 마지막 변경(생성/수정/삭제)의 변경 순번 (단조 증가, 변경 피드용)
+    - deleted_at: 삭제 일시 (값이 있으면 삭제된 질문 = tombstone)
+    """
+    __tablename__ = 'question'
+    
+    # 동작: Primary Key로 설정되어 자동으로 고유 번호가 할당됩니다.
+    id = Column(Integer, primary_key=True)
+    
+    # 동작: nullable=False로 설정되어 반드시 값이 입력되어야 합니다.
+    subject = Column(String, nullable=False)
+    
+    # 동작: nullable=False로 설정되어 반드시 값이 입력되어야 합니다.
+    # 마이그레이션(942af67e0817)과 동일하게 Text 타입을 사용합니다.
+    content = Column(Text, nullable=False)
+    
+    # 동작: default=datetime.now로 설정되어 레코드 생성 시 자동으로 현재 시간이 저장됩니다.
+    create_date = Column(DateTime, nullable=False, default=datetime.now)
+    
+    # 동작: 질문이 변경될 때마다 ChangeSequence에서 새 순번을 받아 저장합니다.
+    # unique 인덱스 덕분에 change_seq > since 조회가 변경 건수만큼만 읽습니다.
+    change_seq = Column(Integer, nullable=False, unique=True, index=True)
+    
+    # 동작: 삭제 시 행을 지우지 않고 삭제 일시만 기록합니다 (soft delete).
+    deleted_at = Column(DateTime, nullable=True)
+
+
+class ChangeSequence(Base):
+    """
+    변경 순번 카운터 모델 클래스
+    
+    question.change_seq에 부여할 단조 증가 값을 관리하는 단일 행 테이블입니다.
+    UPDATE ... SET value = value + 1 로 증가시키므로 쓰기 잠금 안에서 순번이 발급됩니다.
+    """
+    __tablename__ = 'change_sequence'
+    
+    name = Column(String, primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+
+class Answer(Base):
+    """
+    답변(Answer) 모델 클래스
+    
+    테이블 구조:
+    - id: 답변의 고유 번호 (Primary Key, 자동 증가)
+    - content: 답변 내용 (필수 입력)
+    - create_date: 답변 작성일시 (자동으로 현재 시간 설정)
+    - question_id: 답변이 달린 질문의 ID (Foreign Key)
+    """
+    __tablename__ = 'answer'
+    
+    id = Column(Integer, primary_key=True)
+    content = Column(Text, nullable=False)
+    create_date = Column(DateTime, nullable=False, default=datetime.now)
+    question_id = Column(Integer, ForeignKey('question.id'))
+    
+    # 동작: question.answers로 질문에 달린 답변 목록에 접근할 수 있습니다.
+    question = relationship('Question', backref='answers')
+
@@ -0,0 +1,263 @@
+"""
+프로세스 내부 메트릭 수집 및 Prometheus 텍스트 포맷 출력 모듈
+
+외부 라이브러리 없이 Counter / Gauge / Histogram을 제공하고
+/metrics 엔드포인트에서 Prometheus가 읽을 수 있는 텍스트로 출력합니다.
+
+요청 경로에서는 dict 조회, bisect, 덧셈만 수행하고
+누적 버킷 계산과 문자열 생성은 /metrics 조회 시에만 수행하여 계측 오버헤드를 줄입니다.
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+# 응답 시간(초)용 기본 버킷
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# 응답 크기(바이트)용 기본 버킷
+SIZE_BUCKETS = (100, 1000, 10000, 100000, 1000000, 10000000)
+
+# 마지막(+Inf) 버킷 레이블
+INF_LABEL = 'le="+Inf"'
+
+
+def _format_labels(labelnames: Sequence[str], labels: Tuple, extra: str = '') -> str:
+    """레이블을 {a="1",b="2"} 형태의 문자열로 변환합니다."""
+    parts = [
+        '{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+        for name, value in zip(labelnames, labels)
+    ]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def _format_value(value: float) -> str:
+    """정수 값은 소수점 없이 출력합니다."""
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Tuple = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            yield f'{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}'
+
+
+class Gauge(Counter):
+    """증가/감소가 가능한 게이지"""
+
+    kind = 'gauge'
+
+    def dec(self, labels: Tuple = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+    def set(self, value: float, labels: Tuple = ()) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram:
+    """
+    고정 버킷 히스토그램
+
+    관측 시에는 해당 버킷 하나만 증가시키고(비누적),
+    출력 시에 누적 합으로 변환하여 Prometheus 형식(le 버킷)으로 내보냅니다.
+    """
+
+    kind = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [버킷별 개수 (+Inf 포함), 합계]
+        self._series: Dict[Tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: Tuple = ()) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = [[0] * (len(self.buckets) + 1), 0.0]
+                self._series[labels] = series
+            series[0][index] += 1
+            series[1] += value
+
+    def time(self, labels: Tuple = ()) -> '_Timer':
+        """with 블록의 실행 시간을 관측하는 컨텍스트 매니저를 반환합니다."""
+        return _Timer(self, labels)
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = [(labels, list(counts), total) for labels, (counts, total) in self._series.items()]
+        for labels, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = 'le="{}"'.format(_format_value(bound))
+                yield f'{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}'
+            cumulative += counts[-1]
+            yield f'{self.name}_bucket{_format_labels(self.labelnames, labels, INF_LABEL)} {cumulative}'
+            yield f'{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}'
+            yield f'{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}'
+
+
+class _Timer:
+    """Histogram.time()이 반환하는 컨텍스트 매니저"""
+
+    __slots__ = ('histogram', 'labels', 'start')
+
+    def __init__(self, histogram: Histogram, labels: Tuple):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.start, self.labels)
+        return False
+
+
+class MetricsRegistry:
+    """
+    메트릭 모음
+
+    register()로 등록한 메트릭과 add_collector()로 등록한 콜백
+    (출력 시점에 다른 모듈의 값을 읽어옴)을 함께 출력합니다.
+    """
+
+    def __init__(self):
+        self._metrics: List = []
+        self._collectors: List[Callable[[], Iterable[Tuple[str, str, str, float]]]] = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], Iterable[Tuple[str, str, str, float]]]) -> None:
+        """
+        출력 시점에 호출되어 (이름, 종류('counter'/'gauge'), 설명, 값) 목록을 반환하는 콜백을 등록합니다.
+        다른 모듈이 이미 관리하고 있는 값을 복사 없이 내보낼 때 사용합니다.
+        """
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 포맷(0.0.4) 문자열을 생성합니다."""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            lines.extend(metric.samples())
+        for collector in self._collectors:
+            for name, kind, documentation, value in collector():
+                lines.append(f'# HELP {name} {documentation}')
+                lines.append(f'# TYPE {name} {kind}')
+                lines.append(f'{name} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+# 앱 전체에서 공유하는 기본 레지스트리
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    'http_request_duration_seconds', '라우트 템플릿별 요청 처리 시간', ('method', 'route', 'status')
+)
+HTTP_RESPONSE_SIZE = REGISTRY.histogram(
+    'http_response_size_bytes', '라우트 템플릿별 응답 본문 크기', ('method', 'route'), SIZE_BUCKETS
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    'http_requests_in_flight', '현재 처리 중인 요청 수'
+)
+
+
+class MetricsMiddleware:
+    """
+    요청 처리 시간, 응답 크기, 처리 중 요청 수를 기록하는 ASGI 미들웨어
+
+    경로는 실제 URL(/todo/3)이 아니라 라우트 템플릿(/todo/{todo_id})으로 기록하여
+    레이블 종류가 무한히 늘어나지 않도록 합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message):
+            nonlocal status_code, response_size
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            elif message['type'] == 'http.response.body':
+                response_size += len(message.get('body', b''))
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            # 동작: 라우팅 후 FastAPI가 scope['route']에 매칭된 라우트를 저장합니다.
+            route = scope.get('route')
+            route_path = getattr(route, 'path', None) or 'unmatched'
+            method = scope['method']
+            HTTP_REQUEST_DURATION.observe(elapsed, (method, route_path, status_code))
+            HTTP_RESPONSE_SIZE.observe(response_size, (method, route_path))
+
+
+def render_metrics_response():
+    """/metrics 엔드포인트용 응답을 생성합니다."""
+    from fastapi.responses import PlainTextResponse
+    return PlainTextResponse(REGISTRY.render(), media_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,253 @@
+"""
+요청 속도 제한 및 승인 제어(admission control) 미들웨어
+
+과부하 상황에서도 응답 지연이 무한정 늘어나지 않도록 요청을 앞단에서 걸러냅니다.
+
+1. 토큰 버킷(token bucket): 클라이언트 IP + 라우트 분류(list/write/default)별 초당 요청 수 제한
+   - 초과 시 429 Too Many Requests + Retry-After
+2. 동시 실행 제한: 동시에 처리하는 요청 수를 max_concurrent로 제한하고
+   초과 요청은 길이가 max_queue인 대기열에서 최대 queue_timeout 초까지 대기
+   - 대기열이 가득 찼거나 대기 시간이 지나면 503 Service Unavailable + Retry-After
+
+사용 예:
+    controller = AdmissionController(route_rules=[...], limits={...})
+    app.add_middleware(AdmissionControlMiddleware, controller=controller)
+"""
+import asyncio
+import json
+import math
+import re
+import time
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional, Tuple
+
+
+class RateLimit:
+    """라우트 분류 하나에 대한 토큰 버킷 설정 (rate: 초당 충전 토큰 수, burst: 버킷 크기)"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+
+
+class TokenBucket:
+    """
+    토큰 버킷
+
+    요청이 들어올 때마다 지난 시간만큼 토큰을 충전(lazy refill)하므로
+    별도의 타이머 없이 O(1)로 동작합니다.
+    """
+
+    __slots__ = ('rate', 'capacity', 'tokens', 'updated')
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def try_acquire(self, now: float) -> Tuple[bool, float]:
+        """
+        토큰 하나를 꺼냅니다.
+
+        Returns:
+            (성공 여부, 실패 시 다음 토큰까지 남은 시간(초))
+        """
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True, 0.0
+        return False, (1 - self.tokens) / self.rate
+
+
+class AdmissionController:
+    """
+    토큰 버킷 속도 제한과 동시 실행 제한을 함께 관리하는 객체
+
+    counters에는 다음 값이 누적됩니다.
+    - allowed: 처리된 요청 수
+    - rate_limited: 429로 거절된 요청 수
+    - shed_queue_full: 대기열이 가득 차 503으로 거절된 요청 수
+    - shed_timeout: 대기 시간 초과로 503으로 거절된 요청 수
+    - in_flight / queued: 현재 처리 중 / 대기 중인 요청 수
+    """
+
+    def __init__(
+        self,
+        route_rules: List[Tuple[str, str, str]],
+        limits: Dict[str, RateLimit],
+        max_concurrent: int = 32,
+        max_queue: int = 64,
+        queue_timeout: float = 1.0,
+        max_clients: int = 10000
+    ):
+        """
+        Args:
+            route_rules: (HTTP 메서드 정규식, 경로 정규식, 분류 이름) 목록, 위에서부터 처음 일치하는 규칙 사용
+            limits: 분류 이름별 RateLimit ('default'는 일치하는 규칙이 없을 때 사용)
+            max_concurrent: 동시에 처리할 최대 요청 수
+            max_queue: 동시 실행 한도를 넘었을 때 대기할 수 있는 최대 요청 수
+            queue_timeout: 대기열에서 기다리는 최대 시간(초)
+            max_clients: 메모리에 유지할 최대 토큰 버킷 수 (오래 사용되지 않은 버킷부터 제거)
+        """
+        self.route_rules = [
+            (re.compile(method), re.compile(path), route_class)
+            for method, path, route_class in route_rules
+        ]
+        self.limits = limits
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.max_clients = max_clients
+
+        self._buckets: 'OrderedDict[Tuple[str, str], TokenBucket]' = OrderedDict()
+        self._in_flight = 0
+        self._waiters: deque = deque()
+        self.counters = {
+            'allowed': 0,
+            'rate_limited': 0,
+            'shed_queue_full': 0,
+            'shed_timeout': 0,
+        }
+
+    def stats(self) -> Dict[str, int]:
+        """현재 카운터 값을 반환합니다."""
+        return {
+            **self.counters,
+            'in_flight': self._in_flight,
+            'queued': len(self._waiters),
+        }
+
+    def classify(self, method: str, path: str) -> str:
+        """요청을 라우트 분류 이름으로 변환합니다."""
+        for method_pattern, path_pattern, route_class in self.route_rules:
+            if method_pattern.fullmatch(method) and path_pattern.fullmatch(path):
+                return route_class
+        return 'default'
+
+    def check_rate(self, client: str, method: str, path: str) -> Tuple[bool, float]:
+        """
+        클라이언트 + 라우트 분류의 토큰 버킷에서 토큰을 꺼냅니다.
+
+        Returns:
+            (허용 여부, 거절 시 재시도까지 기다릴 시간(초))
+        """
+        route_class = self.classify(method, path)
+        limit = self.limits.get(route_class) or self.limits.get('default')
+        if limit is None:
+            return True, 0.0
+
+        key = (client, route_class)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(limit.rate, limit.burst)
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+
+        allowed, retry_after = bucket.try_acquire(time.monotonic())
+        if not allowed:
+            self.counters['rate_limited'] += 1
+        return allowed, retry_after
+
+    async def acquire(self) -> Optional[str]:
+        """
+        동시 실행 슬롯을 얻습니다.
+
+        Returns:
+            None이면 성공, 실패 시 거절 사유 ('shed_queue_full' 또는 'shed_timeout')
+        """
+        if self._in_flight < self.max_concurrent and not self._waiters:
+            self._in_flight += 1
+            return None
+
+        if len(self._waiters) >= self.max_queue:
+            self.counters['shed_queue_full'] += 1
+            return 'shed_queue_full'
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            # 동작: release()가 슬롯을 넘겨주면 waiter가 완료됩니다 (in_flight는 그대로 유지).
+            await asyncio.wait_for(waiter, self.queue_timeout)
+            return None
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # 시간 초과 직전에 슬롯을 넘겨받은 경우: 다음 대기자에게 다시 넘겨줍니다.
+                self.release()
+            self.counters['shed_timeout'] += 1
+            return 'shed_timeout'
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 넘겨받은 뒤 취소된 경우: 반납하지 않으면 in_flight가 영구히 줄지 않습니다.
+                self.release()
+            raise
+        finally:
+            if not waiter.done() or waiter.cancelled():
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+
+    def release(self) -> None:
+        """동시 실행 슬롯을 반납하고, 대기 중인 요청이 있으면 슬롯을 넘겨줍니다."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(True)
+                return
+        self._in_flight -= 1
+
+
+class AdmissionControlMiddleware:
+    """
+    AdmissionController를 FastAPI/Starlette 앱 앞단에 적용하는 ASGI 미들웨어
+    """
+
+    def __init__(self, app, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        controller = self.controller
+        client = scope['client'][0] if scope.get('client') else 'unknown'
+
+        allowed, retry_after = controller.check_rate(client, scope['method'], scope['path'])
+        if not allowed:
+            await _send_error(send, 429, '요청이 너무 많습니다. 잠시 후 다시 시도하세요.', retry_after)
+            return
+
+        reason = await controller.acquire()
+        if reason is not None:
+            await _send_error(send, 503, '서버가 혼잡합니다. 잠시 후 다시 시도하세요.', controller.queue_timeout)
+            return
+
+        controller.counters['allowed'] += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.release()
+
+
+async def _send_error(send, status_code: int, detail: str, retry_after: float) -> None:
+    """거절 응답(JSON + Retry-After 헤더)을 전송합니다."""
+    body = json.dumps({'detail': detail}, ensure_ascii=False).encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': status_code,
+        'headers': [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(body)).encode('ascii')),
+            (b'retry-after', str(max(1, math.ceil(retry_after))).encode('ascii')),
+        ],
+    })
+    await send({'type': 'http.response.body', 'body': body})